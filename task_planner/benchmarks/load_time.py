@@ -0,0 +1,33 @@
+"""Порівнює час відновлення завдань зі збережених словників.
+
+Запуск: python -m task_planner.benchmarks.load_time [кількість]
+"""
+import sys
+import timeit
+from datetime import date, timedelta
+from task_planner.bll.models.task import Task
+from task_planner.bll.models.lazy_record import LazyTask
+
+
+def make_records(count: int) -> list:
+    deadline = date.today() + timedelta(days=30)
+    return [Task(title=f'Task {i}', description='Опис', deadline=deadline,
+                 assignee_id=f'member-{i % 100}').to_dict() for i in range(count)]
+
+
+def main(count: int = 100_000, repeat: int = 5) -> None:
+    records = make_records(count)
+    loaders = {
+        'Task.from_dict (з валідацією)': Task.from_dict,
+        'Task._from_storage': Task._from_storage,
+        'LazyTask._from_storage': LazyTask._from_storage,
+    }
+    baseline = None
+    for name, loader in loaders.items():
+        seconds = min(timeit.repeat(lambda: [loader(record) for record in records], number=1, repeat=repeat))
+        baseline = baseline or seconds
+        print(f"{name}: {seconds * 1000:.1f} мс на {count} записів ({baseline / seconds:.1f}x)")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,58 @@
+"""Вимірює пам'ять, яку займає один екземпляр моделі.
+
+Запуск: python -m task_planner.benchmarks.model_memory [кількість]
+"""
+import sys
+import tracemalloc
+import uuid
+from datetime import date, timedelta
+from task_planner.bll.models.task import Task
+from task_planner.bll.models.team_member import TeamMember
+from task_planner.bll.models.lazy_record import LazyTask
+
+ROLES = ['Розробник', 'Тестувальник', 'Аналітик', 'Менеджер']
+
+
+def _raw_task(i: int, assignee_ids: list) -> dict:
+    return {
+        'id': str(uuid.uuid4()),
+        'created_date': '2024-01-01T10:00:00.000001',
+        'updated_date': '2024-01-01T10:00:00.000001',
+        'title': f'Task {i}',
+        'description': '',
+        'deadline': (date.today() + timedelta(days=30)).isoformat(),
+        'assignee_id': assignee_ids[i % len(assignee_ids)],
+        'is_completed': False,
+    }
+
+
+def measure(factory, count: int) -> float:
+    """Повертає середню кількість байтів на один створений factory() об'єкт"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [factory(i) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del objects
+    return size / count
+
+
+def main(count: int = 100_000) -> None:
+    deadline = date.today() + timedelta(days=30)
+    # Ідентифікатори виконавців приходять з різних рядків JSON, тому не збігаються як об'єкти
+    assignee_ids = [str(uuid.uuid4()) for _ in range(100)]
+    raw_tasks = [_raw_task(i, [''.join(list(a)) for a in assignee_ids]) for i in range(count)]
+
+    results = {
+        'Task': measure(lambda i: Task(title=f'Task {i}', description='', deadline=deadline,
+                                       assignee_id=''.join(list(assignee_ids[i % 100]))), count),
+        'LazyTask (без сирого запису)': measure(lambda i: LazyTask._from_storage(raw_tasks[i]), count),
+        'TeamMember': measure(lambda i: TeamMember(name=f'Member {i}', role=''.join(list(ROLES[i % 4]))), count),
+    }
+    for name, size in results.items():
+        print(f"{name}: {size:.0f} байт на екземпляр")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -1,5 +1,6 @@
 from task_planner.bll.models import Task, TeamMember
 from task_planner.bll.services import ProjectManager, TaskService, MemberService
+from .clock import Clock, FixedClock
 from .exceptions import (
     TaskError, MemberError, ValidationError,
     TaskValidationError, MemberValidationError,
@@ -8,7 +9,7 @@ from .exceptions import (
 )
 
 __all__ = [
-    'Task', 'TeamMember', 'ProjectManager', 'TaskService', 'MemberService',
+    'Task', 'TeamMember', 'ProjectManager', 'TaskService', 'MemberService', 'Clock', 'FixedClock',
     'TaskError', 'MemberError', 'ValidationError', 'TaskValidationError',
     'MemberValidationError', 'DuplicateError', 'DuplicateMemberError',
     'DuplicateTaskError', 'NotFoundError', 'MemberNotFoundError', 'TaskNotFoundError'
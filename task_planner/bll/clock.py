@@ -0,0 +1,22 @@
+from datetime import date
+
+
+class Clock:
+    """Джерело поточної дати для сервісів та інтерфейсу.
+
+    Дата береться один раз на прохід (запит, перемальовування таблиці) і
+    передається далі як as_of, тож усі рядки оцінюються на один і той самий день.
+    """
+
+    def today(self) -> date:
+        return date.today()
+
+
+class FixedClock(Clock):
+    """Годинник із заданою датою для тестів та бенчмарків"""
+
+    def __init__(self, day: date):
+        self.day = day
+
+    def today(self) -> date:
+        return self.day
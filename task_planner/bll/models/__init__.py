@@ -1,5 +1,10 @@
 from .base_model import BaseModel
 from .task import Task
 from .team_member import TeamMember
+from .lazy_record import LazyTask, LazyTeamMember
+from .task_query import TaskQuery
+from .page import Page
+from .ordered_set import OrderedSet
+from .task_table import TaskTable
 
-__all__ = ['BaseModel', 'Task', 'TeamMember']
\ No newline at end of file
+__all__ = ['BaseModel', 'Task', 'TeamMember', 'LazyTask', 'LazyTeamMember', 'TaskQuery', 'Page', 'TaskTable', 'OrderedSet']
\ No newline at end of file
@@ -1,16 +1,60 @@
 from abc import ABC
 from datetime import datetime
+from functools import lru_cache
+import sys
+from typing import FrozenSet, Optional
 import uuid
 
 
+def intern_str(value):
+    """Інтернує рядок, що повторюється в багатьох записах (ролі, id виконавців)"""
+    return sys.intern(value) if type(value) is str else value
+
+
+@lru_cache(maxsize=None)
+def _slot_names(cls) -> tuple:
+    """Повертає імена всіх слотів класу разом зі слотами батьківських класів"""
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get('__slots__', ())
+        names.extend((slots,) if isinstance(slots, str) else slots)
+    return tuple(names)
+
+
 class BaseModel(ABC):
-    """Базовий клас для всіх моделей"""
+    """Базовий клас для всіх моделей.
+
+    Моделі використовують __slots__ замість __dict__, тож кожен екземпляр
+    займає менше пам'яті; довільні атрибути додавати не можна.
+
+    Сутність зі сховища пам'ятає свій збережений запис (_saved), тож
+    репозиторії записують лише поля, що відрізняються від нього. Для
+    створених конструктором сутностей запису немає і зберігаються всі поля.
+    """
+
+    __slots__ = ('id', 'created_date', 'updated_date', '_saved')
 
     def __init__(self, id: str = None, created_date: datetime = None, updated_date: datetime = None):
+        self._saved = None
         self.id = id or str(uuid.uuid4())
         self.created_date = created_date or datetime.now()
         self.updated_date = updated_date or datetime.now()
 
+    def changed_fields(self) -> Optional[FrozenSet[str]]:
+        """Поля, що відрізняються від збереженого запису; None — запису немає"""
+        saved = self._saved
+        if saved is None:
+            return None
+        return frozenset(name for name, value in self.to_dict().items() if saved.get(name) != value)
+
+    def is_dirty(self) -> bool:
+        """Чи потрібно записувати сутність у сховище"""
+        return self._saved is None or bool(self.changed_fields())
+
+    def _mark_clean(self) -> None:
+        """Запам'ятовує поточний стан як збережений у сховищі"""
+        self._saved = self.to_dict()
+
     def to_dict(self) -> dict:
         """Серіалізація в словник"""
         return {
@@ -24,6 +68,19 @@ class BaseModel(ABC):
         """Десеріалізація зі словника"""
         raise NotImplementedError("Must be implemented in child classes")
 
+    def __copy__(self):
+        """Поверхнева копія моделі (використовується кешем репозиторіїв)"""
+        cls = self.__class__
+        clone = cls.__new__(cls)
+        for name in _slot_names(cls):
+            try:
+                # Ще не декодовані ліниві поля залишаються незаповненими і в копії
+                value = object.__getattribute__(self, name)
+            except AttributeError:
+                continue
+            object.__setattr__(clone, name, value)
+        return clone
+
     def update_timestamp(self):
         """Оновлення часу модифікації"""
         self.updated_date = datetime.now()
\ No newline at end of file
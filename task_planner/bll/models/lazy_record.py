@@ -0,0 +1,129 @@
+from datetime import date, datetime
+import uuid
+from .base_model import intern_str
+from .task import Task
+from .team_member import TeamMember
+from .ordered_set import OrderedSet
+
+
+def _decode_date(value):
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _decode_datetime(value):
+    if value and isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return datetime.now()
+
+
+def iso_field(entity, name: str) -> str:
+    """Повертає поле дати в форматі ISO; у ледачих записів без розбору дати"""
+    iso = getattr(entity, '_iso', None)
+    return iso(name) if iso is not None else getattr(entity, name).isoformat()
+
+
+class LazyRecordMixin:
+    """Ліниве декодування полів запису, прочитаного зі сховища.
+
+    Дешеві поля встановлюються одразу, а поля з _LAZY_FIELDS декодуються
+    з сирого словника лише під час першого звернення.
+    """
+
+    __slots__ = ()
+
+    _LAZY_FIELDS = {}
+
+    def __getattr__(self, name):
+        # Викликається лише для ще не встановлених атрибутів
+        decoder = type(self)._LAZY_FIELDS.get(name)
+        if decoder is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = decoder(object.__getattribute__(self, '_raw').get(name))
+        setattr(self, name, value)
+        return value
+
+    def _is_loaded(self, name: str) -> bool:
+        try:
+            object.__getattribute__(self, name)
+        except AttributeError:
+            return False
+        return True
+
+    def _mark_clean(self) -> None:
+        # Новий запис також служить джерелом для ще не декодованих полів
+        self._raw = self._saved = self.to_dict()
+
+    def _iso(self, name: str) -> str:
+        """Повертає ще не декодоване поле у сирому вигляді без розбору та форматування"""
+        raw = object.__getattribute__(self, '_raw').get(name)
+        if isinstance(raw, str) and not self._is_loaded(name):
+            return raw
+        return getattr(self, name).isoformat()
+
+
+class LazyTask(LazyRecordMixin, Task):
+    """Завдання зі сховища з лінивим розбором дат"""
+
+    __slots__ = ('_raw',)
+
+    _LAZY_FIELDS = {
+        'deadline': _decode_date,
+        'created_date': _decode_datetime,
+        'updated_date': _decode_datetime,
+    }
+
+    @classmethod
+    def _from_storage(cls, data: dict) -> 'LazyTask':
+        """Довірений шлях Task._from_storage, що відкладає розбір дат до першого звернення"""
+        task = cls.__new__(cls)
+        task._raw = task._saved = data
+        task.id = data.get('id') or str(uuid.uuid4())
+        task.title = data['title']
+        task.description = data['description']
+        task.assignee_id = intern_str(data.get('assignee_id'))
+        task.is_completed = data.get('is_completed', False)
+        return task
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'created_date': self._iso('created_date'),
+            'updated_date': self._iso('updated_date'),
+            'title': self.title,
+            'description': self.description,
+            'deadline': self._iso('deadline'),
+            'assignee_id': self.assignee_id,
+            'is_completed': self.is_completed
+        }
+
+
+class LazyTeamMember(LazyRecordMixin, TeamMember):
+    """Член команди зі сховища з лінивим розбором дат"""
+
+    __slots__ = ('_raw',)
+
+    _LAZY_FIELDS = {
+        'created_date': _decode_datetime,
+        'updated_date': _decode_datetime,
+    }
+
+    @classmethod
+    def _from_storage(cls, data: dict) -> 'LazyTeamMember':
+        """Довірений шлях TeamMember._from_storage з лінивим розбором дат"""
+        member = cls.__new__(cls)
+        member._raw = member._saved = data
+        member.id = data.get('id') or str(uuid.uuid4())
+        member.name = data['name']
+        member.role = intern_str(data['role'])
+        member.task_ids = OrderedSet(data.get('task_ids') or ())
+        return member
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'created_date': self._iso('created_date'),
+            'updated_date': self._iso('updated_date'),
+            'name': self.name,
+            'role': self.role,
+            'task_ids': self.task_ids.to_list()
+        }
@@ -0,0 +1,63 @@
+from collections.abc import MutableSet, Set
+from typing import Iterable, Iterator, List
+
+
+class OrderedSet(MutableSet):
+    """Множина, що зберігає порядок додавання.
+
+    Побудована на dict, тож перевірка належності, додавання та видалення
+    виконуються за O(1), а перебір іде в порядку додавання. Підтримує
+    операції множин (&, |, -) і порівнюється зі списком поелементно, тому
+    може стояти там, де раніше був список id.
+    """
+
+    __slots__ = ('_items',)
+
+    def __init__(self, items: Iterable = ()):
+        self._items = dict.fromkeys(items)
+
+    def __contains__(self, item) -> bool:
+        return item in self._items
+
+    def __iter__(self) -> Iterator:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, item) -> None:
+        self._items[item] = None
+
+    def discard(self, item) -> None:
+        self._items.pop(item, None)
+
+    def copy(self) -> 'OrderedSet':
+        return OrderedSet(self._items)
+
+    def to_list(self) -> List:
+        return list(self._items)
+
+    @classmethod
+    def _from_iterable(cls, items: Iterable) -> 'OrderedSet':
+        # Результати операцій множин також зберігають порядок
+        return cls(items)
+
+    def __and__(self, other) -> 'OrderedSet':
+        # Set.__and__ перебирає other; тут зберігається порядок лівого операнда
+        if not isinstance(other, Iterable):
+            return NotImplemented
+        if not isinstance(other, Set):
+            other = set(other)
+        return OrderedSet(item for item in self._items if item in other)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, tuple, OrderedSet)):
+            return self.to_list() == list(other)
+        if isinstance(other, Set):
+            return self._items.keys() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"OrderedSet({self.to_list()!r})"
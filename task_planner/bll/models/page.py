@@ -0,0 +1,57 @@
+import base64
+import json
+from typing import Generic, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+def encode_cursor(key: tuple) -> str:
+    """Кодує ключ останнього елемента сторінки в непрозорий курсор"""
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """Розкодовує курсор, отриманий з Page.next_cursor"""
+    try:
+        sort_value, id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, TypeError):
+        raise ValueError("Некоректний курсор сторінки")
+    return sort_value, id
+
+
+class Page(Generic[T]):
+    """Сторінка вибірки з курсором наступної сторінки.
+
+    Курсор містить ключ сортування та id останнього елемента, тож наступна
+    сторінка починається одразу після нього навіть після змін у сховищі.
+    next_cursor дорівнює None на останній сторінці.
+    """
+
+    ORDERS = ('deadline', 'created_date')
+
+    def __init__(self, items: List[T], next_cursor: Optional[str] = None):
+        self.items = items
+        self.next_cursor = next_cursor
+
+    @classmethod
+    def from_keys(cls, items: List[T], keys: List[tuple], size: int) -> 'Page[T]':
+        """Будує сторінку з size + 1 прочитаних елементів та їхніх ключів"""
+        if len(items) > size:
+            return cls(items[:size], encode_cursor(keys[size - 1]))
+        return cls(items)
+
+    @staticmethod
+    def check(order_by: str, size: int, orders: tuple = ORDERS) -> None:
+        if order_by not in orders:
+            raise ValueError(f"Невідомий порядок сторінок: {order_by}")
+        if size <= 0:
+            raise ValueError("Розмір сторінки має бути додатним")
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __repr__(self):
+        return f"Page(items={len(self.items)}, next_cursor={self.next_cursor!r})"
@@ -1,11 +1,14 @@
 from datetime import date, datetime
 from typing import Optional
-from .base_model import BaseModel
+import uuid
+from .base_model import BaseModel, intern_str
 
 
 class Task(BaseModel):
     """Клас завдання"""
 
+    __slots__ = ('title', 'description', 'deadline', 'assignee_id', 'is_completed')
+
     def __init__(self, title: str, description: str, deadline: date,
                  assignee_id: Optional[str] = None, is_completed: bool = False, **kwargs):
         # Викликаємо конструктор батьківського класу
@@ -14,7 +17,7 @@ class Task(BaseModel):
         self.title = title
         self.description = description
         self.deadline = deadline
-        self.assignee_id = assignee_id
+        self.assignee_id = intern_str(assignee_id)
         self.is_completed = is_completed
 
         # Валідація
@@ -35,9 +38,9 @@ class Task(BaseModel):
         self.is_completed = False
         self.update_timestamp()
 
-    def is_overdue(self) -> bool:
-        """Перевірити, чи прострочено завдання"""
-        return not self.is_completed and self.deadline < date.today()
+    def is_overdue(self, as_of: Optional[date] = None) -> bool:
+        """Перевірити, чи прострочено завдання на дату as_of (за замовчуванням сьогодні)"""
+        return not self.is_completed and self.deadline < (as_of or date.today())
 
     def to_dict(self) -> dict:
         base_dict = super().to_dict()
@@ -77,6 +80,26 @@ class Task(BaseModel):
 
         return task
 
+    @classmethod
+    def _from_storage(cls, data: dict) -> 'Task':
+        """Довірений шлях відновлення завдання зі сховища (лише для репозиторіїв).
+
+        Дані вже пройшли валідацію під час запису, тому конструктор і перевірки
+        не викликаються; збережене завдання з минулим дедлайном завантажується.
+        """
+        task = cls.__new__(cls)
+        task._saved = data
+        task.id = data.get('id') or str(uuid.uuid4())
+        task.created_date = cls._parse_datetime(data.get('created_date'))
+        task.updated_date = cls._parse_datetime(data.get('updated_date'))
+        task.title = data['title']
+        task.description = data['description']
+        deadline = data['deadline']
+        task.deadline = date.fromisoformat(deadline) if isinstance(deadline, str) else deadline
+        task.assignee_id = intern_str(data.get('assignee_id'))
+        task.is_completed = data.get('is_completed', False)
+        return task
+
     @staticmethod
     def _parse_datetime(datetime_str):
         """Парсить datetime з рядка або повертає поточний"""
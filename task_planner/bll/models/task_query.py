@@ -0,0 +1,106 @@
+import copy
+import re
+from datetime import date
+from typing import Iterable, List, Optional
+from .lazy_record import iso_field
+
+_WORD = re.compile(r'\w+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Розбиває текст на слова без урахування регістру (українська та англійська)"""
+    return _WORD.findall(text.casefold())
+
+
+class TaskQuery:
+    """Специфікація вибірки завдань, яку репозиторій виконує власними засобами.
+
+    Усі задані фільтри мають виконуватися одночасно; None означає відсутність
+    фільтра. Без sort_by завдання повертаються в порядку зберігання, а при
+    однакових ключах сортування порядок зберігання також зберігається.
+    """
+
+    STATUSES = ('pending', 'completed', 'overdue')
+    SORT_KEYS = ('deadline', 'title', 'created_date')
+
+    def __init__(self, status: Optional[str] = None, assignee_id: Optional[str] = None,
+                 due_from: Optional[date] = None, due_to: Optional[date] = None,
+                 text: Optional[str] = None, sort_by: Optional[str] = None, descending: bool = False,
+                 limit: Optional[int] = None, offset: int = 0, as_of: Optional[date] = None):
+        if status is not None and status not in self.STATUSES:
+            raise ValueError(f"Невідомий статус завдання: {status}")
+        if sort_by is not None and sort_by not in self.SORT_KEYS:
+            raise ValueError(f"Невідомий ключ сортування: {sort_by}")
+        if (limit is not None and limit < 0) or offset < 0:
+            raise ValueError("limit та offset не можуть бути від'ємними")
+
+        self.status = status
+        self.assignee_id = assignee_id
+        self.due_from = due_from
+        self.due_to = due_to
+        self.text = text if text and tokenize(text) else None
+        self.sort_by = sort_by
+        self.descending = descending
+        self.limit = limit
+        self.offset = offset
+        # Дата для статусу "прострочені" фіксується один раз на весь запит;
+        # якщо її не задано, сервіс підставляє сьогоднішню дату свого Clock
+        self.as_of = as_of
+
+    def at(self, as_of: date) -> 'TaskQuery':
+        """Повертає запит із датою as_of, якщо дату ще не задано"""
+        if self.as_of is not None:
+            return self
+        query = copy.copy(self)
+        query.as_of = as_of
+        return query
+
+    @property
+    def overdue_before(self) -> date:
+        """Дата, раніше за яку дедлайн незавершеного завдання вважається простроченим"""
+        if self.as_of is None:
+            raise ValueError("Для статусу 'overdue' потрібна дата as_of")
+        return self.as_of
+
+    @property
+    def terms(self) -> List[str]:
+        return tokenize(self.text) if self.text else []
+
+    def matches(self, task) -> bool:
+        """Перевіряє, чи задовольняє завдання всім фільтрам запиту"""
+        if self.status == 'completed' and not task.is_completed:
+            return False
+        if self.status in ('pending', 'overdue') and task.is_completed:
+            return False
+        if self.assignee_id is not None and task.assignee_id != self.assignee_id:
+            return False
+        if self.status == 'overdue' or self.due_from or self.due_to:
+            # ISO-рядки порівнюються так само, як дати, і не потребують розбору
+            deadline = iso_field(task, 'deadline')
+            if self.status == 'overdue' and deadline >= self.overdue_before.isoformat():
+                return False
+            if self.due_from and deadline < self.due_from.isoformat():
+                return False
+            if self.due_to and deadline > self.due_to.isoformat():
+                return False
+        if self.text:
+            words = tokenize(f"{task.title} {task.description}")
+            if not all(any(word.startswith(term) for word in words) for term in self.terms):
+                return False
+        return True
+
+    def sort_key(self, task):
+        if self.sort_by == 'title':
+            return task.title.casefold()
+        return iso_field(task, self.sort_by)
+
+    def page(self, tasks: List) -> List:
+        """Сортує вже відфільтровані завдання та вирізає сторінку offset/limit"""
+        if self.sort_by is not None:
+            tasks = sorted(tasks, key=self.sort_key, reverse=self.descending)
+        end = None if self.limit is None else self.offset + self.limit
+        return tasks[self.offset:end]
+
+    def apply(self, tasks: Iterable) -> List:
+        """Виконує запит над послідовністю завдань перебором"""
+        return self.page([task for task in tasks if self.matches(task)])
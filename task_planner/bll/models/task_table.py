@@ -0,0 +1,136 @@
+from array import array
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+from .lazy_record import iso_field
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необов'язковий, без нього використовується модуль array
+    np = None
+
+
+class TaskTable:
+    """Стовпчикове представлення завдань для аналітики.
+
+    Кожне поле зберігається окремим масивом: is_completed (bool), deadline
+    (порядковий номер дня, int32) та assignee_codes (код виконавця в
+    assignees, -1 — не призначено). Агрегати обчислюються векторно засобами
+    NumPy, а якщо його немає — проходом по компактних масивах array.
+    Дата as_of, на яку рахуються прострочені завдання, задається під час
+    побудови (сервіс бере її зі свого Clock) або передається в overdue_count().
+    """
+
+    def __init__(self, is_completed: array, deadline: array, assignee_codes: array,
+                 assignees: List[str], use_numpy: Optional[bool] = None, as_of: Optional[date] = None):
+        if use_numpy is None:
+            use_numpy = np is not None
+        if use_numpy and np is None:
+            raise ValueError("NumPy не встановлено")
+
+        self.assignees = assignees
+        self.use_numpy = use_numpy
+        self.as_of = as_of
+        if use_numpy:
+            # Дані копіюються з буферів array без проходу по елементах
+            self.is_completed = np.frombuffer(is_completed, dtype=np.int8).astype(bool)
+            self.deadline = np.frombuffer(deadline, dtype=np.int32).copy()
+            self.assignee_codes = np.frombuffer(assignee_codes, dtype=np.int32).copy()
+        else:
+            self.is_completed = is_completed
+            self.deadline = deadline
+            self.assignee_codes = assignee_codes
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable, use_numpy: Optional[bool] = None,
+                   as_of: Optional[date] = None) -> 'TaskTable':
+        """Будує таблицю за один прохід по завданнях"""
+        is_completed = array('b')
+        deadline = array('i')
+        assignee_codes = array('i')
+        assignees: List[str] = []
+        codes: Dict[str, int] = {}
+        ordinals: Dict[str, int] = {}
+
+        for task in tasks:
+            is_completed.append(1 if task.is_completed else 0)
+            # Дедлайни беруться у вигляді ISO-рядків, однакові дати розбираються один раз
+            iso = iso_field(task, 'deadline')
+            ordinal = ordinals.get(iso)
+            if ordinal is None:
+                ordinal = ordinals[iso] = date.fromisoformat(iso).toordinal()
+            deadline.append(ordinal)
+            if task.assignee_id is None:
+                assignee_codes.append(-1)
+            else:
+                code = codes.get(task.assignee_id)
+                if code is None:
+                    code = codes[task.assignee_id] = len(assignees)
+                    assignees.append(task.assignee_id)
+                assignee_codes.append(code)
+
+        return cls(is_completed, deadline, assignee_codes, assignees, use_numpy, as_of)
+
+    @classmethod
+    def from_repository(cls, repository, use_numpy: Optional[bool] = None,
+                        as_of: Optional[date] = None) -> 'TaskTable':
+        """Будує таблицю з потокового читання репозиторію завдань"""
+        return cls.from_tasks(repository.iter_all(), use_numpy, as_of)
+
+    def __len__(self) -> int:
+        return len(self.deadline)
+
+    def completed_count(self) -> int:
+        if self.use_numpy:
+            return int(np.count_nonzero(self.is_completed))
+        return sum(self.is_completed)
+
+    def progress(self) -> float:
+        """Відсоток виконаних завдань"""
+        if not len(self):
+            return 0.0
+        return self.completed_count() / len(self) * 100
+
+    def overdue_count(self, as_of: Optional[date] = None) -> int:
+        """Кількість незавершених завдань з дедлайном раніше за as_of (за замовчуванням — дата таблиці)"""
+        as_of = as_of or self.as_of
+        if as_of is None:
+            raise ValueError("Не задано дату, на яку рахуються прострочені завдання")
+        day = as_of.toordinal()
+        if self.use_numpy:
+            return int(np.count_nonzero(~self.is_completed & (self.deadline < day)))
+        return sum(1 for done, deadline in zip(self.is_completed, self.deadline) if not done and deadline < day)
+
+    def completion_by_assignee(self) -> Dict[Optional[str], Tuple[int, int]]:
+        """Повертає для кожного виконавця пару (виконано, усього); None — без виконавця"""
+        size = len(self.assignees) + 1
+        if self.use_numpy:
+            # Зсув на 1 переносить "не призначено" (-1) у нульовий кошик
+            shifted = self.assignee_codes + 1
+            totals = np.bincount(shifted, minlength=size).tolist()
+            completed = np.bincount(shifted, weights=self.is_completed, minlength=size).astype(int).tolist()
+        else:
+            totals = [0] * size
+            completed = [0] * size
+            for done, code in zip(self.is_completed, self.assignee_codes):
+                totals[code + 1] += 1
+                completed[code + 1] += done
+
+        names = [None] + self.assignees
+        return {names[i]: (completed[i], totals[i]) for i in range(size) if totals[i]}
+
+    def deadline_histogram(self, start: date, end: date, bin_days: int = 7) -> List[int]:
+        """Кількість завдань з дедлайном у кожному інтервалі по bin_days днів від start до end включно"""
+        if bin_days <= 0:
+            raise ValueError("Ширина інтервалу має бути додатною")
+        first, last = start.toordinal(), end.toordinal()
+        if last < first:
+            return []
+        bins = (last - first) // bin_days + 1
+        if self.use_numpy:
+            in_range = self.deadline[(self.deadline >= first) & (self.deadline <= last)]
+            return np.bincount((in_range - first) // bin_days, minlength=bins).tolist()
+        counts = [0] * bins
+        for deadline in self.deadline:
+            if first <= deadline <= last:
+                counts[(deadline - first) // bin_days] += 1
+        return counts
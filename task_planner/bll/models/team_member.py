@@ -1,18 +1,26 @@
 from datetime import datetime
-from typing import List
-from .base_model import BaseModel
+from typing import Iterable
+import uuid
+from .base_model import BaseModel, intern_str
+from .ordered_set import OrderedSet
 
 
 class TeamMember(BaseModel):
-    """Клас члена команди"""
+    """Клас члена команди.
 
-    def __init__(self, name: str, role: str, task_ids: List[str] = None, **kwargs):
+    task_ids — OrderedSet: перевірка, додавання та видалення id за O(1) з
+    збереженням порядку; у to_dict() серіалізується як список.
+    """
+
+    __slots__ = ('name', 'role', 'task_ids')
+
+    def __init__(self, name: str, role: str, task_ids: Iterable[str] = None, **kwargs):
         # Викликаємо конструктор батьківського класу
         super().__init__(**kwargs)
 
         self.name = name
-        self.role = role
-        self.task_ids = task_ids or []
+        self.role = intern_str(role)
+        self.task_ids = OrderedSet(task_ids or ())
 
         # Валідація
         if not self.name.strip():
@@ -25,25 +33,30 @@ class TeamMember(BaseModel):
     def add_task(self, task_id: str) -> None:
         """Додати ID завдання до списку завдань члена команди"""
         if task_id not in self.task_ids:
-            self.task_ids.append(task_id)
+            self.task_ids.add(task_id)
             self.update_timestamp()
 
     def remove_task(self, task_id: str) -> None:
         """Видалити ID завдання зі списку завдань члена команди"""
         if task_id in self.task_ids:
-            self.task_ids.remove(task_id)
+            self.task_ids.discard(task_id)
             self.update_timestamp()
 
     def get_workload(self) -> int:
         """Повертає кількість завдань члена команди"""
         return len(self.task_ids)
 
+    def __copy__(self):
+        clone = super().__copy__()
+        clone.task_ids = self.task_ids.copy()
+        return clone
+
     def to_dict(self) -> dict:
         base_dict = super().to_dict()
         base_dict.update({
             'name': self.name,
             'role': self.role,
-            'task_ids': self.task_ids
+            'task_ids': self.task_ids.to_list()
         })
         return base_dict
 
@@ -65,6 +78,19 @@ class TeamMember(BaseModel):
 
         return member
 
+    @classmethod
+    def _from_storage(cls, data: dict) -> 'TeamMember':
+        """Довірений шлях відновлення члена команди зі сховища (лише для репозиторіїв)"""
+        member = cls.__new__(cls)
+        member._saved = data
+        member.id = data.get('id') or str(uuid.uuid4())
+        member.created_date = cls._parse_datetime(data.get('created_date'))
+        member.updated_date = cls._parse_datetime(data.get('updated_date'))
+        member.name = data['name']
+        member.role = intern_str(data['role'])
+        member.task_ids = OrderedSet(data.get('task_ids') or ())
+        return member
+
     @staticmethod
     def _parse_datetime(datetime_str):
         """Парсить datetime з рядка або повертає поточний"""
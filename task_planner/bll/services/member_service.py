@@ -1,21 +1,20 @@
-from typing import List
-from task_planner.dal.repositories.irepository import IRepository
+from typing import List, Optional
+from task_planner.dal.repositories.irepository import ITaskRepository, IMemberRepository
+from task_planner.dal.unit_of_work import UnitOfWork
 from task_planner.bll.models.team_member import TeamMember
-from task_planner.bll.exceptions import MemberNotFoundError, DuplicateMemberError
+from task_planner.bll.models.page import Page
+from task_planner.bll.exceptions import MemberNotFoundError
 
 
 class MemberService:
-    def __init__(self, member_repository: IRepository[TeamMember], task_repository: IRepository):
+    def __init__(self, member_repository: IMemberRepository, task_repository: ITaskRepository):
         self._member_repository = member_repository
         self._task_repository = task_repository
 
     def create_member(self, name: str, role: str) -> TeamMember:
         """Створює нового члена команди"""
-        existing_members = self._member_repository.get_all()
-        if any(member.name == name for member in existing_members):
-            raise DuplicateMemberError.by_name(name)
-
         member = TeamMember(name=name, role=role)
+        # Унікальність імені перевіряє репозиторій за індексом імен
         self._member_repository.add(member)
         return member
 
@@ -30,15 +29,20 @@ class MemberService:
         """Отримує всіх членів команди"""
         return self._member_repository.get_all()
 
+    def find_member_by_name(self, name: str) -> Optional[TeamMember]:
+        """Шукає члена команди за іменем"""
+        return self._member_repository.get_by_name(name)
+
+    def get_members_page(self, after: Optional[str] = None, size: int = 50) -> Page[TeamMember]:
+        """Отримує сторінку членів команди за датою створення"""
+        return self._member_repository.page(after=after, size=size, order_by='created_date')
+
     def update_member(self, member_id: str, name: str, role: str) -> None:
         """Оновлює дані члена команди"""
         member = self.get_member(member_id)
 
-        # Перевірка на дублікат (крім поточного члена)
-        existing_members = self._member_repository.get_all()
-        if any(m.name == name and m.id != member_id for m in existing_members):
-            raise DuplicateMemberError.by_name(name)
-
+        # Ім'я, зайняте іншим членом команди, репозиторій відхилить
+        # з DuplicateMemberError
         member.name = name
         member.role = role
         member.update_timestamp()
@@ -46,21 +50,20 @@ class MemberService:
 
     def delete_member(self, member_id: str) -> None:
         """Видаляє члена команди"""
-        member = self.get_member(member_id)
+        with UnitOfWork(self._task_repository, self._member_repository) as uow:
+            if not uow.members.exists(member_id):
+                raise MemberNotFoundError.by_id()
 
-        # Видаляємо всі завдання цього члена команди
-        member_tasks = [task for task in self._task_repository.get_all()
-                        if task.assignee_id == member_id]
-        for task in member_tasks:
-            self._task_repository.delete(task.id)
+            # Видаляємо всі завдання цього члена команди
+            for task in self._task_repository.get_by_assignee(member_id):
+                uow.tasks.delete(task.id)
 
-        self._member_repository.delete(member_id)
+            uow.members.delete(member_id)
 
     def get_member_tasks(self, member_id: str) -> List:
         """Отримує всі завдання члена команди"""
-        member = self.get_member(member_id)
-        all_tasks = self._task_repository.get_all()
-        return [task for task in all_tasks if task.id in member.task_ids]
+        self.get_member(member_id)
+        return self._task_repository.get_by_assignee(member_id)
 
     def get_member_workload(self, member_id: str) -> int:
         """Отримує кількість завдань члена команди"""
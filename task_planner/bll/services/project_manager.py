@@ -1,7 +1,11 @@
-from typing import List
+from datetime import date
+from typing import Dict, List, Optional, Tuple
 from task_planner.bll.services.task_service import TaskService
 from task_planner.bll.services.member_service import MemberService
 from task_planner.bll.models.task import Task
+from task_planner.bll.models.task_query import TaskQuery
+from task_planner.bll.models.page import Page
+from task_planner.bll.models.task_table import TaskTable
 from task_planner.bll.models.team_member import TeamMember
 
 
@@ -10,6 +14,10 @@ class ProjectManager:
         self._task_service = task_service
         self._member_service = member_service
 
+    def today(self) -> date:
+        """Дата, на яку інтерфейс оцінює прострочення протягом одного оновлення"""
+        return self._task_service.today()
+
     # Делегування до MemberService
     def add_member(self, name: str, role: str) -> TeamMember:
         return self._member_service.create_member(name, role)
@@ -20,6 +28,9 @@ class ProjectManager:
     def get_all_members(self) -> List[TeamMember]:
         return self._member_service.get_all_members()
 
+    def get_members_page(self, after: Optional[str] = None, size: int = 50) -> Page[TeamMember]:
+        return self._member_service.get_members_page(after, size)
+
     def update_member(self, member_id: str, name: str, role: str) -> None:
         self._member_service.update_member(member_id, name, role)
 
@@ -42,6 +53,23 @@ class ProjectManager:
     def get_all_tasks(self) -> List[Task]:
         return self._task_service.get_all_tasks()
 
+    def get_tasks_page(self, after: Optional[str] = None, size: int = 50,
+                       order_by: str = 'deadline') -> Page[Task]:
+        return self._task_service.get_tasks_page(after, size, order_by)
+
+    def get_tasks_by_assignee(self, member_id: str) -> List[Task]:
+        return self._task_service.get_tasks_by_assignee(member_id)
+
+    def find_tasks(self, query: TaskQuery) -> List[Task]:
+        return self._task_service.find_tasks(query)
+
+    def get_tasks_with_assignees(self, query: TaskQuery) -> List[Tuple[Task, Optional[str]]]:
+        """Повертає завдання за запитом разом з іменами виконавців для таблиці"""
+        return self._task_service.find_tasks_with_assignees(query)
+
+    def search_tasks(self, query: str, limit: Optional[int] = None) -> List[Task]:
+        return self._task_service.search(query, limit)
+
     def update_task_assignee(self, task_id: str, new_assignee_id: None) -> None:
         self._task_service.update_task_assignee(task_id, new_assignee_id)
 
@@ -55,16 +83,25 @@ class ProjectManager:
         self._task_service.delete_task(task_id)
 
     # Комбіновані методи
+    def get_project_stats(self) -> Dict[str, int]:
+        """Повертає лічильники завдань проекту без завантаження самих завдань"""
+        return self._task_service.get_task_stats()
+
     def get_project_progress(self) -> float:
         """Розраховує прогрес проекту (відсоток виконаних завдань)"""
-        tasks = self._task_service.get_all_tasks()
-        if not tasks:
+        stats = self.get_project_stats()
+        if not stats['total']:
             return 0.0
-        completed = len(self._task_service.get_completed_tasks())
-        return (completed / len(tasks)) * 100
+        return (stats['completed'] / stats['total']) * 100
+
+    def get_task_table(self) -> TaskTable:
+        return self._task_service.get_task_table()
+
+    def get_overdue_tasks(self, as_of: Optional[date] = None) -> List[Task]:
+        return self._task_service.get_overdue_tasks(as_of)
 
-    def get_overdue_tasks(self) -> List[Task]:
-        return self._task_service.get_overdue_tasks()
+    def get_tasks_due_between(self, start: date, end: date) -> List[Task]:
+        return self._task_service.get_tasks_due_between(start, end)
 
     def get_completed_tasks(self) -> List[Task]:
         return self._task_service.get_completed_tasks()
@@ -76,8 +113,7 @@ class ProjectManager:
         return self._member_service.get_member(member_id)
 
     def find_member_by_name(self, name: str) -> TeamMember:
-        members = self._member_service.get_all_members()
-        return next((m for m in members if m.name == name), None)
+        return self._member_service.find_member_by_name(name)
 
     def find_task_by_id(self, task_id: str) -> Task:
         return self._task_service.get_task(task_id)
\ No newline at end of file
@@ -1,36 +1,49 @@
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import date
-from task_planner.dal.repositories.irepository import IRepository
+from task_planner.dal.repositories.irepository import ITaskRepository, IMemberRepository
+from task_planner.dal.unit_of_work import UnitOfWork
 from task_planner.bll.models.task import Task
-from task_planner.bll.exceptions import TaskNotFoundError, DuplicateTaskError, MemberNotFoundError
+from task_planner.bll.models.task_query import TaskQuery
+from task_planner.bll.models.page import Page
+from task_planner.bll.models.task_table import TaskTable
+from task_planner.bll.clock import Clock
+from task_planner.bll.exceptions import TaskNotFoundError, MemberNotFoundError
 
 
 class TaskService:
-    def __init__(self, task_repository: IRepository[Task], member_repository: IRepository):
+    def __init__(self, task_repository: ITaskRepository, member_repository: IMemberRepository,
+                 clock: Optional[Clock] = None):
         self._task_repository = task_repository
         self._member_repository = member_repository
+        self._clock = clock or Clock()
+
+    def today(self) -> date:
+        """Поточна дата за годинником сервісу; обчислюйте її один раз на прохід"""
+        return self._clock.today()
+
+    def _unit_of_work(self) -> UnitOfWork:
+        return UnitOfWork(self._task_repository, self._member_repository)
 
     def create_task(self, title: str, description: str, deadline: date,
                     assignee_id: Optional[str] = None) -> Task:
         """Створює нове завдання"""
-        # Перевірка на дублікат
-        existing_tasks = self._task_repository.get_all()
-        if any(task.title == title for task in existing_tasks):
-            raise DuplicateTaskError.by_title(title)
-
-        # Перевірка виконавця
-        if assignee_id and not self._member_repository.exists(assignee_id):
-            raise MemberNotFoundError.for_task_assignment()
-
-        task = Task(title=title, description=description, deadline=deadline, assignee_id=assignee_id)
-        self._task_repository.add(task)
-
-        # Оновлення виконавця
-        if assignee_id:
-            member = self._member_repository.get_by_id(assignee_id)
+        # Унікальність назви перевіряє репозиторій за індексом назв під час
+        # фіксації, тож дублікат скасовує всю операцію
+        with self._unit_of_work() as uow:
+            # Перевірка виконавця
+            member = None
+            if assignee_id:
+                member = uow.members.get(assignee_id)
+                if member is None:
+                    raise MemberNotFoundError.for_task_assignment()
+
+            task = Task(title=title, description=description, deadline=deadline, assignee_id=assignee_id)
+            uow.tasks.add(task)
+
+            # Оновлення виконавця
             if member:
                 member.add_task(task.id)
-                self._member_repository.update(member)
+                uow.members.update(member)
 
         return task
 
@@ -45,28 +58,43 @@ class TaskService:
         """Отримує всі завдання"""
         return self._task_repository.get_all()
 
-    def update_task_assignee(self, task_id: str, new_assignee_id: Optional[str]) -> None:
-        """Оновлює призначеного виконавця для завдання"""
-        task = self.get_task(task_id)
-
-        # Видаляємо завдання зі старого виконавця
-        if task.assignee_id:
-            old_assignee = self._member_repository.get_by_id(task.assignee_id)
-            if old_assignee:
-                old_assignee.remove_task(task_id)
-                self._member_repository.update(old_assignee)
+    def get_tasks_page(self, after: Optional[str] = None, size: int = 50,
+                       order_by: str = 'deadline') -> Page[Task]:
+        """Отримує сторінку завдань за курсором (order_by: 'deadline' або 'created_date')"""
+        return self._task_repository.page(after=after, size=size, order_by=order_by)
 
-        # Додаємо завдання новому виконавцю
-        if new_assignee_id:
-            if not self._member_repository.exists(new_assignee_id):
-                raise MemberNotFoundError.for_task_assignment()
+    def get_tasks_by_assignee(self, member_id: str) -> List[Task]:
+        """Отримує всі завдання виконавця"""
+        return self._task_repository.get_by_assignee(member_id)
 
-            new_assignee = self._member_repository.get_by_id(new_assignee_id)
-            new_assignee.add_task(task_id)
-            self._member_repository.update(new_assignee)
+    def search(self, query: str, limit: Optional[int] = None) -> List[Task]:
+        """Шукає завдання за словами назви та опису (без урахування регістру, за префіксом)"""
+        return self._task_repository.search(query, limit)
 
-        task.assignee_id = new_assignee_id
-        self._task_repository.update(task)
+    def update_task_assignee(self, task_id: str, new_assignee_id: Optional[str]) -> None:
+        """Оновлює призначеного виконавця для завдання"""
+        with self._unit_of_work() as uow:
+            task = uow.tasks.get(task_id)
+            if not task:
+                raise TaskNotFoundError.by_id()
+
+            # Видаляємо завдання зі старого виконавця
+            if task.assignee_id:
+                old_assignee = uow.members.get(task.assignee_id)
+                if old_assignee:
+                    old_assignee.remove_task(task_id)
+                    uow.members.update(old_assignee)
+
+            # Додаємо завдання новому виконавцю
+            if new_assignee_id:
+                new_assignee = uow.members.get(new_assignee_id)
+                if new_assignee is None:
+                    raise MemberNotFoundError.for_task_assignment()
+                new_assignee.add_task(task_id)
+                uow.members.update(new_assignee)
+
+            task.assignee_id = new_assignee_id
+            uow.tasks.update(task)
 
     def mark_task_done(self, task_id: str) -> None:
         """Позначає завдання як виконане"""
@@ -82,25 +110,69 @@ class TaskService:
 
     def delete_task(self, task_id: str) -> None:
         """Видаляє завдання"""
-        task = self.get_task(task_id)
+        with self._unit_of_work() as uow:
+            task = uow.tasks.get(task_id)
+            if not task:
+                raise TaskNotFoundError.by_id()
+
+            # Видаляємо завдання з виконавця
+            if task.assignee_id:
+                assignee = uow.members.get(task.assignee_id)
+                if assignee:
+                    assignee.remove_task(task_id)
+                    uow.members.update(assignee)
+
+            uow.tasks.delete(task_id)
+
+    def get_task_table(self) -> TaskTable:
+        """Будує стовпчикову таблицю всіх завдань для звітів"""
+        return TaskTable.from_repository(self._task_repository, as_of=self.today())
 
-        # Видаляємо завдання з виконавця
-        if task.assignee_id:
-            assignee = self._member_repository.get_by_id(task.assignee_id)
-            if assignee:
-                assignee.remove_task(task_id)
-                self._member_repository.update(assignee)
+    def get_overdue_tasks(self, as_of: Optional[date] = None) -> List[Task]:
+        """Отримує всі прострочені завдання на дату as_of (за замовчуванням сьогодні)"""
+        return self._task_repository.get_overdue_tasks(as_of or self.today())
 
-        self._task_repository.delete(task_id)
+    def get_tasks_due_between(self, start: date, end: date) -> List[Task]:
+        """Отримує завдання з дедлайном у межах [start, end]"""
+        return self._task_repository.get_tasks_due_between(start, end)
 
-    def get_overdue_tasks(self) -> List[Task]:
-        """Отримує всі прострочені завдання"""
-        return [task for task in self._task_repository.get_all() if task.is_overdue()]
+    def get_task_stats(self, as_of: Optional[date] = None) -> Dict[str, int]:
+        """Отримує лічильники завдань: усього, виконано, незавершено, прострочено"""
+        return self._task_repository.get_stats(as_of or self.today())
 
     def get_completed_tasks(self) -> List[Task]:
         """Отримує всі виконані завдання"""
-        return [task for task in self._task_repository.get_all() if task.is_completed]
+        return self.find_tasks(TaskQuery(status='completed'))
 
     def get_pending_tasks(self) -> List[Task]:
         """Отримує всі незавершені завдання"""
-        return [task for task in self._task_repository.get_all() if not task.is_completed]
\ No newline at end of file
+        return self.find_tasks(TaskQuery(status='pending'))
+
+    def find_tasks(self, query: TaskQuery) -> List[Task]:
+        """Отримує завдання за специфікацією запиту, яку виконує репозиторій"""
+        return self._task_repository.find(query.at(self.today()))
+
+    def find_tasks_with_assignees(self, query: TaskQuery) -> List[Tuple[Task, Optional[str]]]:
+        """Отримує завдання за запитом разом з іменами виконавців.
+
+        Виконавці всіх завдань читаються одним пакетним get_many(), а не
+        окремим запитом на кожне завдання. Ім'я дорівнює None, якщо
+        виконавця не призначено або його не знайдено.
+        """
+        tasks = self._task_repository.find(query.at(self.today()))
+        assignee_ids = {task.assignee_id for task in tasks if task.assignee_id}
+        names = {member.id: member.name for member in self._member_repository.get_many(assignee_ids)}
+        return [(task, names.get(task.assignee_id)) for task in tasks]
+
+    def iter_overdue_tasks(self, as_of: Optional[date] = None) -> Iterator[Task]:
+        """Послідовно повертає прострочені завдання без завантаження всього списку"""
+        as_of = as_of or self.today()
+        return (task for task in self._task_repository.iter_all() if task.is_overdue(as_of))
+
+    def iter_completed_tasks(self) -> Iterator[Task]:
+        """Послідовно повертає виконані завдання без завантаження всього списку"""
+        return (task for task in self._task_repository.iter_all() if task.is_completed)
+
+    def iter_pending_tasks(self) -> Iterator[Task]:
+        """Послідовно повертає незавершені завдання без завантаження всього списку"""
+        return (task for task in self._task_repository.iter_all() if not task.is_completed)
\ No newline at end of file
@@ -1,3 +1,7 @@
-from task_planner.dal.repositories import TaskRepository, MemberRepository, IRepository
+from task_planner.dal.repositories import (
+    TaskRepository, MemberRepository, IRepository, ITaskRepository, IMemberRepository
+)
+from task_planner.dal.unit_of_work import UnitOfWork, TrackedRepository
 
-__all__ = ['TaskRepository', 'MemberRepository', 'IRepository']
\ No newline at end of file
+__all__ = ['TaskRepository', 'MemberRepository', 'IRepository', 'ITaskRepository', 'IMemberRepository',
+           'UnitOfWork', 'TrackedRepository']
\ No newline at end of file
@@ -1,5 +1,12 @@
-from .irepository import IRepository
+from .irepository import IRepository, ITaskRepository, IMemberRepository
 from .task_repository import TaskRepository
 from .member_repository import MemberRepository
+from .data_store import DataStore
+from .journal_repository import JournalStore, JournalTaskRepository, JournalMemberRepository
+from .sqlite_repository import (
+    SqliteDatabase, SqliteTaskRepository, SqliteMemberRepository, migrate_json_to_sqlite
+)
 
-__all__ = ['IRepository', 'TaskRepository', 'MemberRepository']
\ No newline at end of file
+__all__ = ['IRepository', 'ITaskRepository', 'IMemberRepository', 'TaskRepository', 'MemberRepository', 'DataStore',
+           'JournalStore', 'JournalTaskRepository', 'JournalMemberRepository',
+           'SqliteDatabase', 'SqliteTaskRepository', 'SqliteMemberRepository', 'migrate_json_to_sqlite']
\ No newline at end of file
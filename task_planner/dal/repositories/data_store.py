@@ -0,0 +1,183 @@
+import copy
+import json
+import os
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional
+from .json_stream import iter_section
+from .indexes import IndexedSection
+
+
+class DataStore:
+    """Спільний документ файлу даних для репозиторіїв завдань і членів команди.
+
+    Один об'єкт на файл: розбирає документ один раз, ліниво десеріалізує
+    секції (tasks, members) в IndexedSection і записує файл сам, тож
+    репозиторії лише читають та змінюють свої секції. Перед кожним зверненням
+    перевіряються mtime, розмір та inode файлу, і документ перечитується лише
+    після зовнішньої зміни. Реєстр open() тримає сховища слабкими
+    посиланнями: сховище живе, доки ним користується хоча б один репозиторій.
+    Секції та їхні індекси не потокобезпечні, тому репозиторії виконують
+    кожне читання та зміну цілком під lock.
+    """
+
+    _stores: 'weakref.WeakValueDictionary[str, DataStore]' = weakref.WeakValueDictionary()
+    _stores_lock = threading.Lock()
+
+    @classmethod
+    def open(cls, data_file: str = "data/data.json") -> 'DataStore':
+        """Повертає спільне сховище для файлу даних"""
+        key = os.path.abspath(data_file)
+        with cls._stores_lock:
+            store = cls._stores.get(key)
+            if store is None:
+                store = cls._stores[key] = cls(data_file)
+            return store
+
+    def __init__(self, data_file: str = "data/data.json"):
+        self.data_file = data_file
+        self.lock = threading.RLock()
+        self._fingerprint: Optional[tuple] = None
+        self._document: dict = {}
+        self._sections: Dict[str, IndexedSection] = {}
+        self._pending = set()
+        self._depth = 0
+        self.hits = 0
+        self.misses = 0
+        self._ensure_data_file_exists()
+
+    def _ensure_data_file_exists(self):
+        """Створює файл даних, якщо він не існує"""
+        os.makedirs(os.path.dirname(self.data_file) or '.', exist_ok=True)
+        if not os.path.exists(self.data_file):
+            with open(self.data_file, 'w', encoding='utf-8') as f:
+                json.dump({"tasks": [], "members": []}, f, ensure_ascii=False, indent=2)
+
+    def _stat(self) -> Optional[tuple]:
+        """Повертає відбиток стану файлу або None, якщо файлу немає"""
+        try:
+            stat = os.stat(self.data_file)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _refresh(self) -> None:
+        """Перечитує документ, якщо файл змінився з моменту останнього читання"""
+        fingerprint = self._stat()
+        if fingerprint is not None and fingerprint == self._fingerprint:
+            self.hits += 1
+            return
+        self.misses += 1
+        self._sections = {}
+        self._fingerprint = None
+        try:
+            with open(self.data_file, 'r', encoding='utf-8') as f:
+                self._document = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._document = {}
+            return
+        self._fingerprint = fingerprint
+
+    def section(self, name: str, factory: Callable[[dict], object]) -> IndexedSection:
+        """Повертає сутності секції з її індексами.
+
+        Секція спільна для всіх репозиторіїв файлу, тому після її зміни
+        потрібно викликати save() для цієї секції.
+        """
+        with self.lock:
+            # Усередині deferred() документ не перечитується, щоб не втратити
+            # ще не записані зміни
+            if self._depth == 0 or self._fingerprint is None:
+                self._refresh()
+            section = self._sections.get(name)
+            if section is None:
+                section = IndexedSection()
+                for item in self._document.get(name, []):
+                    entity = factory(item)
+                    section.entities[entity.id] = entity
+                if self._fingerprint is not None:
+                    self._sections[name] = section
+                    # Записи секції тепер тримають самі сутності (_raw/_saved),
+                    # тож список документа більше не потрібен
+                    self._document[name] = None
+            return section
+
+    def iter_section(self, name: str, factory: Callable[[dict], object]) -> Iterator[object]:
+        """Послідовно повертає сутності секції.
+
+        Якщо секція вже завантажена й актуальна, повертаються копії з пам'яті;
+        інакше записи читаються з файлу потоково, без розбору всього документа
+        і без заповнення кешу.
+        """
+        with self.lock:
+            cached = None
+            if self._depth > 0 or (self._fingerprint is not None and self._fingerprint == self._stat()):
+                cached = self._sections.get(name)
+            if cached is not None:
+                cached = list(cached.entities.values())
+        if cached is not None:
+            for entity in cached:
+                yield copy.copy(entity)
+            return
+        for item in iter_section(self.data_file, name):
+            yield factory(item)
+
+    def save(self, name: str) -> None:
+        """Записує секцію у файл або відкладає запис до виходу з deferred()"""
+        with self.lock:
+            self._pending.add(name)
+            if self._depth == 0:
+                self._flush()
+
+    @contextmanager
+    def deferred(self):
+        """Накопичує зміни секцій та записує їх разом одним записом"""
+        with self.lock:
+            self._depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    # Індекси вже змінені, але не записані
+                    self._pending.clear()
+                    self.invalidate()
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                self._flush()
+
+    def _flush(self) -> None:
+        """Атомарно записує документ зі зміненими секціями"""
+        if not self._pending:
+            return
+        if self._fingerprint is None:
+            self._pending.clear()
+            raise ValueError(f"Файл даних {self.data_file} недоступний або пошкоджений")
+        try:
+            # Завантажені секції серіалізуються прямо із сутностей, решта — як прочитано
+            document = {name: items if items is not None else
+                        [entity.to_dict() for entity in self._sections[name].entities.values()]
+                        for name, items in self._document.items()}
+            temp_file = self.data_file + '.tmp'
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(document, f, ensure_ascii=False, indent=2)
+            os.replace(temp_file, self.data_file)
+        except Exception:
+            self.invalidate()
+            raise
+        finally:
+            self._pending.clear()
+        self._fingerprint = self._stat()
+
+    def invalidate(self) -> None:
+        """Скидає розібраний документ; наступне звернення перечитає файл"""
+        with self.lock:
+            self._fingerprint = None
+            self._sections = {}
+
+    def stats(self) -> dict:
+        """Повертає лічильники влучань та промахів кешу документа"""
+        with self.lock:
+            return {'hits': self.hits, 'misses': self.misses, 'sections': len(self._sections)}
@@ -0,0 +1,356 @@
+import bisect
+import copy
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Callable, Dict, Iterable, List, Optional, Set
+from task_planner.bll.models.lazy_record import iso_field
+from task_planner.bll.models.task_query import TaskQuery, tokenize
+from task_planner.bll.models.page import Page, decode_cursor
+
+
+class SectionIndex(ABC):
+    """Вторинний індекс над сутностями секції"""
+
+    @abstractmethod
+    def build(self, entities: Iterable) -> None:
+        pass
+
+    @abstractmethod
+    def add(self, entity) -> None:
+        pass
+
+    @abstractmethod
+    def remove(self, entity) -> None:
+        pass
+
+    def replace(self, old, new) -> None:
+        """Замінює попередню версію сутності новою"""
+        self.remove(old)
+        self.add(new)
+
+
+class IndexedSection:
+    """Сутності секції за id разом із вторинними індексами.
+
+    Індекси будуються під час першого звернення і далі підтримуються
+    при кожному put()/remove(), тому змінювати entities напряму не можна.
+    """
+
+    def __init__(self, entities: Dict[str, object] = None):
+        self.entities: Dict[str, object] = entities if entities is not None else {}
+        self._indexes: Dict[str, SectionIndex] = {}
+
+    def index(self, name: str, factory: Callable[[], SectionIndex]) -> SectionIndex:
+        index = self._indexes.get(name)
+        if index is None:
+            index = factory()
+            index.build(self.entities.values())
+            self._indexes[name] = index
+        return index
+
+    def put(self, entity) -> None:
+        old = self.entities.get(entity.id)
+        self.entities[entity.id] = entity
+        for index in self._indexes.values():
+            if old is not None:
+                index.replace(old, entity)
+            else:
+                index.add(entity)
+
+    def remove(self, id: str):
+        entity = self.entities.pop(id, None)
+        if entity is not None:
+            for index in self._indexes.values():
+                index.remove(entity)
+        return entity
+
+
+class AssigneeIndex(SectionIndex):
+    """Індекс виконавець → id його завдань у порядку додавання"""
+
+    def __init__(self):
+        self._task_ids: Dict[str, Dict[str, None]] = {}
+
+    def build(self, entities: Iterable) -> None:
+        for entity in entities:
+            self.add(entity)
+
+    def add(self, task) -> None:
+        if task.assignee_id:
+            self._task_ids.setdefault(task.assignee_id, {})[task.id] = None
+
+    def remove(self, task) -> None:
+        task_ids = self._task_ids.get(task.assignee_id)
+        if task_ids is not None:
+            task_ids.pop(task.id, None)
+            if not task_ids:
+                del self._task_ids[task.assignee_id]
+
+    def get(self, assignee_id: str) -> List[str]:
+        return list(self._task_ids.get(assignee_id, ()))
+
+
+class SortedIndex(SectionIndex):
+    """Відсортований список пар (дата ISO, id) за полем FIELD.
+
+    Дати у форматі ISO впорядковуються так само, як самі дати, тому
+    діапазонні запити та сторінки виконуються бінарним пошуком за O(log n + k).
+    """
+
+    FIELD = None
+
+    def __init__(self):
+        self._keys: List[tuple] = []
+
+    def _accepts(self, entity) -> bool:
+        return True
+
+    def key(self, entity) -> tuple:
+        return iso_field(entity, self.FIELD), entity.id
+
+    def build(self, entities: Iterable) -> None:
+        self._keys = sorted(self.key(entity) for entity in entities if self._accepts(entity))
+
+    def add(self, entity) -> None:
+        if self._accepts(entity):
+            bisect.insort(self._keys, self.key(entity))
+
+    def remove(self, entity) -> None:
+        key = self.key(entity)
+        position = bisect.bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            del self._keys[position]
+
+    def after(self, key: Optional[tuple], size: int) -> List[tuple]:
+        """Повертає до size ключів, що йдуть строго після key (з початку, якщо key None)"""
+        low = 0 if key is None else bisect.bisect_right(self._keys, key)
+        return self._keys[low:low + size]
+
+
+class CreatedDateIndex(SortedIndex):
+    """Індекс сутностей за датою створення"""
+
+    FIELD = 'created_date'
+
+
+class DeadlineIndex(SortedIndex):
+    """Індекс завдань за дедлайном"""
+
+    FIELD = 'deadline'
+
+    def between(self, start: Optional[date], end: Optional[date]) -> List[str]:
+        """Повертає id завдань з дедлайном у межах [start, end]; None знімає межу"""
+        low = 0 if start is None else bisect.bisect_left(self._keys, (start.isoformat(),))
+        # Рядок з '\0' більший за будь-який ключ дня end, але менший за наступний день
+        high = len(self._keys) if end is None else bisect.bisect_left(self._keys, (end.isoformat() + '\0',))
+        return [task_id for _, task_id in self._keys[low:high]]
+
+    def count_before(self, day: date) -> int:
+        """Повертає кількість завдань з дедлайном раніше за day"""
+        return bisect.bisect_left(self._keys, (day.isoformat(),))
+
+    def before(self, day: date) -> List[str]:
+        """Повертає id завдань з дедлайном раніше за day"""
+        high = bisect.bisect_left(self._keys, (day.isoformat(),))
+        return [task_id for _, task_id in self._keys[:high]]
+
+
+class PendingDeadlineIndex(DeadlineIndex):
+    """Індекс дедлайнів лише незавершених завдань для пошуку прострочених"""
+
+    def _accepts(self, task) -> bool:
+        return not task.is_completed
+
+
+class StatusCounters(SectionIndex):
+    """Лічильники завдань за статусом, що змінюються разом із секцією"""
+
+    def __init__(self):
+        self.total = 0
+        self.completed = 0
+
+    def build(self, entities: Iterable) -> None:
+        for entity in entities:
+            self.add(entity)
+
+    def add(self, task) -> None:
+        self.total += 1
+        if task.is_completed:
+            self.completed += 1
+
+    def remove(self, task) -> None:
+        self.total -= 1
+        if task.is_completed:
+            self.completed -= 1
+
+
+class UniqueIndex(SectionIndex):
+    """Хеш-індекс унікального поля FIELD: значення → id сутності"""
+
+    FIELD = None
+
+    def __init__(self):
+        self._ids: Dict[str, str] = {}
+
+    def build(self, entities: Iterable) -> None:
+        for entity in entities:
+            self.add(entity)
+
+    def add(self, entity) -> None:
+        self._ids[getattr(entity, self.FIELD)] = entity.id
+
+    def remove(self, entity) -> None:
+        value = getattr(entity, self.FIELD)
+        if self._ids.get(value) == entity.id:
+            del self._ids[value]
+
+    def find(self, value: str) -> Optional[str]:
+        """Повертає id сутності із заданим значенням поля або None"""
+        return self._ids.get(value)
+
+    def conflicts(self, entity) -> bool:
+        """Перевіряє, чи зайняте значення поля іншою сутністю"""
+        owner = self._ids.get(getattr(entity, self.FIELD))
+        return owner is not None and owner != entity.id
+
+
+class TitleIndex(UniqueIndex):
+    """Унікальні назви завдань"""
+
+    FIELD = 'title'
+
+
+class NameIndex(UniqueIndex):
+    """Унікальні імена членів команди"""
+
+    FIELD = 'name'
+
+
+class InsertionOrder(SectionIndex):
+    """Позиції сутностей у порядку зберігання; оновлення не змінює позицію"""
+
+    def __init__(self):
+        self._positions: Dict[str, int] = {}
+        self._counter = 0
+
+    def build(self, entities: Iterable) -> None:
+        for entity in entities:
+            self.add(entity)
+
+    def add(self, entity) -> None:
+        self._positions[entity.id] = self._counter
+        self._counter += 1
+
+    def remove(self, entity) -> None:
+        self._positions.pop(entity.id, None)
+
+    def replace(self, old, new) -> None:
+        pass
+
+    def position(self, id: str) -> int:
+        return self._positions[id]
+
+
+class TextIndex(SectionIndex):
+    """Інвертований індекс слів назви та опису завдань.
+
+    Слова зберігаються також у відсортованому списку, тож пошук за
+    префіксом займає O(log n) плюс розмір знайдених списків.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Set[str]] = {}
+        self._terms: List[str] = []
+
+    @staticmethod
+    def _tokens(task) -> Set[str]:
+        return set(tokenize(f"{task.title} {task.description}"))
+
+    def build(self, entities: Iterable) -> None:
+        # Список слів сортується один раз, а не вставкою для кожного нового слова
+        for task in entities:
+            for token in self._tokens(task):
+                self._postings.setdefault(token, set()).add(task.id)
+        self._terms = sorted(self._postings)
+
+    def add(self, task) -> None:
+        for token in self._tokens(task):
+            task_ids = self._postings.get(token)
+            if task_ids is None:
+                task_ids = self._postings[token] = set()
+                bisect.insort(self._terms, token)
+            task_ids.add(task.id)
+
+    def remove(self, task) -> None:
+        for token in self._tokens(task):
+            task_ids = self._postings.get(token)
+            if task_ids is None:
+                continue
+            task_ids.discard(task.id)
+            if not task_ids:
+                del self._postings[token]
+                del self._terms[bisect.bisect_left(self._terms, token)]
+
+    def replace(self, old, new) -> None:
+        if old.title != new.title or old.description != new.description:
+            self.remove(old)
+            self.add(new)
+
+    def _matching(self, prefix: str) -> Set[str]:
+        """Повертає id завдань, що містять слово з префіксом prefix"""
+        found = set()
+        position = bisect.bisect_left(self._terms, prefix)
+        while position < len(self._terms) and self._terms[position].startswith(prefix):
+            found |= self._postings[self._terms[position]]
+            position += 1
+        return found
+
+    def search(self, query: str) -> Set[str]:
+        """Повертає id завдань, що містять усі слова запиту як префікси слів"""
+        result = None
+        # Довші префікси вибірковіші, тож перетин починаємо з них
+        for term in sorted(set(tokenize(query)), key=len, reverse=True):
+            found = self._matching(term)
+            result = found if result is None else result & found
+            if not result:
+                break
+        return result or set()
+
+
+def select_tasks(section: IndexedSection, query: TaskQuery) -> List:
+    """Виконує TaskQuery над секцією завдань.
+
+    Кандидати беруться з найвужчого доречного індексу (текст, виконавець,
+    дедлайн), після чого решта умов перевіряється лише для них. Якщо
+    жоден індекс не підходить, секція переглядається в порядку зберігання.
+    """
+    candidates = []
+    if query.text:
+        candidates.append(section.index('text', TextIndex).search(query.text))
+    if query.assignee_id is not None:
+        candidates.append(section.index('assignee', AssigneeIndex).get(query.assignee_id))
+    if query.status == 'overdue':
+        candidates.append(section.index('pending_deadline', PendingDeadlineIndex).before(query.overdue_before))
+    elif query.due_from or query.due_to:
+        candidates.append(section.index('deadline', DeadlineIndex).between(query.due_from, query.due_to))
+
+    if not candidates:
+        tasks = [task for task in section.entities.values() if query.matches(task)]
+    else:
+        task_ids = min(candidates, key=len)
+        tasks = [section.entities[task_id] for task_id in task_ids]
+        tasks = [task for task in tasks if query.matches(task)]
+        order = section.index('order', InsertionOrder)
+        tasks.sort(key=lambda task: order.position(task.id))
+    return query.page(tasks)
+
+
+_ORDER_INDEXES = {'deadline': DeadlineIndex, 'created_date': CreatedDateIndex}
+
+
+def page_section(section: IndexedSection, order_by: str, after: Optional[str], size: int) -> Page:
+    """Повертає сторінку копій сутностей секції, що йдуть після курсора after"""
+    index = section.index(order_by, _ORDER_INDEXES[order_by])
+    keys = index.after(decode_cursor(after) if after else None, size + 1)
+    items = [copy.copy(section.entities[id]) for _, id in keys]
+    return Page.from_keys(items, keys, size)
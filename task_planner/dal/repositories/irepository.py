@@ -1,5 +1,15 @@
+import heapq
 from abc import ABC, abstractmethod
-from typing import List, Optional, TypeVar, Generic
+from contextlib import contextmanager
+from datetime import date
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, TypeVar, Generic
+
+if TYPE_CHECKING:
+    # Лише для анотацій: пакет bll під час імпорту сам імпортує цей модуль через сервіси
+    from task_planner.bll.models.page import Page
+    from task_planner.bll.models.task import Task
+    from task_planner.bll.models.team_member import TeamMember
+    from task_planner.bll.models.task_query import TaskQuery
 
 T = TypeVar('T')
 
@@ -13,6 +23,39 @@ class IRepository(Generic[T], ABC):
     def get_all(self) -> List[T]:
         pass
 
+    def iter_all(self) -> Iterator[T]:
+        return iter(self.get_all())
+
+    def get_many(self, ids: Iterable[str]) -> List[T]:
+        """Повертає наявні сутності із заданими id (відсутні пропускаються).
+
+        Типова реалізація звертається до get_by_id для кожного id; сховища,
+        де це окремий запит, перевизначають її одним пакетним читанням.
+        """
+        entities = (self.get_by_id(id) for id in dict.fromkeys(ids))
+        return [entity for entity in entities if entity is not None]
+
+    def page(self, after: Optional[str] = None, size: int = 50, order_by: str = 'created_date') -> 'Page[T]':
+        """Повертає сторінку сутностей, впорядкованих за (order_by, id), після курсора after.
+
+        Типова реалізація переглядає всі сутності, але тримає в пам'яті
+        лише size + 1 найменших.
+        """
+        # Моделі bll імпортуються під час виклику: пакет bll сам імпортує
+        # цей модуль через сервіси
+        from task_planner.bll.models.lazy_record import iso_field
+        from task_planner.bll.models.page import Page, decode_cursor
+
+        Page.check(order_by, size)
+        cursor = decode_cursor(after) if after else None
+
+        def key(entity) -> tuple:
+            return iso_field(entity, order_by), entity.id
+
+        candidates = (entity for entity in self.iter_all() if cursor is None or key(entity) > cursor)
+        entities = heapq.nsmallest(size + 1, candidates, key=key)
+        return Page.from_keys(entities, [key(entity) for entity in entities], size)
+
     @abstractmethod
     def add(self, entity: T) -> None:
         pass
@@ -27,4 +70,79 @@ class IRepository(Generic[T], ABC):
 
     @abstractmethod
     def exists(self, id: str) -> bool:
-        pass
\ No newline at end of file
+        pass
+
+    def add_many(self, entities: Iterable[T]) -> None:
+        with self.batch():
+            for entity in entities:
+                self.add(entity)
+
+    def update_many(self, entities: Iterable[T]) -> None:
+        with self.batch():
+            for entity in entities:
+                self.update(entity)
+
+    def delete_many(self, ids: Iterable[str]) -> None:
+        with self.batch():
+            for id in ids:
+                self.delete(id)
+
+    @contextmanager
+    def batch(self):
+        """Групує зміни всередині блоку в одну операцію запису сховища"""
+        yield
+
+
+class ITaskRepository(IRepository['Task']):
+    """Репозиторій завдань із запитами, на які спираються сервіси"""
+
+    def find(self, query: 'TaskQuery') -> List['Task']:
+        """Виконує специфікацію вибірки TaskQuery.
+
+        Типові реалізації цього та наступних запитів перебирають усі завдання;
+        сховища з індексами перевизначають їх власним виконанням запитів.
+        """
+        return query.apply(self.iter_all())
+
+    def get_by_assignee(self, member_id: str) -> List['Task']:
+        """Повертає завдання виконавця в порядку зберігання"""
+        return [task for task in self.iter_all() if task.assignee_id == member_id]
+
+    def get_tasks_due_between(self, start: date, end: date) -> List['Task']:
+        """Повертає завдання з дедлайном у межах [start, end], впорядковані за (deadline, id)"""
+        tasks = [task for task in self.iter_all() if start <= task.deadline <= end]
+        return sorted(tasks, key=lambda task: (task.deadline, task.id))
+
+    def get_overdue_tasks(self, as_of: date) -> List['Task']:
+        """Повертає невиконані завдання з дедлайном до as_of, впорядковані за (deadline, id)"""
+        tasks = [task for task in self.iter_all() if task.is_overdue(as_of)]
+        return sorted(tasks, key=lambda task: (task.deadline, task.id))
+
+    def get_stats(self, as_of: date) -> Dict[str, int]:
+        """Повертає кількість усіх, виконаних, активних та прострочених завдань"""
+        total = completed = overdue = 0
+        for task in self.iter_all():
+            total += 1
+            completed += task.is_completed
+            overdue += task.is_overdue(as_of)
+        return {'total': total, 'completed': completed, 'pending': total - completed, 'overdue': overdue}
+
+    def search(self, query: str, limit: Optional[int] = None) -> List['Task']:
+        """Повертає завдання, у назві чи описі яких є слова з префіксами всіх слів запиту"""
+        from task_planner.bll.models.task_query import TaskQuery, tokenize
+
+        if not tokenize(query):
+            return []
+        return self.find(TaskQuery(text=query, limit=limit))
+
+    def get_by_title(self, title: str) -> Optional['Task']:
+        """Повертає завдання з точно такою назвою або None"""
+        return next((task for task in self.iter_all() if task.title == title), None)
+
+
+class IMemberRepository(IRepository['TeamMember']):
+    """Репозиторій членів команди"""
+
+    def get_by_name(self, name: str) -> Optional['TeamMember']:
+        """Повертає члена команди з точно таким ім'ям або None"""
+        return next((member for member in self.iter_all() if member.name == name), None)
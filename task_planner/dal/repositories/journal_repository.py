@@ -0,0 +1,408 @@
+import copy
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional
+from task_planner.bll.models.task import Task
+from task_planner.bll.models.team_member import TeamMember
+from task_planner.bll.models.lazy_record import LazyTask, LazyTeamMember
+from task_planner.bll.models.task_query import TaskQuery, tokenize
+from task_planner.bll.models.page import Page
+from task_planner.bll.exceptions import DuplicateTaskError, DuplicateMemberError
+from .irepository import ITaskRepository, IMemberRepository
+from .indexes import (
+    IndexedSection, AssigneeIndex, DeadlineIndex, PendingDeadlineIndex, StatusCounters,
+    TitleIndex, NameIndex, select_tasks, page_section
+)
+
+
+class JournalStore:
+    """Сховище з журналом змін, що лише дописується.
+
+    Стан складається з базового знімка (файл у форматі data.json) та журналу
+    записів put/patch/delete поруч із ним. Кожна зміна дописує один рядок у
+    журнал (для завантажених сутностей — лише змінені поля), а коли журнал
+    перевищує поріг, знімок перебудовується у фоновому потоці. Записи блоку
+    batch() потрапляють у журнал лише після його успішного завершення.
+    Репозиторії виконують кожне читання та зміну секцій цілком під lock.
+    """
+
+    FACTORIES = {'tasks': LazyTask._from_storage, 'members': LazyTeamMember._from_storage}
+
+    def __init__(self, data_file: str = "data/data.json",
+                 compaction_threshold: int = 1024 * 1024, fsync: bool = False):
+        self.data_file = data_file
+        self.journal_file = data_file + '.journal'
+        self.compaction_threshold = compaction_threshold
+        self.fsync = fsync
+        self._compacting_file = self.journal_file + '.compacting'
+        self.lock = threading.RLock()
+        self._compaction: Optional[threading.Thread] = None
+        self._depth = 0
+        self._pending: List[str] = []
+        self._undo: List[tuple] = []
+        self.compaction_error: Optional[Exception] = None
+        self._sections: Dict[str, IndexedSection] = {section: IndexedSection() for section in self.FACTORIES}
+
+        os.makedirs(os.path.dirname(self.data_file) or '.', exist_ok=True)
+        self._load_snapshot()
+        self._replay(self._compacting_file)
+        self._replay(self.journal_file)
+        self._journal = open(self.journal_file, 'a', encoding='utf-8')
+
+        # Незавершене ущільнення попереднього запуску доводимо до кінця одразу
+        if os.path.exists(self._compacting_file):
+            self.compact(wait=True)
+
+    def _load_snapshot(self) -> None:
+        """Завантажує базовий знімок"""
+        try:
+            with open(self.data_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        for section, factory in self.FACTORIES.items():
+            entities = self._sections[section].entities
+            for item in data.get(section, []):
+                entity = factory(item)
+                entities[entity.id] = entity
+
+    def _replay(self, path: str) -> None:
+        """Застосовує записи журналу до стану"""
+        try:
+            with open(path, 'rb') as f:
+                content = f.read()
+        except FileNotFoundError:
+            return
+
+        # Обірваний останній запис після аварійного завершення відкидаємо,
+        # щоб наступний запис почався з нового рядка
+        complete = content[:content.rfind(b'\n') + 1]
+        if len(complete) != len(content):
+            with open(path, 'r+b') as f:
+                f.truncate(len(complete))
+
+        for line in complete.decode('utf-8').splitlines():
+            self._apply(json.loads(line))
+
+    def _apply(self, record: dict) -> None:
+        section = self._sections[record['section']]
+        if record['op'] == 'put':
+            section.put(self.FACTORIES[record['section']](record['data']))
+        elif record['op'] == 'patch':
+            current = section.entities.get(record['id'])
+            if current is not None:
+                section.put(self.FACTORIES[record['section']]({**current.to_dict(), **record['data']}))
+        elif record['op'] == 'delete':
+            section.remove(record['id'])
+
+    def _append(self, record: dict) -> None:
+        """Дописує запис у журнал або відкладає його до завершення batch()"""
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        if self._depth > 0:
+            self._pending.append(line)
+            return
+        self._journal.write(line)
+        self._sync()
+
+    def _remember(self, section: str, id: str) -> None:
+        """Запам'ятовує попередню версію сутності для відкату batch()"""
+        if self._depth > 0:
+            self._undo.append((section, id, self._sections[section].entities.get(id)))
+
+    def _sync(self) -> None:
+        self._journal.flush()
+        if self.fsync:
+            os.fsync(self._journal.fileno())
+        if self._journal.tell() >= self.compaction_threshold:
+            self.compact()
+
+    @contextmanager
+    def batch(self):
+        """Записує зміни всього блоку разом; після винятку стан повертається до початку блоку"""
+        with self.lock:
+            self._depth += 1
+            try:
+                yield
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._rollback()
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                self._commit()
+
+    def _commit(self) -> None:
+        lines, self._pending, self._undo = self._pending, [], []
+        if lines:
+            self._journal.write(''.join(lines))
+            self._sync()
+
+    def _rollback(self) -> None:
+        """Відновлює в пам'яті сутності, змінені блоком, і відкидає його записи"""
+        undo, self._pending, self._undo = self._undo, [], []
+        for section, id, previous in reversed(undo):
+            if previous is None:
+                self._sections[section].remove(id)
+            else:
+                self._sections[section].put(previous)
+
+    def section(self, name: str) -> IndexedSection:
+        return self._sections[name]
+
+    def entities(self, name: str) -> Dict[str, object]:
+        return self._sections[name].entities
+
+    def put(self, section: str, entity) -> None:
+        with self.lock:
+            stored = copy.copy(entity)
+            stored._mark_clean()
+            self._remember(section, entity.id)
+            self._sections[section].put(stored)
+            self._append({'op': 'put', 'section': section, 'data': entity.to_dict()})
+
+    def save(self, section: str, entity) -> None:
+        """Записує змінені поля сутності; без відстежених змін — усю сутність"""
+        fields = entity.changed_fields()
+        if fields is None:
+            self.put(section, entity)
+            return
+        if not fields:
+            return
+        data = {name: value for name, value in entity.to_dict().items() if name in fields}
+        record = {'op': 'patch', 'section': section, 'id': entity.id, 'data': data}
+        with self.lock:
+            self._remember(section, entity.id)
+            self._apply(record)
+            self._append(record)
+
+    def delete(self, section: str, id: str) -> None:
+        with self.lock:
+            self._remember(section, id)
+            if self._sections[section].remove(id) is not None:
+                self._append({'op': 'delete', 'section': section, 'id': id})
+
+    def compact(self, wait: bool = False) -> None:
+        """Переносить журнал у новий знімок (у фоновому потоці)"""
+        with self.lock:
+            if self._compaction is not None and self._compaction.is_alive():
+                if wait:
+                    self._compaction.join()
+                return
+
+            # Сутності в стані замінюються, а не змінюються, тож копії списків
+            # достатньо для узгодженого знімка
+            snapshot = {name: list(section.entities.values()) for name, section in self._sections.items()}
+
+            self._journal.close()
+            if os.path.exists(self._compacting_file):
+                with open(self.journal_file, 'r', encoding='utf-8') as src, \
+                        open(self._compacting_file, 'a', encoding='utf-8') as dst:
+                    dst.write(src.read())
+                os.remove(self.journal_file)
+            else:
+                os.replace(self.journal_file, self._compacting_file)
+            self._journal = open(self.journal_file, 'a', encoding='utf-8')
+
+            self._compaction = threading.Thread(target=self._write_snapshot, args=(snapshot,),
+                                                name='journal-compaction', daemon=True)
+            self._compaction.start()
+
+        if wait:
+            self._compaction.join()
+
+    def _write_snapshot(self, snapshot: Dict[str, List]) -> None:
+        temp_file = self.data_file + '.tmp'
+        try:
+            data = {section: [entity.to_dict() for entity in entities]
+                    for section, entities in snapshot.items()}
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.data_file)
+            os.remove(self._compacting_file)
+            self.compaction_error = None
+        except Exception as e:
+            # Журнал ущільнення лишається на диску і буде застосований повторно
+            self.compaction_error = e
+
+    def close(self) -> None:
+        """Дочікується ущільнення та закриває журнал"""
+        with self.lock:
+            compaction = self._compaction
+        if compaction is not None:
+            compaction.join()
+        with self.lock:
+            self._journal.close()
+
+
+class JournalTaskRepository(ITaskRepository):
+    def __init__(self, store: JournalStore):
+        self._store = store
+
+    def get_by_id(self, id: str) -> Optional[Task]:
+        with self._store.lock:
+            task = self._store.entities('tasks').get(id)
+            return copy.copy(task) if task is not None else None
+
+    def get_many(self, ids: Iterable[str]) -> List[Task]:
+        with self._store.lock:
+            entities = self._store.entities('tasks')
+            return [copy.copy(entities[id]) for id in dict.fromkeys(ids) if id in entities]
+
+    def get_all(self) -> List[Task]:
+        with self._store.lock:
+            return [copy.copy(task) for task in self._store.entities('tasks').values()]
+
+    def iter_all(self) -> Iterator[Task]:
+        with self._store.lock:
+            tasks = list(self._store.entities('tasks').values())
+        for task in tasks:
+            yield copy.copy(task)
+
+    def get_by_assignee(self, member_id: str) -> List[Task]:
+        with self._store.lock:
+            section = self._store.section('tasks')
+            task_ids = section.index('assignee', AssigneeIndex).get(member_id)
+            return [copy.copy(section.entities[task_id]) for task_id in task_ids]
+
+    def get_tasks_due_between(self, start: date, end: date) -> List[Task]:
+        with self._store.lock:
+            section = self._store.section('tasks')
+            task_ids = section.index('deadline', DeadlineIndex).between(start, end)
+            return [copy.copy(section.entities[task_id]) for task_id in task_ids]
+
+    def get_overdue_tasks(self, as_of: date) -> List[Task]:
+        with self._store.lock:
+            section = self._store.section('tasks')
+            task_ids = section.index('pending_deadline', PendingDeadlineIndex).before(as_of)
+            return [copy.copy(section.entities[task_id]) for task_id in task_ids]
+
+    def get_stats(self, as_of: date) -> Dict[str, int]:
+        with self._store.lock:
+            section = self._store.section('tasks')
+            counters = section.index('counters', StatusCounters)
+            overdue = section.index('pending_deadline', PendingDeadlineIndex).count_before(as_of)
+            return {
+                'total': counters.total,
+                'completed': counters.completed,
+                'pending': counters.total - counters.completed,
+                'overdue': overdue,
+            }
+
+    def find(self, query: TaskQuery) -> List[Task]:
+        with self._store.lock:
+            return [copy.copy(task) for task in select_tasks(self._store.section('tasks'), query)]
+
+    def page(self, after: Optional[str] = None, size: int = 50, order_by: str = 'deadline') -> Page[Task]:
+        Page.check(order_by, size)
+        with self._store.lock:
+            return page_section(self._store.section('tasks'), order_by, after, size)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Task]:
+        if not tokenize(query):
+            return []
+        return self.find(TaskQuery(text=query, limit=limit))
+
+    def get_by_title(self, title: str) -> Optional[Task]:
+        with self._store.lock:
+            section = self._store.section('tasks')
+            task_id = section.index('title', TitleIndex).find(title)
+            return copy.copy(section.entities[task_id]) if task_id is not None else None
+
+    def _check_title(self, task: Task) -> None:
+        if self._store.section('tasks').index('title', TitleIndex).conflicts(task):
+            raise DuplicateTaskError.by_title(task.title)
+
+    def add(self, task: Task) -> None:
+        with self._store.lock:
+            self._check_title(task)
+            self._store.put('tasks', task)
+            task._mark_clean()
+
+    def update(self, task: Task) -> None:
+        with self._store.lock:
+            if task.id in self._store.entities('tasks'):
+                self._check_title(task)
+                self._store.save('tasks', task)
+                task._mark_clean()
+
+    def delete(self, id: str) -> None:
+        with self._store.lock:
+            self._store.delete('tasks', id)
+
+    def exists(self, id: str) -> bool:
+        with self._store.lock:
+            return id in self._store.entities('tasks')
+
+    def batch(self):
+        return self._store.batch()
+
+
+class JournalMemberRepository(IMemberRepository):
+    def __init__(self, store: JournalStore):
+        self._store = store
+
+    def get_by_id(self, id: str) -> Optional[TeamMember]:
+        with self._store.lock:
+            member = self._store.entities('members').get(id)
+            return copy.copy(member) if member is not None else None
+
+    def get_many(self, ids: Iterable[str]) -> List[TeamMember]:
+        with self._store.lock:
+            entities = self._store.entities('members')
+            return [copy.copy(entities[id]) for id in dict.fromkeys(ids) if id in entities]
+
+    def get_all(self) -> List[TeamMember]:
+        with self._store.lock:
+            return [copy.copy(member) for member in self._store.entities('members').values()]
+
+    def iter_all(self) -> Iterator[TeamMember]:
+        with self._store.lock:
+            members = list(self._store.entities('members').values())
+        for member in members:
+            yield copy.copy(member)
+
+    def page(self, after: Optional[str] = None, size: int = 50,
+             order_by: str = 'created_date') -> Page[TeamMember]:
+        Page.check(order_by, size, orders=('created_date',))
+        with self._store.lock:
+            return page_section(self._store.section('members'), order_by, after, size)
+
+    def get_by_name(self, name: str) -> Optional[TeamMember]:
+        with self._store.lock:
+            section = self._store.section('members')
+            member_id = section.index('name', NameIndex).find(name)
+            return copy.copy(section.entities[member_id]) if member_id is not None else None
+
+    def _check_name(self, member: TeamMember) -> None:
+        if self._store.section('members').index('name', NameIndex).conflicts(member):
+            raise DuplicateMemberError.by_name(member.name)
+
+    def add(self, member: TeamMember) -> None:
+        with self._store.lock:
+            self._check_name(member)
+            self._store.put('members', member)
+            member._mark_clean()
+
+    def update(self, member: TeamMember) -> None:
+        with self._store.lock:
+            if member.id in self._store.entities('members'):
+                self._check_name(member)
+                self._store.save('members', member)
+                member._mark_clean()
+
+    def delete(self, id: str) -> None:
+        with self._store.lock:
+            self._store.delete('members', id)
+
+    def exists(self, id: str) -> bool:
+        with self._store.lock:
+            return id in self._store.entities('members')
+
+    def batch(self):
+        return self._store.batch()
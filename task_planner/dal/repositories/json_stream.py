@@ -0,0 +1,110 @@
+import json
+from typing import Iterator
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+class _StreamReader:
+    """Буфер над текстовим файлом, що дочитує дані порціями"""
+
+    def __init__(self, file, chunk_size: int):
+        self._file = file
+        self._chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Дочитує наступну порцію; повертає False наприкінці файлу"""
+        if self.eof:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Відкидаємо вже розібрану частину, щоб буфер не ріс разом з файлом
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Повертає наступний значущий символ, пропускаючи пробіли"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                raise ValueError("Неочікуваний кінець JSON-документа")
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Очікувався символ '{char}' у позиції {self.pos}")
+        self.pos += 1
+
+    def value(self):
+        """Розбирає одне JSON-значення, дочитуючи файл за потреби"""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # Число на межі порції могло бути розібране не повністю
+            if end == len(self.buffer) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def items(self) -> Iterator:
+        """Послідовно розбирає елементи масиву"""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ',':
+                self.pos += 1
+                continue
+            self.expect(']')
+            return
+
+
+def iter_section(path: str, section: str, chunk_size: int = 64 * 1024) -> Iterator[dict]:
+    """Послідовно повертає записи секції документа data.json.
+
+    Документ розбирається порціями, тож у пам'яті одночасно перебуває
+    лише один запис, а не весь файл.
+    """
+    try:
+        f = open(path, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        return
+    with f:
+        reader = _StreamReader(f, chunk_size)
+        try:
+            reader.expect('{')
+            if reader.peek() == '}':
+                return
+            while True:
+                key = reader.value()
+                reader.expect(':')
+                if key == section:
+                    yield from reader.items()
+                    return
+                if reader.peek() == '[':
+                    # Інші секції пропускаємо поелементно, не тримаючи їх у пам'яті
+                    for _ in reader.items():
+                        pass
+                else:
+                    reader.value()
+                if reader.peek() != ',':
+                    return
+                reader.pos += 1
+        except (ValueError, json.JSONDecodeError):
+            # Пошкоджений файл поводиться як порожній, так само як get_all()
+            return
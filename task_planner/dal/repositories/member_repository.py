@@ -1,67 +1,129 @@
-import json
-import os
-from typing import List, Optional
+import copy
+from typing import Iterable, Iterator, List, Optional
 from task_planner.bll.models.team_member import TeamMember
-from .irepository import IRepository
+from task_planner.bll.models.lazy_record import LazyTeamMember
+from task_planner.bll.models.page import Page
+from task_planner.bll.exceptions import DuplicateMemberError
+from .irepository import IMemberRepository
+from .data_store import DataStore
+from .indexes import IndexedSection, NameIndex, page_section
 
 
-class MemberRepository(IRepository[TeamMember]):
-    def __init__(self, data_file: str = "data/data.json"):
-        self.data_file = data_file
-        self._ensure_data_file_exists()
+class MemberRepository(IMemberRepository):
+    def __init__(self, data_file: str = "data/data.json", store: DataStore = None):
+        self._store = store or DataStore.open(data_file)
+        self.data_file = self._store.data_file
 
-    def _ensure_data_file_exists(self):
-        """Створює файл даних, якщо він не існує"""
-        os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
-        if not os.path.exists(self.data_file):
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump({"tasks": [], "members": []}, f, ensure_ascii=False, indent=2)
+    def _section(self) -> IndexedSection:
+        """Повертає членів команди файлу даних разом з індексами"""
+        return self._store.section('members', LazyTeamMember._from_storage)
 
     def get_by_id(self, id: str) -> Optional[TeamMember]:
-        members = self.get_all()
-        return next((member for member in members if member.id == id), None)
+        with self._store.lock:
+            member = self._section().entities.get(id)
+            return copy.copy(member) if member is not None else None
+
+    def get_many(self, ids: Iterable[str]) -> List[TeamMember]:
+        """Повертає копії сутностей за id з однієї перевірки актуальності файлу"""
+        with self._store.lock:
+            entities = self._section().entities
+            return [copy.copy(entities[id]) for id in dict.fromkeys(ids) if id in entities]
 
     def get_all(self) -> List[TeamMember]:
-        try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return [TeamMember.from_dict(member_data) for member_data in data.get('members', [])]
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
+        with self._store.lock:
+            return [copy.copy(member) for member in self._section().entities.values()]
+
+    def iter_all(self) -> Iterator[TeamMember]:
+        """Послідовно читає членів команди, не завантажуючи весь файл у пам'ять"""
+        return self._store.iter_section('members', LazyTeamMember._from_storage)
+
+    def page(self, after: Optional[str] = None, size: int = 50,
+             order_by: str = 'created_date') -> Page[TeamMember]:
+        """Повертає сторінку членів команди за датою створення"""
+        Page.check(order_by, size, orders=('created_date',))
+        with self._store.lock:
+            return page_section(self._section(), order_by, after, size)
+
+    def get_by_name(self, name: str) -> Optional[TeamMember]:
+        with self._store.lock:
+            section = self._section()
+            member_id = section.index('name', NameIndex).find(name)
+            return copy.copy(section.entities[member_id]) if member_id is not None else None
+
+    @staticmethod
+    def _put(section: IndexedSection, member: TeamMember) -> None:
+        """Зберігає копію члена команди в секції, перевіряючи унікальність імені за індексом"""
+        if section.index('name', NameIndex).conflicts(member):
+            raise DuplicateMemberError.by_name(member.name)
+        stored = copy.copy(member)
+        stored._mark_clean()
+        section.put(stored)
 
     def add(self, member: TeamMember) -> None:
-        members = self.get_all()
-        members.append(member)
-        self._save_all(members)
+        with self._store.lock:
+            self._put(self._section(), member)
+            self._save_all()
+            member._mark_clean()
 
     def update(self, member: TeamMember) -> None:
-        members = self.get_all()
-        for i, existing_member in enumerate(members):
-            if existing_member.id == member.id:
-                members[i] = member
-                break
-        self._save_all(members)
+        # Сутність без змін після завантаження не перезаписує файл
+        if not member.is_dirty():
+            return
+        with self._store.lock:
+            section = self._section()
+            if member.id in section.entities:
+                self._put(section, member)
+            self._save_all()
+            member._mark_clean()
 
     def delete(self, id: str) -> None:
-        members = [member for member in self.get_all() if member.id != id]
-        self._save_all(members)
+        with self._store.lock:
+            self._section().remove(id)
+            self._save_all()
 
-    def exists(self, id: str) -> bool:
-        return self.get_by_id(id) is not None
+    def add_many(self, members: Iterable[TeamMember]) -> None:
+        members = list(members)
+        with self._store.lock:
+            # Якщо одне з імен зайняте, deferred() відкидає вже внесені зміни
+            with self._store.deferred():
+                section = self._section()
+                for member in members:
+                    self._put(section, member)
+            self._save_all()
+            for member in members:
+                member._mark_clean()
 
-    def _save_all(self, members: List[TeamMember]) -> None:
-        """Зберігає всіх членів команди у файл"""
-        try:
-            # Спочатку завантажуємо поточні дані
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+    def update_many(self, members: Iterable[TeamMember]) -> None:
+        members = [member for member in members if member.is_dirty()]
+        if not members:
+            return
+        with self._store.lock:
+            with self._store.deferred():
+                section = self._section()
+                for member in members:
+                    if member.id in section.entities:
+                        self._put(section, member)
+            self._save_all()
+            for member in members:
+                member._mark_clean()
+
+    def delete_many(self, ids: Iterable[str]) -> None:
+        with self._store.lock:
+            section = self._section()
+            for id in ids:
+                section.remove(id)
+            self._save_all()
 
-            # Оновлюємо тільки членів команди
-            data['members'] = [member.to_dict() for member in members]
+    def exists(self, id: str) -> bool:
+        with self._store.lock:
+            return id in self._section().entities
 
-            # Зберігаємо оновлені дані
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+    def batch(self):
+        return self._store.deferred()
 
+    def _save_all(self) -> None:
+        """Зберігає всіх членів команди у файл"""
+        try:
+            self._store.save('members')
         except Exception as e:
             raise RuntimeError(f"Помилка збереження членів команди: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,511 @@
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional
+from task_planner.bll.models.task import Task
+from task_planner.bll.models.team_member import TeamMember
+from task_planner.bll.models.lazy_record import LazyTask, LazyTeamMember
+from task_planner.bll.models.task_query import TaskQuery, tokenize
+from task_planner.bll.models.page import Page, decode_cursor
+from task_planner.bll.exceptions import DuplicateTaskError, DuplicateMemberError
+from .irepository import ITaskRepository, IMemberRepository
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    deadline TEXT NOT NULL,
+    assignee_id TEXT,
+    is_completed INTEGER NOT NULL DEFAULT 0,
+    created_date TEXT NOT NULL,
+    updated_date TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_tasks_title ON tasks(title);
+CREATE INDEX IF NOT EXISTS idx_tasks_assignee_id ON tasks(assignee_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_deadline ON tasks(deadline);
+CREATE INDEX IF NOT EXISTS idx_tasks_is_completed ON tasks(is_completed);
+CREATE INDEX IF NOT EXISTS idx_tasks_deadline_id ON tasks(deadline, id);
+CREATE INDEX IF NOT EXISTS idx_tasks_created_date_id ON tasks(created_date, id);
+CREATE INDEX IF NOT EXISTS idx_tasks_pending_deadline ON tasks(deadline) WHERE is_completed = 0;
+
+CREATE TABLE IF NOT EXISTS members (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    role TEXT NOT NULL,
+    task_ids TEXT NOT NULL DEFAULT '[]',
+    created_date TEXT NOT NULL,
+    updated_date TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_members_name ON members(name);
+CREATE INDEX IF NOT EXISTS idx_members_created_date_id ON members(created_date, id);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Позначка в meta про вже виконане перенесення даних з data.json
+JSON_MIGRATED = 'json_migrated'
+
+
+# Повнотекстовий індекс назв та описів, який тригери синхронізують з таблицею tasks
+SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+    title, description, content='tasks', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 0'
+);
+CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+    INSERT INTO tasks_fts(rowid, title, description) VALUES (new.rowid, new.title, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+    INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+    VALUES ('delete', old.rowid, old.title, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN
+    INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+    VALUES ('delete', old.rowid, old.title, old.description);
+    INSERT INTO tasks_fts(rowid, title, description) VALUES (new.rowid, new.title, new.description);
+END;
+"""
+
+# Лічильники завдань в одному рядку, які тригери змінюють разом із таблицею tasks
+STATS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS task_counters (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    total INTEGER NOT NULL,
+    completed INTEGER NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS task_counters_insert AFTER INSERT ON tasks BEGIN
+    UPDATE task_counters SET total = total + 1, completed = completed + new.is_completed;
+END;
+CREATE TRIGGER IF NOT EXISTS task_counters_delete AFTER DELETE ON tasks BEGIN
+    UPDATE task_counters SET total = total - 1, completed = completed - old.is_completed;
+END;
+CREATE TRIGGER IF NOT EXISTS task_counters_update AFTER UPDATE OF is_completed ON tasks BEGIN
+    UPDATE task_counters SET completed = completed - old.is_completed + new.is_completed;
+END;
+"""
+
+TASK_COLUMNS = ('id', 'title', 'description', 'deadline', 'assignee_id',
+                'is_completed', 'created_date', 'updated_date')
+MEMBER_COLUMNS = ('id', 'name', 'role', 'task_ids', 'created_date', 'updated_date')
+
+
+class SqliteDatabase:
+    """Спільне з'єднання SQLite (WAL) для репозиторіїв завдань і членів команди"""
+
+    def __init__(self, db_file: str = "data/data.db"):
+        self.db_file = db_file
+        if db_file != ':memory:':
+            os.makedirs(os.path.dirname(db_file) or '.', exist_ok=True)
+        self.lock = threading.RLock()
+        self._depth = 0
+        self.connection = sqlite3.connect(db_file, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        # Сортування за назвою без урахування регістру так само, як у JSON-сховищі
+        self.connection.create_function('casefold', 1, str.casefold, deterministic=True)
+        self.connection.executescript(SCHEMA)
+        has_search_index = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'").fetchone() is not None
+        self.connection.executescript(SEARCH_SCHEMA)
+        if not has_search_index:
+            # База, створена до появи індексу, індексується один раз
+            self.connection.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+            self.connection.commit()
+        self.connection.executescript(STATS_SCHEMA)
+        # Базу, створену до появи лічильників, підраховуємо один раз
+        self.connection.execute(
+            "INSERT OR IGNORE INTO task_counters (id, total, completed) "
+            "SELECT 1, COUNT(*), COALESCE(SUM(is_completed), 0) FROM tasks")
+        self.connection.commit()
+
+    @contextmanager
+    def transaction(self):
+        """Транзакція на спільному з'єднанні; вкладені блоки фіксуються разом із зовнішнім"""
+        with self.lock:
+            self._depth += 1
+            try:
+                yield self.connection
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    self.connection.rollback()
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                self.connection.commit()
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+
+def _task_data(task: Task) -> dict:
+    data = task.to_dict()
+    data['is_completed'] = int(data['is_completed'])
+    return data
+
+
+def _member_data(member: TeamMember) -> dict:
+    data = member.to_dict()
+    data['task_ids'] = json.dumps(data['task_ids'])
+    return data
+
+
+def _task_row(task: Task) -> tuple:
+    data = _task_data(task)
+    return tuple(data[column] for column in TASK_COLUMNS)
+
+
+def _member_row(member: TeamMember) -> tuple:
+    data = _member_data(member)
+    return tuple(data[column] for column in MEMBER_COLUMNS)
+
+
+def _upsert_sql(table: str, columns: tuple) -> str:
+    assignments = ', '.join(f"{column} = excluded.{column}" for column in columns[1:])
+    return (f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)}) "
+            f"ON CONFLICT(id) DO UPDATE SET {assignments}")
+
+
+def _update_sql(table: str, columns: tuple) -> str:
+    assignments = ', '.join(f"{column} = ?" for column in columns[1:])
+    return f"UPDATE {table} SET {assignments} WHERE id = ?"
+
+
+def _update_statement(table: str, columns: tuple, entity, to_data) -> Optional[tuple]:
+    """Повертає (sql, params) для UPDATE лише змінених стовпців або None, якщо змін немає"""
+    fields = entity.changed_fields()
+    if fields is not None:
+        columns = columns[:1] + tuple(column for column in columns[1:] if column in fields)
+        if len(columns) == 1:
+            return None
+    data = to_data(entity)
+    return _update_sql(table, columns), tuple(data[column] for column in columns[1:]) + (entity.id,)
+
+
+def _select_by_ids(connection: sqlite3.Connection, table: str, ids: Iterable[str]) -> List[sqlite3.Row]:
+    """Читає рядки за списком id запитами WHERE id IN (...) порціями по 500"""
+    ids = list(dict.fromkeys(ids))
+    rows = []
+    for start in range(0, len(ids), 500):
+        chunk = ids[start:start + 500]
+        rows.extend(connection.execute(
+            f"SELECT * FROM {table} WHERE id IN ({', '.join('?' for _ in chunk)})", chunk).fetchall())
+    return rows
+
+
+def _select_page(connection: sqlite3.Connection, table: str, order_by: str,
+                 after: Optional[str], size: int) -> List[sqlite3.Row]:
+    """Читає size + 1 рядків після курсора за складеним індексом (order_by, id)"""
+    sql, params = f"SELECT * FROM {table}", []
+    if after:
+        sql += f" WHERE ({order_by}, id) > (?, ?)"
+        params.extend(decode_cursor(after))
+    sql += f" ORDER BY {order_by}, id LIMIT ?"
+    params.append(size + 1)
+    return connection.execute(sql, params).fetchall()
+
+
+class SqliteTaskRepository(ITaskRepository):
+    _UPSERT = _upsert_sql('tasks', TASK_COLUMNS)
+
+    def __init__(self, database: SqliteDatabase):
+        self._db = database
+
+    @staticmethod
+    def _to_task(row: sqlite3.Row) -> Task:
+        data = dict(row)
+        data['is_completed'] = bool(data['is_completed'])
+        return LazyTask._from_storage(data)
+
+    def _write(self, sql: str, params: tuple, task: Task) -> None:
+        try:
+            with self._db.transaction():
+                self._db.connection.execute(sql, params)
+        except sqlite3.IntegrityError:
+            raise DuplicateTaskError.by_title(task.title)
+
+    def get_by_id(self, id: str) -> Optional[Task]:
+        with self._db.lock:
+            row = self._db.connection.execute("SELECT * FROM tasks WHERE id = ?", (id,)).fetchone()
+        return self._to_task(row) if row is not None else None
+
+    def get_many(self, ids: Iterable[str]) -> List[Task]:
+        with self._db.lock:
+            rows = _select_by_ids(self._db.connection, 'tasks', ids)
+        return [self._to_task(row) for row in rows]
+
+    def get_all(self) -> List[Task]:
+        with self._db.lock:
+            rows = self._db.connection.execute("SELECT * FROM tasks ORDER BY rowid").fetchall()
+        return [self._to_task(row) for row in rows]
+
+    def iter_all(self) -> Iterator[Task]:
+        with self._db.lock:
+            cursor = self._db.connection.execute("SELECT * FROM tasks ORDER BY rowid")
+        while True:
+            with self._db.lock:
+                rows = cursor.fetchmany(500)
+            if not rows:
+                return
+            for row in rows:
+                yield self._to_task(row)
+
+    def get_by_assignee(self, member_id: str) -> List[Task]:
+        with self._db.lock:
+            rows = self._db.connection.execute(
+                "SELECT * FROM tasks WHERE assignee_id = ? ORDER BY rowid", (member_id,)).fetchall()
+        return [self._to_task(row) for row in rows]
+
+    def get_tasks_due_between(self, start: date, end: date) -> List[Task]:
+        with self._db.lock:
+            rows = self._db.connection.execute(
+                "SELECT * FROM tasks WHERE deadline BETWEEN ? AND ? ORDER BY deadline, id",
+                (start.isoformat(), end.isoformat())).fetchall()
+        return [self._to_task(row) for row in rows]
+
+    def get_overdue_tasks(self, as_of: date) -> List[Task]:
+        with self._db.lock:
+            rows = self._db.connection.execute(
+                "SELECT * FROM tasks WHERE is_completed = 0 AND deadline < ? ORDER BY deadline, id",
+                (as_of.isoformat(),)).fetchall()
+        return [self._to_task(row) for row in rows]
+
+    def get_stats(self, as_of: date) -> Dict[str, int]:
+        """Повертає лічильники завдань.
+
+        total та completed читаються з рядка task_counters за O(1). Кількість
+        прострочених залежить від as_of, тому рахується діапазоном часткового
+        індексу idx_tasks_pending_deadline: O(log n + k), де k — кількість
+        прострочених завдань, а не O(1).
+        """
+        with self._db.lock:
+            total, completed = self._db.connection.execute(
+                "SELECT total, completed FROM task_counters WHERE id = 1").fetchone()
+            overdue, = self._db.connection.execute(
+                "SELECT COUNT(*) FROM tasks INDEXED BY idx_tasks_pending_deadline "
+                "WHERE is_completed = 0 AND deadline < ?",
+                (as_of.isoformat(),)).fetchone()
+        return {'total': total, 'completed': completed, 'pending': total - completed, 'overdue': overdue}
+
+    def find(self, query: TaskQuery) -> List[Task]:
+        """Виконує запит одним SELECT з умовами WHERE, ORDER BY та LIMIT/OFFSET"""
+        conditions, params = [], []
+        if query.status == 'completed':
+            conditions.append("is_completed = 1")
+        elif query.status in ('pending', 'overdue'):
+            conditions.append("is_completed = 0")
+        if query.status == 'overdue':
+            conditions.append("deadline < ?")
+            params.append(query.overdue_before.isoformat())
+        if query.assignee_id is not None:
+            conditions.append("assignee_id = ?")
+            params.append(query.assignee_id)
+        if query.due_from:
+            conditions.append("deadline >= ?")
+            params.append(query.due_from.isoformat())
+        if query.due_to:
+            conditions.append("deadline <= ?")
+            params.append(query.due_to.isoformat())
+        if query.text:
+            conditions.append("rowid IN (SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?)")
+            params.append(' '.join(f'"{term}"*' for term in query.terms))
+
+        sql = "SELECT * FROM tasks"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        order = {'deadline': "deadline", 'title': "casefold(title)", 'created_date': "created_date"}
+        if query.sort_by is not None:
+            sql += f" ORDER BY {order[query.sort_by]} {'DESC' if query.descending else 'ASC'}, rowid"
+        else:
+            sql += " ORDER BY rowid"
+        sql += " LIMIT ? OFFSET ?"
+        params.extend([-1 if query.limit is None else query.limit, query.offset])
+
+        with self._db.lock:
+            rows = self._db.connection.execute(sql, params).fetchall()
+        return [self._to_task(row) for row in rows]
+
+    def page(self, after: Optional[str] = None, size: int = 50, order_by: str = 'deadline') -> Page[Task]:
+        Page.check(order_by, size)
+        with self._db.lock:
+            rows = _select_page(self._db.connection, 'tasks', order_by, after, size)
+        keys = [(row[order_by], row['id']) for row in rows]
+        return Page.from_keys([self._to_task(row) for row in rows], keys, size)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Task]:
+        if not tokenize(query):
+            return []
+        return self.find(TaskQuery(text=query, limit=limit))
+
+    def get_by_title(self, title: str) -> Optional[Task]:
+        with self._db.lock:
+            row = self._db.connection.execute("SELECT * FROM tasks WHERE title = ?", (title,)).fetchone()
+        return self._to_task(row) if row is not None else None
+
+    def add(self, task: Task) -> None:
+        self._write(self._UPSERT, _task_row(task), task)
+        task._mark_clean()
+
+    def update(self, task: Task) -> None:
+        statement = _update_statement('tasks', TASK_COLUMNS, task, _task_data)
+        if statement is not None:
+            self._write(*statement, task)
+        task._mark_clean()
+
+    def delete(self, id: str) -> None:
+        with self._db.transaction():
+            self._db.connection.execute("DELETE FROM tasks WHERE id = ?", (id,))
+
+    def delete_many(self, ids: Iterable[str]) -> None:
+        with self._db.transaction():
+            self._db.connection.executemany("DELETE FROM tasks WHERE id = ?", ((id,) for id in ids))
+
+    def exists(self, id: str) -> bool:
+        with self._db.lock:
+            row = self._db.connection.execute("SELECT 1 FROM tasks WHERE id = ?", (id,)).fetchone()
+        return row is not None
+
+    def batch(self):
+        return self._db.transaction()
+
+
+class SqliteMemberRepository(IMemberRepository):
+    _UPSERT = _upsert_sql('members', MEMBER_COLUMNS)
+
+    def __init__(self, database: SqliteDatabase):
+        self._db = database
+
+    @staticmethod
+    def _to_member(row: sqlite3.Row) -> TeamMember:
+        data = dict(row)
+        data['task_ids'] = json.loads(data['task_ids'])
+        return LazyTeamMember._from_storage(data)
+
+    def _write(self, sql: str, params: tuple, member: TeamMember) -> None:
+        try:
+            with self._db.transaction():
+                self._db.connection.execute(sql, params)
+        except sqlite3.IntegrityError:
+            raise DuplicateMemberError.by_name(member.name)
+
+    def get_by_id(self, id: str) -> Optional[TeamMember]:
+        with self._db.lock:
+            row = self._db.connection.execute("SELECT * FROM members WHERE id = ?", (id,)).fetchone()
+        return self._to_member(row) if row is not None else None
+
+    def get_many(self, ids: Iterable[str]) -> List[TeamMember]:
+        with self._db.lock:
+            rows = _select_by_ids(self._db.connection, 'members', ids)
+        return [self._to_member(row) for row in rows]
+
+    def get_all(self) -> List[TeamMember]:
+        with self._db.lock:
+            rows = self._db.connection.execute("SELECT * FROM members ORDER BY rowid").fetchall()
+        return [self._to_member(row) for row in rows]
+
+    def iter_all(self) -> Iterator[TeamMember]:
+        with self._db.lock:
+            cursor = self._db.connection.execute("SELECT * FROM members ORDER BY rowid")
+        while True:
+            with self._db.lock:
+                rows = cursor.fetchmany(500)
+            if not rows:
+                return
+            for row in rows:
+                yield self._to_member(row)
+
+    def page(self, after: Optional[str] = None, size: int = 50,
+             order_by: str = 'created_date') -> Page[TeamMember]:
+        Page.check(order_by, size, orders=('created_date',))
+        with self._db.lock:
+            rows = _select_page(self._db.connection, 'members', order_by, after, size)
+        keys = [(row[order_by], row['id']) for row in rows]
+        return Page.from_keys([self._to_member(row) for row in rows], keys, size)
+
+    def get_by_name(self, name: str) -> Optional[TeamMember]:
+        with self._db.lock:
+            row = self._db.connection.execute("SELECT * FROM members WHERE name = ?", (name,)).fetchone()
+        return self._to_member(row) if row is not None else None
+
+    def add(self, member: TeamMember) -> None:
+        self._write(self._UPSERT, _member_row(member), member)
+        member._mark_clean()
+
+    def update(self, member: TeamMember) -> None:
+        statement = _update_statement('members', MEMBER_COLUMNS, member, _member_data)
+        if statement is not None:
+            self._write(*statement, member)
+        member._mark_clean()
+
+    def delete(self, id: str) -> None:
+        with self._db.transaction():
+            self._db.connection.execute("DELETE FROM members WHERE id = ?", (id,))
+
+    def delete_many(self, ids: Iterable[str]) -> None:
+        with self._db.transaction():
+            self._db.connection.executemany("DELETE FROM members WHERE id = ?", ((id,) for id in ids))
+
+    def exists(self, id: str) -> bool:
+        with self._db.lock:
+            row = self._db.connection.execute("SELECT 1 FROM members WHERE id = ?", (id,)).fetchone()
+        return row is not None
+
+    def batch(self):
+        return self._db.transaction()
+
+
+def migrate_json_to_sqlite(json_file: str, database: SqliteDatabase) -> int:
+    """Одноразово переносить дані з data.json у базу SQLite.
+
+    Перенесення позначається в таблиці meta тією ж транзакцією, що й
+    імпорт, тож повторний запуск нічого не робить, навіть якщо всі записи
+    після цього видалено. Повертає кількість перенесених записів; якщо
+    перенесення вже виконано або файлу немає, повертає 0.
+    """
+    if not os.path.exists(json_file):
+        return 0
+
+    with database.lock:
+        connection = database.connection
+        if connection.execute("SELECT 1 FROM meta WHERE key = ?", (JSON_MIGRATED,)).fetchone():
+            return 0
+        has_data = connection.execute(
+            "SELECT EXISTS(SELECT 1 FROM tasks) OR EXISTS(SELECT 1 FROM members)").fetchone()[0]
+        if has_data:
+            # База, заповнена до появи позначки, вважається вже перенесеною
+            with database.transaction():
+                connection.execute("INSERT INTO meta (key, value) VALUES (?, ?)", (JSON_MIGRATED, json_file))
+            return 0
+
+        with open(json_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        # Записи переносяться як є, без повторної валідації моделей
+        tasks = [tuple(int(bool(item.get(column))) if column == 'is_completed' else item.get(column)
+                       for column in TASK_COLUMNS)
+                 for item in data.get('tasks', [])]
+        members = [tuple(json.dumps(item.get(column, [])) if column == 'task_ids' else item.get(column)
+                         for column in MEMBER_COLUMNS)
+                   for item in data.get('members', [])]
+
+        with database.transaction():
+            connection.executemany(
+                f"INSERT INTO tasks ({', '.join(TASK_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in TASK_COLUMNS)})", tasks)
+            connection.executemany(
+                f"INSERT INTO members ({', '.join(MEMBER_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in MEMBER_COLUMNS)})", members)
+            connection.execute("INSERT INTO meta (key, value) VALUES (?, ?)", (JSON_MIGRATED, json_file))
+
+    return len(tasks) + len(members)
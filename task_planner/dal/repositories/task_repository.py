@@ -1,67 +1,175 @@
-import json
-import os
-from typing import List, Optional
+import copy
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional
 from task_planner.bll.models.task import Task
-from .irepository import IRepository
+from task_planner.bll.models.lazy_record import LazyTask
+from task_planner.bll.models.task_query import TaskQuery, tokenize
+from task_planner.bll.models.page import Page
+from task_planner.bll.exceptions import DuplicateTaskError
+from .irepository import ITaskRepository
+from .data_store import DataStore
+from .indexes import IndexedSection, AssigneeIndex, DeadlineIndex, PendingDeadlineIndex, StatusCounters, TitleIndex, select_tasks, page_section
 
 
-class TaskRepository(IRepository[Task]):
-    def __init__(self, data_file: str = "data/data.json"):
-        self.data_file = data_file
-        self._ensure_data_file_exists()
+class TaskRepository(ITaskRepository):
+    def __init__(self, data_file: str = "data/data.json", store: DataStore = None):
+        self._store = store or DataStore.open(data_file)
+        self.data_file = self._store.data_file
 
-    def _ensure_data_file_exists(self):
-        """Створює файл даних, якщо він не існує"""
-        os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
-        if not os.path.exists(self.data_file):
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump({"tasks": [], "members": []}, f, ensure_ascii=False, indent=2)
+    def _section(self) -> IndexedSection:
+        """Повертає завдання файлу даних разом з індексами"""
+        return self._store.section('tasks', LazyTask._from_storage)
 
     def get_by_id(self, id: str) -> Optional[Task]:
-        tasks = self.get_all()
-        return next((task for task in tasks if task.id == id), None)
+        with self._store.lock:
+            task = self._section().entities.get(id)
+            return copy.copy(task) if task is not None else None
+
+    def get_many(self, ids: Iterable[str]) -> List[Task]:
+        """Повертає копії сутностей за id з однієї перевірки актуальності файлу"""
+        with self._store.lock:
+            entities = self._section().entities
+            return [copy.copy(entities[id]) for id in dict.fromkeys(ids) if id in entities]
 
     def get_all(self) -> List[Task]:
-        try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return [Task.from_dict(task_data) for task_data in data.get('tasks', [])]
-        except (FileNotFoundError, json.JSONDecodeError):
+        with self._store.lock:
+            return [copy.copy(task) for task in self._section().entities.values()]
+
+    def iter_all(self) -> Iterator[Task]:
+        """Послідовно читає завдання, не завантажуючи весь файл у пам'ять"""
+        return self._store.iter_section('tasks', LazyTask._from_storage)
+
+    def get_by_assignee(self, member_id: str) -> List[Task]:
+        """Повертає завдання виконавця за індексом, не переглядаючи всі завдання"""
+        with self._store.lock:
+            section = self._section()
+            task_ids = section.index('assignee', AssigneeIndex).get(member_id)
+            return [copy.copy(section.entities[task_id]) for task_id in task_ids]
+
+    def get_tasks_due_between(self, start: date, end: date) -> List[Task]:
+        """Повертає завдання з дедлайном у межах [start, end], впорядковані за дедлайном"""
+        with self._store.lock:
+            section = self._section()
+            task_ids = section.index('deadline', DeadlineIndex).between(start, end)
+            return [copy.copy(section.entities[task_id]) for task_id in task_ids]
+
+    def get_overdue_tasks(self, as_of: date) -> List[Task]:
+        """Повертає незавершені завдання з дедлайном раніше за as_of"""
+        with self._store.lock:
+            section = self._section()
+            task_ids = section.index('pending_deadline', PendingDeadlineIndex).before(as_of)
+            return [copy.copy(section.entities[task_id]) for task_id in task_ids]
+
+    def get_stats(self, as_of: date) -> Dict[str, int]:
+        """Повертає кількість усіх, виконаних, незавершених та прострочених на as_of завдань"""
+        with self._store.lock:
+            section = self._section()
+            counters = section.index('counters', StatusCounters)
+            overdue = section.index('pending_deadline', PendingDeadlineIndex).count_before(as_of)
+            return {
+                'total': counters.total,
+                'completed': counters.completed,
+                'pending': counters.total - counters.completed,
+                'overdue': overdue,
+            }
+
+    def find(self, query: TaskQuery) -> List[Task]:
+        """Виконує запит за індексами секції, не копіюючи завдання, що не підійшли"""
+        with self._store.lock:
+            return [copy.copy(task) for task in select_tasks(self._section(), query)]
+
+    def page(self, after: Optional[str] = None, size: int = 50, order_by: str = 'deadline') -> Page[Task]:
+        """Повертає сторінку завдань за курсором, не копіюючи решту секції"""
+        Page.check(order_by, size)
+        with self._store.lock:
+            return page_section(self._section(), order_by, after, size)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Task]:
+        """Повертає завдання, назва або опис яких містять усі слова запиту як префікси"""
+        if not tokenize(query):
             return []
+        return self.find(TaskQuery(text=query, limit=limit))
+
+    def get_by_title(self, title: str) -> Optional[Task]:
+        with self._store.lock:
+            section = self._section()
+            task_id = section.index('title', TitleIndex).find(title)
+            return copy.copy(section.entities[task_id]) if task_id is not None else None
+
+    @staticmethod
+    def _put(section: IndexedSection, task: Task) -> None:
+        """Зберігає копію завдання в секції, перевіряючи унікальність назви за індексом"""
+        if section.index('title', TitleIndex).conflicts(task):
+            raise DuplicateTaskError.by_title(task.title)
+        stored = copy.copy(task)
+        stored._mark_clean()
+        section.put(stored)
 
     def add(self, task: Task) -> None:
-        tasks = self.get_all()
-        tasks.append(task)
-        self._save_all(tasks)
+        with self._store.lock:
+            self._put(self._section(), task)
+            self._save_all()
+            task._mark_clean()
 
     def update(self, task: Task) -> None:
-        tasks = self.get_all()
-        for i, existing_task in enumerate(tasks):
-            if existing_task.id == task.id:
-                tasks[i] = task
-                break
-        self._save_all(tasks)
+        # Сутність без змін після завантаження не перезаписує файл
+        if not task.is_dirty():
+            return
+        with self._store.lock:
+            section = self._section()
+            if task.id in section.entities:
+                self._put(section, task)
+            self._save_all()
+            task._mark_clean()
 
     def delete(self, id: str) -> None:
-        tasks = [task for task in self.get_all() if task.id != id]
-        self._save_all(tasks)
+        with self._store.lock:
+            self._section().remove(id)
+            self._save_all()
 
-    def exists(self, id: str) -> bool:
-        return self.get_by_id(id) is not None
+    def add_many(self, tasks: Iterable[Task]) -> None:
+        tasks = list(tasks)
+        with self._store.lock:
+            # Якщо одна з назв зайнята, deferred() відкидає вже внесені зміни
+            with self._store.deferred():
+                section = self._section()
+                for task in tasks:
+                    self._put(section, task)
+            self._save_all()
+            for task in tasks:
+                task._mark_clean()
 
-    def _save_all(self, tasks: List[Task]) -> None:
-        """Зберігає всі завдання у файл"""
-        try:
-            # Спочатку завантажуємо поточні дані
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+    def update_many(self, tasks: Iterable[Task]) -> None:
+        tasks = [task for task in tasks if task.is_dirty()]
+        if not tasks:
+            return
+        with self._store.lock:
+            with self._store.deferred():
+                section = self._section()
+                for task in tasks:
+                    if task.id in section.entities:
+                        self._put(section, task)
+            self._save_all()
+            for task in tasks:
+                task._mark_clean()
 
-            # Оновлюємо тільки завдання
-            data['tasks'] = [task.to_dict() for task in tasks]
+    def delete_many(self, ids: Iterable[str]) -> None:
+        with self._store.lock:
+            section = self._section()
+            for id in ids:
+                section.remove(id)
+            self._save_all()
 
-            # Зберігаємо оновлені дані
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+    def exists(self, id: str) -> bool:
+        with self._store.lock:
+            return id in self._section().entities
+
+    def batch(self):
+        return self._store.deferred()
 
+    def _save_all(self) -> None:
+        """Зберігає всі завдання у файл"""
+        try:
+            self._store.save('tasks')
         except Exception as e:
             raise RuntimeError(f"Помилка збереження завдань: {str(e)}")
\ No newline at end of file
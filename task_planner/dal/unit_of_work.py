@@ -0,0 +1,115 @@
+from contextlib import ExitStack
+from typing import Dict, List, Optional
+from task_planner.dal.repositories.irepository import IRepository, ITaskRepository, IMemberRepository
+
+
+class TrackedRepository:
+    """Мапа ідентичності над репозиторієм, що відстежує нові, змінені та видалені сутності"""
+
+    def __init__(self, repository: IRepository):
+        self.repository = repository
+        self._identity: Dict[str, object] = {}
+        self._missing = set()
+        self._loaded_all = False
+        self._new: Dict[str, object] = {}
+        self._dirty: Dict[str, object] = {}
+        self._deleted = set()
+
+    def get(self, id: str) -> Optional[object]:
+        """Повертає сутність; кожна сутність читається зі сховища не більше одного разу"""
+        if id in self._deleted:
+            return None
+        if id in self._identity:
+            return self._identity[id]
+        if self._loaded_all or id in self._missing:
+            return None
+        entity = self.repository.get_by_id(id)
+        if entity is None:
+            self._missing.add(id)
+        else:
+            self._identity[id] = entity
+        return entity
+
+    def exists(self, id: str) -> bool:
+        return self.get(id) is not None
+
+    def all(self) -> List:
+        """Повертає всі сутності з урахуванням незафіксованих змін"""
+        if not self._loaded_all:
+            for entity in self.repository.get_all():
+                self._identity.setdefault(entity.id, entity)
+            self._loaded_all = True
+        return [entity for id, entity in self._identity.items() if id not in self._deleted]
+
+    def add(self, entity) -> None:
+        self._deleted.discard(entity.id)
+        self._missing.discard(entity.id)
+        self._identity[entity.id] = entity
+        self._new[entity.id] = entity
+
+    def update(self, entity) -> None:
+        self._identity[entity.id] = entity
+        if entity.id in self._new:
+            self._new[entity.id] = entity
+        else:
+            self._dirty[entity.id] = entity
+
+    def delete(self, id: str) -> None:
+        self._dirty.pop(id, None)
+        if self._new.pop(id, None) is None:
+            self._deleted.add(id)
+        self._identity.pop(id, None)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self._new or self._dirty or self._deleted)
+
+    def flush_deleted(self) -> None:
+        """Передає репозиторію накопичені видалення"""
+        if self._deleted:
+            self.repository.delete_many(list(self._deleted))
+        self._deleted.clear()
+
+    def flush_saved(self) -> None:
+        """Передає репозиторію нові та змінені сутності"""
+        if self._new:
+            self.repository.add_many(list(self._new.values()))
+        if self._dirty:
+            self.repository.update_many(list(self._dirty.values()))
+        self._new.clear()
+        self._dirty.clear()
+
+
+class UnitOfWork:
+    """Одиниця роботи для однієї операції сервісу.
+
+    Зчитує сутності один раз, накопичує зміни в пам'яті та фіксує їх
+    наприкінці блоку with усередині batch() репозиторіїв, тож сховище
+    виконує один запис на всю операцію. Якщо блок завершився винятком,
+    зміни відкидаються.
+    """
+
+    def __init__(self, task_repository: ITaskRepository, member_repository: IMemberRepository):
+        self.tasks = TrackedRepository(task_repository)
+        self.members = TrackedRepository(member_repository)
+
+    def __enter__(self) -> 'UnitOfWork':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.commit()
+
+    def commit(self) -> None:
+        """Фіксує всі зміни одним записом сховища"""
+        tracked = [repo for repo in (self.tasks, self.members) if repo.has_changes]
+        if not tracked:
+            return
+        with ExitStack() as stack:
+            for repo in tracked:
+                stack.enter_context(repo.repository.batch())
+            # Спершу видалення, щоб звільнити унікальні назви для нових записів
+            for repo in tracked:
+                repo.flush_deleted()
+            for repo in tracked:
+                repo.flush_saved()
@@ -8,6 +8,8 @@ sys.path.insert(0, current_dir)
 from PyQt5.QtWidgets import QApplication
 from dal.repositories.task_repository import TaskRepository
 from dal.repositories.member_repository import MemberRepository
+from dal.repositories.sqlite_repository import (SqliteDatabase, SqliteTaskRepository,
+                                                SqliteMemberRepository, migrate_json_to_sqlite)
 from bll.services.task_service import TaskService
 from bll.services.member_service import MemberService
 from bll.services.project_manager import ProjectManager
@@ -19,9 +21,15 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("Планувальник завдань")
 
-    # Ініціалізація репозиторіїв
-    task_repository = TaskRepository()
-    member_repository = MemberRepository()
+    # Ініціалізація репозиторіїв (TASK_PLANNER_STORAGE=sqlite вмикає SQLite)
+    if os.environ.get("TASK_PLANNER_STORAGE", "json") == "sqlite":
+        database = SqliteDatabase("data/data.db")
+        migrate_json_to_sqlite("data/data.json", database)
+        task_repository = SqliteTaskRepository(database)
+        member_repository = SqliteMemberRepository(database)
+    else:
+        task_repository = TaskRepository()
+        member_repository = MemberRepository()
 
     # Ініціалізація сервісів
     task_service = TaskService(task_repository, member_repository)
@@ -1,3 +1,5 @@
 from .main_window import MainWindow
 from .task_dialog import TaskDialog
 from .member_dialog import MemberDialog
+from .table_models import TaskTableModel, MemberTableModel
+from .background import BackgroundLoader
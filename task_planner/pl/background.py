@@ -0,0 +1,94 @@
+import threading
+from typing import Callable, Dict, Hashable, Optional, Tuple
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+
+
+class _Job(QRunnable):
+    """Виконує виклик сервісу в потоці пулу та повідомляє результат сигналом"""
+
+    def __init__(self, loader: 'BackgroundLoader', key: Hashable, generation: int, function: Callable):
+        super().__init__()
+        self._loader = loader
+        self._key = key
+        self._generation = generation
+        self._function = function
+
+    def run(self) -> None:
+        # Запит, замінений новішим ще до старту, не виконується зовсім
+        if not self._loader.is_current(self._key, self._generation):
+            return
+        try:
+            result = self._function()
+        except Exception as e:
+            self._loader.failed.emit(self._key, self._generation, e)
+        else:
+            self._loader.finished.emit(self._key, self._generation, result)
+
+
+class BackgroundLoader(QObject):
+    """Виконує виклики ProjectManager у QThreadPool поза потоком інтерфейсу.
+
+    Кожен запит має ключ (наприклад, 'tasks'); новий запит з тим самим ключем
+    скасовує попередній: ще не розпочатий не виконується, а результат уже
+    запущеного відкидається. Колбеки викликаються в потоці інтерфейсу, бо
+    сигнали від потоків пулу доставляються в потік цього об'єкта.
+    """
+
+    finished = pyqtSignal(object, int, object)
+    failed = pyqtSignal(object, int, object)
+
+    def __init__(self, parent=None, pool: Optional[QThreadPool] = None):
+        super().__init__(parent)
+        self._pool = pool or QThreadPool.globalInstance()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._pending: Dict[Hashable, Tuple[int, Callable, Optional[Callable]]] = {}
+        self.finished.connect(self._on_finished)
+        self.failed.connect(self._on_failed)
+
+    def submit(self, key: Hashable, function: Callable, on_result: Callable,
+               on_error: Optional[Callable] = None) -> None:
+        """Запускає function() у фоні; on_result(result) або on_error(exception) — у потоці інтерфейсу"""
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self._pending[key] = (generation, on_result, on_error)
+        self._pool.start(_Job(self, key, generation, function))
+
+    def cancel(self, key: Hashable) -> None:
+        """Скасовує запит з ключем key, якщо він ще не завершився"""
+        with self._lock:
+            self._pending.pop(key, None)
+
+    def is_current(self, key: Hashable, generation: int) -> bool:
+        with self._lock:
+            pending = self._pending.get(key)
+            return pending is not None and pending[0] == generation
+
+    def is_loading(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._pending
+
+    def _take(self, key: Hashable, generation: int):
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None or pending[0] != generation:
+                return None
+            del self._pending[key]
+            return pending
+
+    @pyqtSlot(object, int, object)
+    def _on_finished(self, key, generation, result) -> None:
+        pending = self._take(key, generation)
+        if pending is not None:
+            pending[1](result)
+
+    @pyqtSlot(object, int, object)
+    def _on_failed(self, key, generation, error) -> None:
+        pending = self._take(key, generation)
+        if pending is not None and pending[2] is not None:
+            pending[2](error)
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Дочікується завершення всіх фонових викликів (наприклад, під час закриття вікна)"""
+        return self._pool.waitForDone(msecs)
@@ -1,17 +1,26 @@
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-                             QTabWidget, QTableWidget, QTableWidgetItem,
+                             QTabWidget, QTableView, QAbstractItemView,
                              QPushButton, QLabel, QProgressBar, QMessageBox,
                              QHeaderView, QComboBox, QLineEdit)
-from PyQt5.QtCore import Qt
-from datetime import date
+from PyQt5.QtCore import Qt, QSortFilterProxyModel
+from .background import BackgroundLoader
+from .table_models import TaskTableModel, MemberTableModel, SORT_ROLE
 
 
 class MainWindow(QMainWindow):
-    """Головне вікно програми"""
+    """Головне вікно програми.
+
+    Виклики ProjectManager виконуються у фоні через BackgroundLoader, а
+    результати потрапляють у віджети в потоці інтерфейсу.
+    """
+
+    # Пункти фільтра статусу та відповідні статуси TaskQuery
+    STATUS_FILTERS = {"Активні": 'pending', "Прострочені": 'overdue', "Виконані": 'completed'}
 
     def __init__(self, project_manager):
         super().__init__()
         self.project_manager = project_manager
+        self.loader = BackgroundLoader(self)
         self.setup_ui()
         self.update_ui()
 
@@ -91,13 +100,10 @@ class MainWindow(QMainWindow):
 
         layout.addLayout(control_layout)
 
-        # Таблиця завдань
-        self.tasks_table = QTableWidget()
-        self.tasks_table.setColumnCount(7)
-        self.tasks_table.setHorizontalHeaderLabels([
-            "Назва", "Опис", "Дедлайн", "Виконавець", "Статус", "Прострочено", "Створено"
-        ])
-        self.tasks_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Таблиця завдань: модель показує лише видимі рядки, сортує репозиторій
+        self.tasks_model = TaskTableModel(self.project_manager, self.loader, self)
+        self.tasks_model.load_failed.connect(self.on_tasks_load_failed)
+        self.tasks_table = self._create_table_view(self.tasks_model)
         self.tasks_table.doubleClicked.connect(self.edit_task)
         layout.addWidget(self.tasks_table)
 
@@ -123,16 +129,48 @@ class MainWindow(QMainWindow):
         control_layout.addStretch()
         layout.addLayout(control_layout)
 
-        # Таблиця членів команди
-        self.members_table = QTableWidget()
-        self.members_table.setColumnCount(5)
-        self.members_table.setHorizontalHeaderLabels([
-            "Ім'я", "Роль", "Кількість завдань", "Завантаженість", "Створено"
-        ])
-        self.members_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Таблиця членів команди: сортування завантажених рядків виконує проксі-модель
+        self.members_model = MemberTableModel(self.project_manager, self.loader, self)
+        self.members_model.load_failed.connect(self.on_members_load_failed)
+        self.members_proxy = QSortFilterProxyModel(self)
+        self.members_proxy.setSourceModel(self.members_model)
+        self.members_proxy.setSortRole(SORT_ROLE)
+        self.members_table = self._create_table_view(self.members_proxy)
         self.members_table.doubleClicked.connect(self.edit_member)
         layout.addWidget(self.members_table)
 
+    def _create_table_view(self, model) -> QTableView:
+        """Створює таблицю над моделлю з вибором цілих рядків і сортуванням"""
+        view = QTableView()
+        view.setModel(model)
+        view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        view.setSelectionMode(QAbstractItemView.SingleSelection)
+        view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Без вибраного стовпця зберігається початковий порядок
+        view.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        view.setSortingEnabled(True)
+        if hasattr(model, 'is_sortable'):
+            header = view.horizontalHeader()
+            header.sortIndicatorChanged.connect(
+                lambda column, order: self._keep_sort_indicator(header, model, column))
+        return view
+
+    @staticmethod
+    def _keep_sort_indicator(header: QHeaderView, model, column: int) -> None:
+        """Повертає індикатор на поточний стовпець, якщо за вибраним модель не сортує"""
+        if column < 0 or model.is_sortable(column):
+            return
+        sort_column, order = model.sort_indicator()
+        blocked = header.blockSignals(True)
+        header.setSortIndicator(sort_column, order)
+        header.blockSignals(blocked)
+
+    @staticmethod
+    def _selected_id(view: QTableView):
+        """Повертає id сутності вибраного рядка або None"""
+        rows = view.selectionModel().selectedRows()
+        return rows[0].data(Qt.UserRole) if rows else None
+
     def update_ui(self):
         """Оновлює весь інтерфейс"""
         self.update_tasks_table()
@@ -140,254 +178,155 @@ class MainWindow(QMainWindow):
         self.update_project_status()
 
     def update_tasks_table(self):
-        """Оновлює таблицю завдань"""
-        self.tasks_table.setRowCount(0)
-
-        # Фільтрація завдань
-        filter_text = self.filter_combo.currentText()
-        search_text = self.search_edit.text().lower()
-
-        try:
-            all_tasks = self.project_manager.get_all_tasks()
-        except Exception as e:
-            QMessageBox.critical(self, "Помилка", f"Не вдалося завантажити завдання: {str(e)}")
-            return
-
-        filtered_tasks = []
-        for task in all_tasks:
-            # Застосовуємо фільтр статусу
-            if filter_text == "Активні" and task.is_completed:
-                continue
-            elif filter_text == "Прострочені" and not task.is_overdue():
-                continue
-            elif filter_text == "Виконані" and not task.is_completed:
-                continue
-
-            # Застосовуємо пошук
-            if search_text:
-                task_text = f"{task.title} {task.description}".lower()
-                if search_text not in task_text:
-                    continue
-
-            filtered_tasks.append(task)
-
-        # Заповнення таблиці
-        self.tasks_table.setRowCount(len(filtered_tasks))
-        for row, task in enumerate(filtered_tasks):
-            # Назва
-            title_item = QTableWidgetItem(task.title)
-            self.tasks_table.setItem(row, 0, title_item)
-
-            # Опис
-            desc_item = QTableWidgetItem(task.description)
-            self.tasks_table.setItem(row, 1, desc_item)
-
-            # Дедлайн
-            deadline_item = QTableWidgetItem(task.deadline.strftime("%d.%m.%Y"))
-            self.tasks_table.setItem(row, 2, deadline_item)
-
-            # Виконавець
-            assignee_name = "Не призначено"
-            if task.assignee_id:
-                try:
-                    member = self.project_manager.get_member(task.assignee_id)
-                    assignee_name = member.name
-                except:
-                    assignee_name = "Невідомий"
-            assignee_item = QTableWidgetItem(assignee_name)
-            self.tasks_table.setItem(row, 3, assignee_item)
-
-            # Статус
-            status_item = QTableWidgetItem("Виконано" if task.is_completed else "Активне")
-            self.tasks_table.setItem(row, 4, status_item)
-
-            # Прострочено
-            overdue_text = "Так" if task.is_overdue() else "Ні"
-            overdue_item = QTableWidgetItem(overdue_text)
-            if task.is_overdue():
-                overdue_item.setForeground(Qt.red)
-            self.tasks_table.setItem(row, 5, overdue_item)
-
-            # Дата створення
-            created_item = QTableWidgetItem(task.created_date.strftime("%d.%m.%Y %H:%M"))
-            self.tasks_table.setItem(row, 6, created_item)
-
-            # Зберігаємо ID завдання для подальшого використання
-            for col in range(7):
-                self.tasks_table.item(row, col).setData(Qt.UserRole, task.id)
+        """Оновлює таблицю завдань; зміна фільтра скасовує незавершене читання"""
+        # Фільтри статусу та пошуку виконує репозиторій за своїми індексами
+        status = self.STATUS_FILTERS.get(self.filter_combo.currentText())
+        search_text = self.search_edit.text().strip()
+        self.tasks_model.set_filter(status=status, text=search_text)
 
     def update_members_table(self):
         """Оновлює таблицю членів команди"""
-        try:
-            members = self.project_manager.get_all_members()
-        except Exception as e:
-            QMessageBox.critical(self, "Помилка", f"Не вдалося завантажити членів команди: {str(e)}")
-            return
-
-        self.members_table.setRowCount(len(members))
-
-        for row, member in enumerate(members):
-            # Ім'я
-            name_item = QTableWidgetItem(member.name)
-            self.members_table.setItem(row, 0, name_item)
-
-            # Роль
-            role_item = QTableWidgetItem(member.role)
-            self.members_table.setItem(row, 1, role_item)
+        self.members_model.refresh()
 
-            # Кількість завдань
-            tasks_count = self.project_manager.get_member_workload(member.id)
-            tasks_item = QTableWidgetItem(str(tasks_count))
-            self.members_table.setItem(row, 2, tasks_item)
+    def on_tasks_load_failed(self, message):
+        """Обробляє помилку завантаження завдань"""
+        QMessageBox.critical(self, "Помилка", f"Не вдалося завантажити завдання: {message}")
 
-            # Завантаженість
-            workload_text = "Низька" if tasks_count == 0 else "Середня" if tasks_count < 3 else "Висока"
-            if tasks_count >= 5:
-                workload_text = "Дуже висока"
-            workload_item = QTableWidgetItem(workload_text)
-            self.members_table.setItem(row, 3, workload_item)
+    def on_members_load_failed(self, message):
+        """Обробляє помилку завантаження членів команди"""
+        QMessageBox.critical(self, "Помилка", f"Не вдалося завантажити членів команди: {message}")
 
-            # Дата створення
-            created_item = QTableWidgetItem(member.created_date.strftime("%d.%m.%Y %H:%M"))
-            self.members_table.setItem(row, 4, created_item)
-
-            # Зберігаємо ID члена команди для подальшого використання
-            for col in range(5):
-                self.members_table.item(row, col).setData(Qt.UserRole, member.id)
+    def _show_error(self, message):
+        """Повертає обробник помилки фонового виклику з повідомленням message"""
+        return lambda error: QMessageBox.critical(self, "Помилка", f"{message}: {str(error)}")
 
     def update_project_status(self):
         """Оновлює статус проєкту"""
-        try:
-            total_tasks = len(self.project_manager.get_all_tasks())
-            completed_tasks = len(self.project_manager.get_completed_tasks())
-            overdue_tasks = len(self.project_manager.get_overdue_tasks())
+        def load():
+            return self.project_manager.get_project_stats(), self.project_manager.get_project_progress()
 
-            progress = self.project_manager.get_project_progress()
-            self.progress_bar.setValue(int(progress))
+        self.loader.submit('status', load, self._show_project_status,
+                           lambda error: self.stats_label.setText(f"Помилка: {str(error)}"))
 
-            stats_text = f"Завдань: {total_tasks} | Виконано: {completed_tasks} | Прострочено: {overdue_tasks}"
-            self.stats_label.setText(stats_text)
-        except Exception as e:
-            self.stats_label.setText(f"Помилка: {str(e)}")
+    def _show_project_status(self, result):
+        stats, progress = result
+        self.progress_bar.setValue(int(progress))
+        stats_text = f"Завдань: {stats['total']} | Виконано: {stats['completed']} | Прострочено: {stats['overdue']}"
+        self.stats_label.setText(stats_text)
 
     def add_task(self):
         """Додає нове завдання"""
-        from .task_dialog import TaskDialog
-        try:
-            members = self.project_manager.get_all_members()
-            dialog = TaskDialog(self.project_manager, members, parent=self)
-            dialog.task_saved.connect(self.on_task_saved)
-            dialog.exec_()
-        except Exception as e:
-            QMessageBox.critical(self, "Помилка", f"Не вдалося відкрити діалог: {str(e)}")
+        self.loader.submit('dialog', self.project_manager.get_all_members, self._open_task_dialog,
+                           self._show_error("Не вдалося відкрити діалог"))
 
     def edit_task(self):
         """Редагує вибране завдання"""
-        selected_items = self.tasks_table.selectedItems()
-        if not selected_items:
+        task_id = self._selected_id(self.tasks_table)
+        if task_id is None:
             QMessageBox.warning(self, "Попередження", "Будь ласка, виберіть завдання для редагування")
             return
 
-        task_id = selected_items[0].data(Qt.UserRole)
-        try:
-            task = self.project_manager.get_task(task_id)
-            members = self.project_manager.get_all_members()
+        def load():
+            return self.project_manager.get_all_members(), self.project_manager.get_task(task_id)
+
+        self.loader.submit('dialog', load, lambda result: self._open_task_dialog(*result),
+                           self._show_error("Не вдалося редагувати завдання"))
 
-            from .task_dialog import TaskDialog
+    def _open_task_dialog(self, members, task=None):
+        from .task_dialog import TaskDialog
+        try:
             dialog = TaskDialog(self.project_manager, members, task, self)
             dialog.task_saved.connect(self.on_task_saved)
             dialog.exec_()
         except Exception as e:
-            QMessageBox.critical(self, "Помилка", f"Не вдалося редагувати завдання: {str(e)}")
+            QMessageBox.critical(self, "Помилка", f"Не вдалося відкрити діалог: {str(e)}")
 
     def delete_task(self):
         """Видаляє вибране завдання"""
-        selected_items = self.tasks_table.selectedItems()
-        if not selected_items:
+        task_id = self._selected_id(self.tasks_table)
+        if task_id is None:
             QMessageBox.warning(self, "Попередження", "Будь ласка, виберіть завдання для видалення")
             return
 
-        task_id = selected_items[0].data(Qt.UserRole)
-        try:
-            task = self.project_manager.get_task(task_id)
+        self.loader.submit('dialog', lambda: self.project_manager.get_task(task_id),
+                           self._confirm_delete_task, self._show_error("Не вдалося видалити завдання"))
 
-            reply = QMessageBox.question(
-                self,
-                "Підтвердження видалення",
-                f"Ви впевнені, що хочете видалити завдання '{task.title}'?",
-                QMessageBox.Yes | QMessageBox.No
-            )
+    def _confirm_delete_task(self, task):
+        reply = QMessageBox.question(
+            self,
+            "Підтвердження видалення",
+            f"Ви впевнені, що хочете видалити завдання '{task.title}'?",
+            QMessageBox.Yes | QMessageBox.No
+        )
 
-            if reply == QMessageBox.Yes:
-                self.project_manager.delete_task(task_id)
-                self.update_ui()
-                QMessageBox.information(self, "Успіх", "Завдання успішно видалено")
-        except Exception as e:
-            QMessageBox.critical(self, "Помилка", f"Не вдалося видалити завдання: {str(e)}")
+        if reply == QMessageBox.Yes:
+            # Ключ запису унікальний, тож жоден інший запит не скасує видалення
+            self.loader.submit(('delete_task', task.id), lambda: self.project_manager.delete_task(task.id),
+                               lambda _: self._on_deleted("Завдання успішно видалено"),
+                               self._show_error("Не вдалося видалити завдання"))
 
     def add_member(self):
         """Додає нового члена команди"""
-        from .member_dialog import MemberDialog
-        try:
-            dialog = MemberDialog(self.project_manager, parent=self)
-            dialog.member_saved.connect(self.on_member_saved)
-            dialog.exec_()
-        except Exception as e:
-            QMessageBox.critical(self, "Помилка", f"Не вдалося відкрити діалог: {str(e)}")
+        self._open_member_dialog()
 
     def edit_member(self):
         """Редагує вибраного члена команди"""
-        selected_items = self.members_table.selectedItems()
-        if not selected_items:
+        member_id = self._selected_id(self.members_table)
+        if member_id is None:
             QMessageBox.warning(self, "Попередження", "Будь ласка, виберіть члена команди для редагування")
             return
 
-        member_id = selected_items[0].data(Qt.UserRole)
-        try:
-            member = self.project_manager.get_member(member_id)
+        self.loader.submit('dialog', lambda: self.project_manager.get_member(member_id),
+                           self._open_member_dialog, self._show_error("Не вдалося редагувати члена команди"))
 
-            from .member_dialog import MemberDialog
+    def _open_member_dialog(self, member=None):
+        from .member_dialog import MemberDialog
+        try:
             dialog = MemberDialog(self.project_manager, member, self)
             dialog.member_saved.connect(self.on_member_saved)
             dialog.exec_()
         except Exception as e:
-            QMessageBox.critical(self, "Помилка", f"Не вдалося редагувати члена команди: {str(e)}")
+            QMessageBox.critical(self, "Помилка", f"Не вдалося відкрити діалог: {str(e)}")
 
     def delete_member(self):
         """Видаляє вибраного члена команди"""
-        selected_items = self.members_table.selectedItems()
-        if not selected_items:
+        member_id = self._selected_id(self.members_table)
+        if member_id is None:
             QMessageBox.warning(self, "Попередження", "Будь ласка, виберіть члена команди для видалення")
             return
 
-        member_id = selected_items[0].data(Qt.UserRole)
-        try:
-            member = self.project_manager.get_member(member_id)
-            workload = self.project_manager.get_member_workload(member_id)
-
-            if workload > 0:
-                reply = QMessageBox.question(
-                    self,
-                    "Попередження",
-                    f"Цей член команди має {workload} завдань. Видалення призведе до видалення всіх його завдань. Продовжити?",
-                    QMessageBox.Yes | QMessageBox.No
-                )
-                if reply == QMessageBox.No:
-                    return
+        def load():
+            return self.project_manager.get_member(member_id), self.project_manager.get_member_workload(member_id)
+
+        self.loader.submit('dialog', load, lambda result: self._confirm_delete_member(*result),
+                           self._show_error("Не вдалося видалити члена команди"))
 
+    def _confirm_delete_member(self, member, workload):
+        if workload > 0:
             reply = QMessageBox.question(
                 self,
-                "Підтвердження видалення",
-                f"Ви впевнені, що хочете видалити члена команди '{member.name}'?",
+                "Попередження",
+                f"Цей член команди має {workload} завдань. Видалення призведе до видалення всіх його завдань. Продовжити?",
                 QMessageBox.Yes | QMessageBox.No
             )
-
-            if reply == QMessageBox.Yes:
-                self.project_manager.delete_member(member_id)
-                self.update_ui()
-                QMessageBox.information(self, "Успіх", "Члена команди успішно видалено")
-        except Exception as e:
-            QMessageBox.critical(self, "Помилка", f"Не вдалося видалити члена команди: {str(e)}")
+            if reply == QMessageBox.No:
+                return
+
+        reply = QMessageBox.question(
+            self,
+            "Підтвердження видалення",
+            f"Ви впевнені, що хочете видалити члена команди '{member.name}'?",
+            QMessageBox.Yes | QMessageBox.No
+        )
+
+        if reply == QMessageBox.Yes:
+            self.loader.submit(('delete_member', member.id), lambda: self.project_manager.delete_member(member.id),
+                               lambda _: self._on_deleted("Члена команди успішно видалено"),
+                               self._show_error("Не вдалося видалити члена команди"))
+
+    def _on_deleted(self, message):
+        self.update_ui()
+        QMessageBox.information(self, "Успіх", message)
 
     def on_task_saved(self, task):
         """Обробляє збереження завдання"""
@@ -401,5 +340,6 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Обробляє закриття програми"""
-        # Дані тепер зберігаються автоматично через репозиторії
+        # Дані зберігаються репозиторіями; дочікуємося фонових записів
+        self.loader.wait()
         event.accept()
\ No newline at end of file
@@ -0,0 +1,251 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt5.QtGui import QColor
+from task_planner.bll.models.task_query import TaskQuery
+
+# Роль із сирим значенням комірки для сортування в QSortFilterProxyModel
+SORT_ROLE = Qt.UserRole + 1
+
+
+def workload_label(tasks_count: int) -> str:
+    """Текстова оцінка завантаженості за кількістю завдань"""
+    if tasks_count >= 5:
+        return "Дуже висока"
+    return "Низька" if tasks_count == 0 else "Середня" if tasks_count < 3 else "Висока"
+
+
+class TaskTableModel(QAbstractTableModel):
+    """Модель таблиці завдань поверх ProjectManager.get_tasks_with_assignees.
+
+    Завдання довантажуються порціями по BATCH_SIZE через fetchMore(), коли
+    представлення прокручується до кінця, а текст комірок формується в data()
+    лише для видимих рядків. Сортування виконує репозиторій (TaskQuery.sort_by),
+    тому впорядкувати можна лише стовпці SORT_KEYS.
+    Читання йде через BackgroundLoader: нове оновлення скасовує попереднє.
+    """
+
+    HEADERS = ["Назва", "Опис", "Дедлайн", "Виконавець", "Статус", "Прострочено", "Створено"]
+    # Стовпці, які репозиторій уміє впорядковувати
+    SORT_KEYS = {0: 'title', 2: 'deadline', 6: 'created_date'}
+    BATCH_SIZE = 500
+
+    load_failed = pyqtSignal(str)
+
+    def __init__(self, project_manager, loader, parent=None):
+        super().__init__(parent)
+        self.project_manager = project_manager
+        self._loader = loader
+        self._tasks = []
+        self._assignee_names = {}
+        self._status = None
+        self._text = None
+        self._sort_column = -1
+        self._sort_by = None
+        self._descending = False
+        self._as_of = None
+        self._exhausted = True
+
+    def set_filter(self, status=None, text=None) -> None:
+        """Задає фільтри статусу та пошуку і перечитує першу порцію"""
+        self._status = status
+        self._text = text
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Перечитує першу порцію завдань у фоні; незавершене попереднє читання відкидається"""
+        # Сьогоднішня дата обчислюється один раз на все оновлення таблиці
+        as_of = self.project_manager.today()
+        query = self._query(0, as_of)
+        self._loader.submit(self, lambda: self._load(query),
+                            lambda result: self._reset(result, as_of), self._on_error)
+
+    def _query(self, offset: int, as_of) -> TaskQuery:
+        return TaskQuery(status=self._status, text=self._text, sort_by=self._sort_by,
+                         descending=self._descending, limit=self.BATCH_SIZE, offset=offset, as_of=as_of)
+
+    def _load(self, query: TaskQuery):
+        """Виконується в потоці пулу: читає порцію разом з іменами її виконавців"""
+        rows = self.project_manager.get_tasks_with_assignees(query)
+        names = {task.assignee_id: name for task, name in rows if name is not None}
+        return [task for task, _ in rows], names
+
+    def _reset(self, result, as_of) -> None:
+        tasks, names = result
+        self.beginResetModel()
+        self._as_of = as_of
+        self._tasks = tasks
+        self._assignee_names = names
+        self._exhausted = len(tasks) < self.BATCH_SIZE
+        self.endResetModel()
+
+    def _append(self, result) -> None:
+        tasks, names = result
+        self._exhausted = len(tasks) < self.BATCH_SIZE
+        self._assignee_names.update(names)
+        if tasks:
+            first = len(self._tasks)
+            self.beginInsertRows(QModelIndex(), first, first + len(tasks) - 1)
+            self._tasks.extend(tasks)
+            self.endInsertRows()
+
+    def _on_error(self, error) -> None:
+        self._exhausted = True
+        self.load_failed.emit(str(error))
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted and not self._loader.is_loading(self)
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if not self.canFetchMore(parent):
+            return
+        query = self._query(len(self._tasks), self._as_of)
+        self._loader.submit(self, lambda: self._load(query), self._append, self._on_error)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._tasks)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        task = self._tasks[index.row()]
+        column = index.column()
+        if role == Qt.UserRole:
+            return task.id
+        if role == Qt.ForegroundRole and column == 5 and task.is_overdue(self._as_of):
+            return QColor(Qt.red)
+        if role != Qt.DisplayRole:
+            return None
+
+        if column == 0:
+            return task.title
+        if column == 1:
+            return task.description
+        if column == 2:
+            return task.deadline.strftime("%d.%m.%Y")
+        if column == 3:
+            if not task.assignee_id:
+                return "Не призначено"
+            return self._assignee_names.get(task.assignee_id, "Невідомий")
+        if column == 4:
+            return "Виконано" if task.is_completed else "Активне"
+        if column == 5:
+            return "Так" if task.is_overdue(self._as_of) else "Ні"
+        return task.created_date.strftime("%d.%m.%Y %H:%M")
+
+    def is_sortable(self, column: int) -> bool:
+        """Перевіряє, чи вміє репозиторій впорядкувати завдання за стовпцем"""
+        return column in self.SORT_KEYS
+
+    def sort_indicator(self):
+        """Повертає стовпець (-1 — порядок зберігання) і напрям поточного сортування"""
+        return self._sort_column, Qt.DescendingOrder if self._descending else Qt.AscendingOrder
+
+    def sort(self, column, order=Qt.AscendingOrder) -> None:
+        """Впорядковує завдання засобами репозиторію; стовпці поза SORT_KEYS ігноруються"""
+        if column >= 0 and not self.is_sortable(column):
+            return
+        self._sort_column = column
+        self._sort_by = self.SORT_KEYS.get(column)
+        self._descending = order == Qt.DescendingOrder
+        if self._as_of is None and not self._loader.is_loading(self):
+            # Порядок задано до першого завантаження, його застосує refresh()
+            return
+        self.refresh()
+
+
+class MemberTableModel(QAbstractTableModel):
+    """Модель таблиці членів команди поверх курсорних сторінок ProjectManager.
+
+    Члени команди довантажуються у фоні сторінками за датою створення;
+    кількість завдань береться з самого члена команди без окремих запитів.
+    Для сортування за іншими стовпцями модель загортається в
+    QSortFilterProxyModel з роллю SORT_ROLE.
+    """
+
+    HEADERS = ["Ім'я", "Роль", "Кількість завдань", "Завантаженість", "Створено"]
+    BATCH_SIZE = 200
+
+    load_failed = pyqtSignal(str)
+
+    def __init__(self, project_manager, loader, parent=None):
+        super().__init__(parent)
+        self.project_manager = project_manager
+        self._loader = loader
+        self._members = []
+        self._cursor = None
+
+    def refresh(self) -> None:
+        """Перечитує першу сторінку у фоні; незавершене попереднє читання відкидається"""
+        self._loader.submit(self, lambda: self._load(None), self._reset, self._on_error)
+
+    def _load(self, after):
+        """Виконується в потоці пулу: читає сторінку членів команди"""
+        return self.project_manager.get_members_page(after=after, size=self.BATCH_SIZE)
+
+    def _reset(self, page) -> None:
+        self.beginResetModel()
+        self._members = list(page.items)
+        self._cursor = page.next_cursor
+        self.endResetModel()
+
+    def _append(self, page) -> None:
+        self._cursor = page.next_cursor
+        if page.items:
+            first = len(self._members)
+            self.beginInsertRows(QModelIndex(), first, first + len(page.items) - 1)
+            self._members.extend(page.items)
+            self.endInsertRows()
+
+    def _on_error(self, error) -> None:
+        self._cursor = None
+        self.load_failed.emit(str(error))
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._cursor is not None and not self._loader.is_loading(self)
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if not self.canFetchMore(parent):
+            return
+        cursor = self._cursor
+        self._loader.submit(self, lambda: self._load(cursor), self._append, self._on_error)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._members)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        member = self._members[index.row()]
+        column = index.column()
+        if role == Qt.UserRole:
+            return member.id
+        if role not in (Qt.DisplayRole, SORT_ROLE):
+            return None
+
+        if column == 0:
+            return member.name if role == Qt.DisplayRole else member.name.casefold()
+        if column == 1:
+            return member.role
+        if column in (2, 3):
+            tasks_count = member.get_workload()
+            if role == SORT_ROLE:
+                return tasks_count
+            return str(tasks_count) if column == 2 else workload_label(tasks_count)
+        if role == SORT_ROLE:
+            return member.created_date.isoformat()
+        return member.created_date.strftime("%d.%m.%Y %H:%M")
@@ -1,7 +1,11 @@
+import copy
+
 import pytest
 from datetime import date, datetime, timedelta
 from task_planner.bll.models.task import Task
 from task_planner.bll.models.team_member import TeamMember
+from task_planner.bll.models.lazy_record import LazyTask, LazyTeamMember
+from task_planner.bll.models.task_table import TaskTable
 from task_planner.bll.exceptions import TaskValidationError, MemberValidationError
 
 
@@ -136,6 +140,16 @@ class TestTaskModel:
         # Assert
         assert is_overdue is False
 
+    def test_is_overdue_as_of(self, sample_task_data):
+        """Тест перевірки простроченості на задану дату без звернення до date.today()"""
+        # Arrange
+        task = Task(**sample_task_data)
+        deadline = sample_task_data['deadline']
+
+        # Act & Assert
+        assert task.is_overdue(deadline) is False
+        assert task.is_overdue(deadline + timedelta(days=1)) is True
+
     def test_to_dict(self, sample_task_data):
         """Тест серіалізації завдання в словник"""
         # Arrange
@@ -306,4 +320,286 @@ class TestTeamMemberModel:
         assert restored_member.name == original_member.name
         assert restored_member.role == original_member.role
         assert restored_member.task_ids == original_member.task_ids
-        assert restored_member.id == original_member.id
\ No newline at end of file
+        assert restored_member.id == original_member.id
+
+    def test_task_ids_keep_insertion_order(self, sample_member_data):
+        """Тест збереження порядку завдань після видалення та повторного додавання"""
+        # Arrange
+        member = TeamMember(**sample_member_data, task_ids=["task-1", "task-2", "task-3"])
+
+        # Act
+        member.remove_task("task-2")
+        member.add_task("task-2")
+        member.add_task("task-1")
+
+        # Assert
+        assert member.task_ids == ["task-1", "task-3", "task-2"]
+        assert member.to_dict()['task_ids'] == ["task-1", "task-3", "task-2"]
+        assert isinstance(member.to_dict()['task_ids'], list)
+
+    def test_task_ids_support_set_operations(self, sample_member_data):
+        """Тест перетину та різниці завдань двох членів команди"""
+        # Arrange
+        first = TeamMember(**sample_member_data, task_ids=["task-1", "task-2", "task-3"])
+        second = TeamMember(name="Other", role="QA", task_ids=["task-3", "task-2", "task-4"])
+
+        # Act
+        common = first.task_ids & second.task_ids
+        only_first = first.task_ids - second.task_ids
+
+        # Assert
+        assert common == ["task-2", "task-3"]
+        assert only_first == ["task-1"]
+        assert common == {"task-2", "task-3"}
+
+    def test_copy_does_not_share_task_ids(self, sample_member_data):
+        """Тест незалежності task_ids копії члена команди"""
+        # Arrange
+        member = TeamMember(**sample_member_data, task_ids=["task-1"])
+
+        # Act
+        clone = copy.copy(member)
+        clone.add_task("task-2")
+
+        # Assert
+        assert member.task_ids == ["task-1"]
+        assert clone.task_ids == ["task-1", "task-2"]
+
+
+class TestLazyRecords:
+    """Тести для лінивих записів зі сховища"""
+
+    def test_lazy_task_decodes_dates_on_first_access(self, sample_task_data):
+        """Тест відкладеного розбору дат завдання"""
+        # Arrange
+        raw = Task(**sample_task_data).to_dict()
+
+        # Act
+        task = LazyTask._from_storage(raw)
+
+        # Assert
+        assert isinstance(task, Task)
+        assert task.is_completed is False
+        assert task._is_loaded('deadline') is False
+        assert task.deadline == sample_task_data['deadline']
+        assert task._is_loaded('deadline') is True
+        assert task.is_overdue() is False
+
+    def test_lazy_task_to_dict_reuses_raw_values(self, sample_task_data):
+        """Тест серіалізації лінивого завдання без розбору дат"""
+        # Arrange
+        raw = Task(**sample_task_data).to_dict()
+        task = LazyTask._from_storage(raw)
+
+        # Act
+        task_dict = task.to_dict()
+
+        # Assert
+        assert task_dict == raw
+        assert task._is_loaded('created_date') is False
+
+    def test_stored_task_with_past_deadline_loads(self, sample_task_data):
+        """Тест завантаження збереженого завдання, дедлайн якого вже минув"""
+        # Arrange
+        raw = Task(**sample_task_data).to_dict()
+        yesterday = date.today() - timedelta(days=1)
+        raw['deadline'] = yesterday.isoformat()
+
+        # Act
+        lazy = LazyTask._from_storage(raw)
+        eager = Task._from_storage(raw)
+
+        # Assert
+        assert lazy.deadline == yesterday
+        assert lazy.is_overdue() is True
+        assert eager.deadline == yesterday
+        assert eager.to_dict() == raw
+
+    def test_lazy_member_behaves_as_member(self, sample_member_data):
+        """Тест поведінки лінивого члена команди як TeamMember"""
+        # Arrange
+        original = TeamMember(**sample_member_data)
+        original.add_task("task-1")
+
+        # Act
+        member = LazyTeamMember._from_storage(original.to_dict())
+        member.add_task("task-2")
+
+        # Assert
+        assert isinstance(member, TeamMember)
+        assert member.task_ids == ["task-1", "task-2"]
+        assert member.created_date == original.created_date
+        assert member.updated_date >= original.updated_date
+
+
+class TestCompactLayout:
+    """Тести для компактного представлення моделей у пам'яті"""
+
+    def test_models_have_no_instance_dict(self, sample_task_data, sample_member_data):
+        """Тест відсутності __dict__ у моделях зі слотами"""
+        # Arrange
+        task = Task(**sample_task_data)
+        member = TeamMember(**sample_member_data)
+
+        # Act & Assert
+        assert not hasattr(task, '__dict__')
+        assert not hasattr(member, '__dict__')
+        with pytest.raises(AttributeError):
+            task.unknown_field = 1
+
+    def test_repeated_strings_are_interned(self, sample_task_data):
+        """Тест спільного рядка ролі та виконавця в різних екземплярах"""
+        # Arrange
+        role = ''.join(['Розроб', 'ник'])
+        assignee_id = ''.join(['member', '-1'])
+
+        # Act
+        first = TeamMember(name='John Doe', role=role)
+        second = TeamMember(name='Jane Doe', role='Розробник')
+        task = Task(assignee_id=assignee_id, **sample_task_data)
+        lazy = LazyTask._from_storage(dict(task.to_dict(), assignee_id=''.join(['member', '-1'])))
+
+        # Assert
+        assert first.role is second.role
+        assert task.assignee_id is lazy.assignee_id
+
+    def test_copy_keeps_lazy_fields_undecoded(self, sample_task_data):
+        """Тест копіювання лінивого запису без розбору дат"""
+        # Arrange
+        lazy = LazyTask._from_storage(Task(**sample_task_data).to_dict())
+
+        # Act
+        clone = copy.copy(lazy)
+
+        # Assert
+        assert clone._is_loaded('deadline') is False
+        assert clone.deadline == sample_task_data['deadline']
+        assert lazy._is_loaded('deadline') is False
+        assert clone.to_dict() == lazy.to_dict()
+
+
+class TestChangeTracking:
+    """Тести для відстеження змінених полів"""
+
+    def test_new_entity_is_not_tracked(self, sample_task_data):
+        """Тест сутності, створеної конструктором: зберігаються всі поля"""
+        # Act
+        task = Task(**sample_task_data)
+
+        # Assert
+        assert task.changed_fields() is None
+        assert task.is_dirty() is True
+
+    def test_loaded_entity_tracks_assignments(self, sample_task_data):
+        """Тест запису змінених полів після завантаження"""
+        # Arrange
+        task = LazyTask._from_storage(Task(**sample_task_data).to_dict())
+
+        # Act
+        clean_before = task.is_dirty()
+        task.deadline  # Розбір лінивого поля не є зміною
+        task.mark_done()
+
+        # Assert
+        assert clean_before is False
+        assert task.changed_fields() == {'is_completed', 'updated_date'}
+
+    def test_member_task_ids_change_is_tracked(self, sample_member_data):
+        """Тест відстеження зміни task_ids на місці"""
+        # Arrange
+        member = TeamMember._from_storage(TeamMember(**sample_member_data).to_dict())
+
+        # Act
+        member.add_task("task-1")
+
+        # Assert
+        assert member.changed_fields() == {'task_ids', 'updated_date'}
+
+    def test_copy_tracks_changes_separately(self, sample_task_data):
+        """Тест незалежних змін оригіналу та копії"""
+        # Arrange
+        task = Task._from_storage(Task(**sample_task_data).to_dict())
+        task.title = 'Renamed'
+
+        # Act
+        clone = copy.copy(task)
+        clone.mark_done()
+        task._mark_clean()
+
+        # Assert
+        assert task.changed_fields() == frozenset()
+        assert clone.changed_fields() == {'title', 'is_completed', 'updated_date'}
+
+
+@pytest.fixture
+def report_tasks():
+    """Фікстура для набору завдань звіту"""
+    today = date.today()
+    tasks = [
+        Task(title='A', description='', deadline=today + timedelta(days=1), assignee_id='m1'),
+        Task(title='B', description='', deadline=today + timedelta(days=3), assignee_id='m1'),
+        Task(title='C', description='', deadline=today + timedelta(days=8), assignee_id='m2'),
+        Task(title='D', description='', deadline=today + timedelta(days=20)),
+    ]
+    tasks[1].mark_done()
+    tasks[2].mark_done()
+    return tasks
+
+
+class TestTaskTable:
+    """Тести для стовпчикової таблиці завдань"""
+
+    def test_aggregates_without_numpy(self, report_tasks):
+        """Тест агрегатів на масивах модуля array"""
+        # Arrange
+        today = date.today()
+
+        # Act
+        table = TaskTable.from_tasks(report_tasks, use_numpy=False)
+
+        # Assert
+        assert len(table) == 4
+        assert table.completed_count() == 2
+        assert table.progress() == 50.0
+        assert table.overdue_count(today + timedelta(days=10)) == 1
+        assert table.completion_by_assignee() == {'m1': (1, 2), 'm2': (1, 1), None: (0, 1)}
+        assert table.deadline_histogram(today, today + timedelta(days=13)) == [2, 1]
+
+    def test_numpy_matches_array_backend(self, report_tasks):
+        """Тест однакових результатів NumPy та резервної реалізації"""
+        # Arrange
+        pytest.importorskip('numpy')
+        today = date.today()
+        fallback = TaskTable.from_tasks(report_tasks, use_numpy=False)
+
+        # Act
+        table = TaskTable.from_tasks(report_tasks, use_numpy=True)
+
+        # Assert
+        assert table.completed_count() == fallback.completed_count()
+        assert table.overdue_count(today + timedelta(days=10)) == fallback.overdue_count(today + timedelta(days=10))
+        assert table.completion_by_assignee() == fallback.completion_by_assignee()
+        assert table.deadline_histogram(today, today + timedelta(days=13)) == \
+            fallback.deadline_histogram(today, today + timedelta(days=13))
+
+    def test_empty_table(self):
+        """Тест агрегатів порожньої таблиці"""
+        # Act
+        table = TaskTable.from_tasks([], use_numpy=False)
+
+        # Assert
+        assert table.progress() == 0.0
+        assert table.completion_by_assignee() == {}
+        assert table.deadline_histogram(date.today(), date.today()) == [0]
+
+    def test_overdue_count_requires_date(self, report_tasks):
+        """Тест підрахунку прострочених завдань лише на явно задану дату"""
+        # Arrange
+        today = date.today()
+        table = TaskTable.from_tasks(report_tasks, use_numpy=False)
+        dated = TaskTable.from_tasks(report_tasks, use_numpy=False, as_of=today + timedelta(days=10))
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            table.overdue_count()
+        assert dated.overdue_count() == table.overdue_count(today + timedelta(days=10))
@@ -0,0 +1,1113 @@
+from unittest.mock import patch
+
+import pytest
+import gc
+import tempfile
+import json
+import os
+import subprocess
+import sys
+import threading
+from datetime import date, timedelta
+from task_planner.bll.models.task import Task
+from task_planner.bll.models.team_member import TeamMember
+from task_planner.bll.models.task_query import TaskQuery
+from task_planner.dal.repositories.irepository import IRepository, ITaskRepository, IMemberRepository
+from task_planner.dal.repositories.task_repository import TaskRepository
+from task_planner.dal.repositories.member_repository import MemberRepository
+from task_planner.dal.repositories.data_store import DataStore
+from task_planner.dal.repositories.json_stream import iter_section
+from task_planner.dal.repositories.sqlite_repository import (
+    SqliteDatabase, SqliteTaskRepository, SqliteMemberRepository, migrate_json_to_sqlite
+)
+from task_planner.dal.repositories.journal_repository import (
+    JournalStore, JournalTaskRepository, JournalMemberRepository
+)
+from task_planner.bll.services.task_service import TaskService
+from task_planner.bll.exceptions import DuplicateTaskError, DuplicateMemberError
+
+
+# Фікстури для репозиторіїв
+@pytest.fixture
+def temp_data_file():
+    """Фікстура для тимчасового файлу даних"""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+        json.dump({"tasks": [], "members": []}, f)
+        temp_file = f.name
+
+    yield temp_file
+    os.unlink(temp_file)
+
+
+@pytest.fixture
+def store(temp_data_file):
+    return DataStore(temp_data_file)
+
+
+@pytest.fixture
+def task_repository(store):
+    return TaskRepository(store=store)
+
+
+@pytest.fixture
+def member_repository(store):
+    return MemberRepository(store=store)
+
+
+@pytest.fixture
+def sample_task():
+    return Task(title='Test Task', description='Test Description',
+                deadline=date.today() + timedelta(days=7))
+
+
+class TestDataStore:
+    """Тести для спільного документа файлу даних"""
+
+    def test_repeated_get_all_hits_cache(self, task_repository, store, sample_task):
+        """Тест повторного читання без зміни файлу"""
+        # Arrange
+        task_repository.add(sample_task)
+        store.hits = store.misses = 0
+
+        # Act
+        task_repository.get_all()
+        task_repository.get_all()
+
+        # Assert
+        assert store.stats()['hits'] == 2
+        assert store.stats()['misses'] == 0
+
+    def test_external_change_invalidates_cache(self, task_repository, temp_data_file, sample_task):
+        """Тест перечитування файлу після зовнішньої зміни"""
+        # Arrange
+        task_repository.get_all()
+        with open(temp_data_file, 'w', encoding='utf-8') as f:
+            json.dump({"tasks": [sample_task.to_dict()], "members": []}, f)
+
+        # Act
+        tasks = task_repository.get_all()
+
+        # Assert
+        assert [task.id for task in tasks] == [sample_task.id]
+
+    def test_sibling_section_is_not_reparsed(self, task_repository, member_repository, store,
+                                             temp_data_file, sample_task):
+        """Тест запису завдань без повторного розбору секції членів команди"""
+        # Arrange
+        member = TeamMember(name='John Doe', role='Розробник')
+        member_repository.add(member)
+        misses = store.misses
+
+        # Act
+        task_repository.add(sample_task)
+        members = member_repository.get_all()
+
+        # Assert
+        assert store.misses == misses
+        assert [m.id for m in members] == [member.id]
+        with open(temp_data_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        assert [t['id'] for t in data['tasks']] == [sample_task.id]
+        assert [m['id'] for m in data['members']] == [member.id]
+
+    def test_repositories_share_store_per_file(self, temp_data_file):
+        """Тест спільного сховища для репозиторіїв одного файлу"""
+        # Act
+        task_repository = TaskRepository(temp_data_file)
+        member_repository = MemberRepository(temp_data_file)
+
+        # Assert
+        assert task_repository._store is member_repository._store
+
+    def test_loaded_section_is_not_kept_twice(self, task_repository, store, temp_data_file, sample_task):
+        """Тест відсутності копії записів завантаженої секції в документі після запису"""
+        # Arrange
+        with open(temp_data_file, 'w', encoding='utf-8') as f:
+            json.dump({"tasks": [sample_task.to_dict()], "members": [{"id": "m-1"}]}, f)
+        other = Task(title='Other Task', description='', deadline=sample_task.deadline)
+
+        # Act
+        task_repository.add(other)
+
+        # Assert
+        assert store._document['tasks'] is None
+        with open(temp_data_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        assert [task['id'] for task in data['tasks']] == [sample_task.id, other.id]
+        assert data['members'] == [{"id": "m-1"}]
+
+    def test_unused_store_is_released(self, temp_data_file):
+        """Тест вивільнення сховища, яким більше не користується жоден репозиторій"""
+        # Arrange
+        task_repository = TaskRepository(temp_data_file)
+        key = os.path.abspath(temp_data_file)
+
+        # Act
+        del task_repository
+        gc.collect()
+
+        # Assert
+        assert key not in DataStore._stores
+
+    def test_returned_entities_are_copies(self, member_repository):
+        """Тест незалежності повернених сутностей від кешу"""
+        # Arrange
+        member = TeamMember(name='John Doe', role='Розробник')
+        member_repository.add(member)
+
+        # Act
+        cached_member = member_repository.get_by_id(member.id)
+        cached_member.name = 'Changed'
+        cached_member.add_task('task-1')
+
+        # Assert
+        reloaded = member_repository.get_by_id(member.id)
+        assert reloaded.name == 'John Doe'
+        assert reloaded.task_ids == []
+
+
+class TestIdIndex:
+    """Тести для індексу сутностей за id"""
+
+    def test_index_follows_add_update_delete(self, task_repository, sample_task):
+        """Тест узгодженості індексу після додавання, оновлення та видалення"""
+        # Arrange
+        task_repository.add(sample_task)
+
+        # Act
+        sample_task.mark_done()
+        task_repository.update(sample_task)
+        updated = task_repository.get_by_id(sample_task.id)
+        task_repository.delete(sample_task.id)
+
+        # Assert
+        assert updated.is_completed is True
+        assert task_repository.get_by_id(sample_task.id) is None
+        assert task_repository.exists(sample_task.id) is False
+
+    def test_update_keeps_file_order(self, task_repository, sample_task):
+        """Тест збереження порядку завдань після оновлення"""
+        # Arrange
+        second_task = Task(title='Second Task', description='',
+                           deadline=date.today() + timedelta(days=3))
+        task_repository.add(sample_task)
+        task_repository.add(second_task)
+
+        # Act
+        sample_task.assignee_id = 'member-1'
+        task_repository.update(sample_task)
+
+        # Assert
+        assert [task.id for task in task_repository.get_all()] == [sample_task.id, second_task.id]
+
+    def test_exists_does_not_reparse_file(self, member_repository, store):
+        """Тест перевірки існування без повторного читання файлу"""
+        # Arrange
+        member = TeamMember(name='John Doe', role='Розробник')
+        member_repository.add(member)
+        misses = store.misses
+
+        # Act
+        exists = member_repository.exists(member.id)
+
+        # Assert
+        assert exists is True
+        assert store.misses == misses
+
+
+class TestAssigneeIndex:
+    """Тести для індексу завдань за виконавцем"""
+
+    def test_index_follows_reassignment_and_delete(self, task_repository, sample_task):
+        """Тест узгодженості індексу після перепризначення та видалення"""
+        # Arrange
+        second_task = Task(title='Second Task', description='',
+                           deadline=date.today() + timedelta(days=3), assignee_id='member-1')
+        sample_task.assignee_id = 'member-1'
+        task_repository.add(sample_task)
+        task_repository.add(second_task)
+        assert [task.id for task in task_repository.get_by_assignee('member-1')] == [sample_task.id, second_task.id]
+
+        # Act
+        sample_task.assignee_id = 'member-2'
+        task_repository.update(sample_task)
+        task_repository.delete(second_task.id)
+
+        # Assert
+        assert task_repository.get_by_assignee('member-1') == []
+        assert [task.id for task in task_repository.get_by_assignee('member-2')] == [sample_task.id]
+
+    def test_journal_and_sqlite_lookup(self, journal_data_file, sqlite_task_repository, sample_task):
+        """Тест пошуку завдань виконавця в журнальному та SQLite сховищах"""
+        # Arrange
+        store = JournalStore(journal_data_file)
+        repositories = [JournalTaskRepository(store), sqlite_task_repository]
+        sample_task.assignee_id = 'member-1'
+
+        for repository in repositories:
+            # Act
+            repository.add(sample_task)
+            found = repository.get_by_assignee('member-1')
+            missing = repository.get_by_assignee('member-2')
+
+            # Assert
+            assert [task.id for task in found] == [sample_task.id]
+            assert missing == []
+        store.close()
+
+    def test_get_many_on_all_backends(self, member_repository, journal_data_file, sqlite_member_repository):
+        """Тест пакетного читання членів команди за id"""
+        # Arrange
+        store = JournalStore(journal_data_file)
+        repositories = [member_repository, JournalMemberRepository(store), sqlite_member_repository]
+        members = [TeamMember(name=f'Member {i}', role='Розробник') for i in range(3)]
+
+        for repository in repositories:
+            repository.add_many(members)
+
+            # Act
+            found = repository.get_many([members[2].id, 'missing', members[0].id, members[2].id])
+
+            # Assert
+            assert sorted(member.id for member in found) == sorted([members[0].id, members[2].id])
+        store.close()
+
+
+class TestDeadlineIndex:
+    """Тести для індексу завдань за дедлайном"""
+
+    def test_due_between_is_sorted_and_inclusive(self, task_repository):
+        """Тест діапазонного запиту за дедлайном з включними межами"""
+        # Arrange
+        today = date.today()
+        for days in (9, 1, 5, 3):
+            task_repository.add(Task(title=f'Task {days}', description='', deadline=today + timedelta(days=days)))
+
+        # Act
+        due = task_repository.get_tasks_due_between(today + timedelta(days=1), today + timedelta(days=5))
+
+        # Assert
+        assert [task.title for task in due] == ['Task 1', 'Task 3', 'Task 5']
+
+    def test_index_follows_updates(self, task_repository, sample_task):
+        """Тест узгодженості індексів дедлайнів після виконання та видалення"""
+        # Arrange
+        week_later = date.today() + timedelta(days=8)
+        task_repository.add(sample_task)
+        assert [task.id for task in task_repository.get_overdue_tasks(week_later)] == [sample_task.id]
+
+        # Act
+        sample_task.mark_done()
+        task_repository.update(sample_task)
+
+        # Assert
+        assert task_repository.get_overdue_tasks(week_later) == []
+        assert [task.id for task in task_repository.get_tasks_due_between(date.today(), week_later)] == [sample_task.id]
+        task_repository.delete(sample_task.id)
+        assert task_repository.get_tasks_due_between(date.today(), week_later) == []
+
+    def test_stored_overdue_task_is_loaded(self, temp_data_file, sample_task):
+        """Тест читання з файлу завдання, дедлайн якого вже минув"""
+        # Arrange
+        raw = sample_task.to_dict()
+        raw['deadline'] = (date.today() - timedelta(days=2)).isoformat()
+        with open(temp_data_file, 'w', encoding='utf-8') as f:
+            json.dump({"tasks": [raw], "members": []}, f)
+        repository = TaskRepository(store=DataStore(temp_data_file))
+
+        # Act
+        overdue = repository.get_overdue_tasks(date.today())
+
+        # Assert
+        assert [task.id for task in overdue] == [sample_task.id]
+        assert overdue[0].is_overdue() is True
+
+    def test_stats_follow_mutations(self, task_repository, sqlite_task_repository, sample_task):
+        """Тест лічильників завдань після додавання, виконання та видалення"""
+        # Arrange
+        week_later = date.today() + timedelta(days=8)
+        second_task = Task(title='Second Task', description='', deadline=date.today() + timedelta(days=3))
+
+        for repository in (task_repository, sqlite_task_repository):
+            # Act
+            repository.add(sample_task)
+            repository.add(second_task)
+            second_task.mark_done()
+            repository.update(second_task)
+            second_task.mark_undone()
+
+            # Assert
+            assert repository.get_stats(week_later) == {'total': 2, 'completed': 1, 'pending': 1, 'overdue': 1}
+            repository.delete(sample_task.id)
+            assert repository.get_stats(date.today()) == {'total': 1, 'completed': 1, 'pending': 0, 'overdue': 0}
+
+    def test_journal_and_sqlite_queries(self, journal_data_file, sqlite_task_repository, sample_task):
+        """Тест запитів за дедлайном у журнальному та SQLite сховищах"""
+        # Arrange
+        store = JournalStore(journal_data_file)
+        repositories = [JournalTaskRepository(store), sqlite_task_repository]
+        week_later = date.today() + timedelta(days=8)
+
+        for repository in repositories:
+            # Act
+            repository.add(sample_task)
+            due = repository.get_tasks_due_between(date.today(), sample_task.deadline)
+            overdue = repository.get_overdue_tasks(week_later)
+
+            # Assert
+            assert [task.id for task in due] == [sample_task.id]
+            assert [task.id for task in overdue] == [sample_task.id]
+            assert repository.get_overdue_tasks(date.today()) == []
+        store.close()
+
+
+class TestTextIndex:
+    """Тести для повнотекстового індексу завдань"""
+
+    def test_search_folds_case_and_matches_prefixes(self, task_repository):
+        """Тест пошуку українських та англійських слів за префіксом без урахування регістру"""
+        # Arrange
+        deadline = date.today() + timedelta(days=7)
+        report = Task(title='Звіт для Клієнта', description='Prepare REPORT', deadline=deadline)
+        review = Task(title='Code review', description='Перевірити звіт', deadline=deadline)
+        task_repository.add(report)
+        task_repository.add(review)
+
+        # Act
+        both = task_repository.search('ЗВІ')
+        client = task_repository.search('клієн rep')
+        limited = task_repository.search('звіт', limit=1)
+
+        # Assert
+        assert [task.id for task in both] == [report.id, review.id]
+        assert [task.id for task in client] == [report.id]
+        assert [task.id for task in limited] == [report.id]
+        assert task_repository.search('') == []
+
+    def test_index_follows_update_and_delete(self, task_repository, sample_task):
+        """Тест узгодженості індексу після зміни назви та видалення"""
+        # Arrange
+        task_repository.add(sample_task)
+        assert [task.id for task in task_repository.search('test')] == [sample_task.id]
+
+        # Act
+        sample_task.title = 'Нова назва'
+        sample_task.description = ''
+        task_repository.update(sample_task)
+        renamed = task_repository.search('нова')
+        stale = task_repository.search('test')
+        task_repository.delete(sample_task.id)
+
+        # Assert
+        assert [task.id for task in renamed] == [sample_task.id]
+        assert stale == []
+        assert task_repository.search('нова') == []
+
+    def test_journal_and_sqlite_search(self, journal_data_file, sqlite_task_repository, sample_task):
+        """Тест пошуку в журнальному та SQLite сховищах"""
+        # Arrange
+        store = JournalStore(journal_data_file)
+        repositories = [JournalTaskRepository(store), sqlite_task_repository]
+
+        for repository in repositories:
+            # Act
+            repository.add(sample_task)
+            sample_task.title = 'Оновлене завдання'
+            repository.update(sample_task)
+
+            # Assert
+            assert [task.id for task in repository.search('онов')] == [sample_task.id]
+            assert [task.id for task in repository.search('DESCR')] == [sample_task.id]
+            assert repository.search('test task') == []
+            sample_task.title = 'Test Task'
+        store.close()
+
+
+class TestTaskQuery:
+    """Тести для виконання запитів TaskQuery у сховищах"""
+
+    @staticmethod
+    def _fill(repository):
+        today = date.today()
+        tasks = [
+            Task(title='beta звіт', description='', deadline=today + timedelta(days=5), assignee_id='m1'),
+            Task(title='Alpha звіт', description='', deadline=today + timedelta(days=2), assignee_id='m1'),
+            Task(title='Gamma', description='звітність', deadline=today + timedelta(days=9), assignee_id='m2'),
+            Task(title='Delta', description='', deadline=today + timedelta(days=1)),
+        ]
+        tasks[2].mark_done()
+        for task in tasks:
+            repository.add(task)
+        return [task.title for task in tasks]
+
+    def test_backends_return_same_results(self, task_repository, journal_data_file, sqlite_task_repository):
+        """Тест однакових результатів запитів у JSON, журнальному та SQLite сховищах"""
+        # Arrange
+        store = JournalStore(journal_data_file)
+        today = date.today()
+        queries = [
+            (TaskQuery(), ['beta звіт', 'Alpha звіт', 'Gamma', 'Delta']),
+            (TaskQuery(status='pending', sort_by='deadline'), ['Delta', 'Alpha звіт', 'beta звіт']),
+            (TaskQuery(status='completed'), ['Gamma']),
+            (TaskQuery(assignee_id='m1', sort_by='title'), ['Alpha звіт', 'beta звіт']),
+            (TaskQuery(text='ЗВІТ'), ['beta звіт', 'Alpha звіт', 'Gamma']),
+            (TaskQuery(due_from=today + timedelta(days=2), due_to=today + timedelta(days=9),
+                       sort_by='deadline', descending=True), ['Gamma', 'beta звіт', 'Alpha звіт']),
+            (TaskQuery(status='overdue', as_of=today + timedelta(days=6)), ['beta звіт', 'Alpha звіт', 'Delta']),
+            (TaskQuery(sort_by='title', limit=2, offset=1), ['beta звіт', 'Delta']),
+        ]
+
+        for repository in (task_repository, JournalTaskRepository(store), sqlite_task_repository):
+            self._fill(repository)
+
+            for query, expected in queries:
+                # Act
+                found = repository.find(query)
+
+                # Assert
+                assert [task.title for task in found] == expected
+        store.close()
+
+    def test_apply_filters_sorts_and_pages(self):
+        """Тест виконання запиту перебором послідовності завдань"""
+        # Arrange
+        tasks = [Task(title=title, description='', deadline=date.today() + timedelta(days=1))
+                 for title in ('b', 'a', 'c')]
+
+        # Act
+        found = TaskQuery(sort_by='title', limit=2).apply(tasks)
+
+        # Assert
+        assert [task.title for task in found] == ['a', 'b']
+
+
+class TestPagination:
+    """Тести для посторінкового читання за курсором"""
+
+    @staticmethod
+    def _read_all_pages(repository, **kwargs):
+        pages, after = [], None
+        while True:
+            page = repository.page(after=after, size=2, **kwargs)
+            pages.append([entity.id for entity in page])
+            if page.next_cursor is None:
+                return pages
+            after = page.next_cursor
+
+    def test_pages_follow_deadline_order(self, task_repository, journal_data_file, sqlite_task_repository):
+        """Тест обходу завдань сторінками за дедлайном у всіх сховищах"""
+        # Arrange
+        store = JournalStore(journal_data_file)
+        tasks = [Task(title=f'Task {days}', description='', deadline=date.today() + timedelta(days=days))
+                 for days in (5, 1, 3, 2, 4)]
+        expected = [task.id for task in sorted(tasks, key=lambda task: task.deadline)]
+
+        for repository in (task_repository, JournalTaskRepository(store), sqlite_task_repository):
+            repository.add_many(tasks)
+
+            # Act
+            pages = self._read_all_pages(repository, order_by='deadline')
+
+            # Assert
+            assert pages == [expected[0:2], expected[2:4], expected[4:]]
+        store.close()
+
+    def test_cursor_survives_changes_before_it(self, task_repository):
+        """Тест стабільності курсора після видалення вже прочитаних завдань"""
+        # Arrange
+        tasks = [Task(title=f'Task {days}', description='', deadline=date.today() + timedelta(days=days))
+                 for days in (1, 2, 3, 4)]
+        task_repository.add_many(tasks)
+        first = task_repository.page(size=2)
+
+        # Act
+        task_repository.delete(tasks[0].id)
+        second = task_repository.page(after=first.next_cursor, size=2)
+
+        # Assert
+        assert [task.id for task in second] == [tasks[2].id, tasks[3].id]
+        assert second.next_cursor is None
+
+    def test_member_pages_by_created_date(self, member_repository, sqlite_member_repository):
+        """Тест сторінок членів команди за датою створення"""
+        # Arrange
+        members = [TeamMember(name=f'Member {i}', role='Розробник') for i in range(3)]
+        expected = [member.id for member in sorted(members, key=lambda member: (member.created_date, member.id))]
+
+        for repository in (member_repository, sqlite_member_repository):
+            repository.add_many(members)
+
+            # Act
+            pages = self._read_all_pages(repository)
+
+            # Assert
+            assert pages == [expected[0:2], expected[2:]]
+
+    def test_invalid_arguments(self, member_repository):
+        """Тест відхилення некоректного курсора, порядку та розміру сторінки"""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            member_repository.page(after='not-a-cursor')
+        with pytest.raises(ValueError):
+            member_repository.page(order_by='deadline')
+        with pytest.raises(ValueError):
+            member_repository.page(size=0)
+
+
+class TestUniqueIndexes:
+    """Тести для унікальних індексів назв завдань та імен членів команди"""
+
+    def test_rename_and_delete_free_title(self, task_repository, sample_task):
+        """Тест звільнення назви після перейменування та видалення"""
+        # Arrange
+        task_repository.add(sample_task)
+        duplicate = Task(title='Test Task', description='', deadline=sample_task.deadline)
+        with pytest.raises(DuplicateTaskError):
+            task_repository.add(duplicate)
+
+        # Act
+        sample_task.title = 'Renamed Task'
+        task_repository.update(sample_task)
+        task_repository.add(duplicate)
+
+        # Assert
+        assert task_repository.get_by_title('Test Task').id == duplicate.id
+        assert task_repository.get_by_title('Renamed Task').id == sample_task.id
+        task_repository.delete(duplicate.id)
+        assert task_repository.get_by_title('Test Task') is None
+
+    def test_duplicate_in_bulk_add_rolls_back(self, task_repository, temp_data_file, journal_data_file,
+                                              sqlite_task_repository, sample_task):
+        """Тест відкату масового додавання з повторною назвою в усіх сховищах"""
+        # Arrange
+        store = JournalStore(journal_data_file)
+        existing = Task(title='First', description='', deadline=sample_task.deadline)
+        second = Task(title='Second', description='', deadline=sample_task.deadline)
+        duplicate = Task(title='First', description='', deadline=sample_task.deadline)
+        repositories = (task_repository, JournalTaskRepository(store), sqlite_task_repository)
+
+        for repository in repositories:
+            repository.add(existing)
+
+            # Act
+            with pytest.raises(DuplicateTaskError):
+                repository.add_many([second, duplicate])
+
+            # Assert
+            assert [task.title for task in repository.get_all()] == ['First']
+            assert repository.get_by_title('Second') is None
+        store.close()
+        with open(temp_data_file, 'r', encoding='utf-8') as f:
+            assert [task['title'] for task in json.load(f)['tasks']] == ['First']
+        reopened = JournalStore(journal_data_file)
+        assert [task.title for task in JournalTaskRepository(reopened).get_all()] == ['First']
+        reopened.close()
+
+    def test_all_backends_reject_duplicate_names(self, member_repository, journal_data_file,
+                                                 sqlite_member_repository):
+        """Тест відхилення повторного імені в усіх сховищах"""
+        # Arrange
+        store = JournalStore(journal_data_file)
+        member = TeamMember(name='John Doe', role='Розробник')
+        other = TeamMember(name='Jane Doe', role='Тестувальник')
+
+        for repository in (member_repository, JournalMemberRepository(store), sqlite_member_repository):
+            repository.add(member)
+            repository.add(other)
+
+            # Act
+            other.name = 'John Doe'
+            with pytest.raises(DuplicateMemberError):
+                repository.update(other)
+            other.name = 'Jane Doe'
+
+            # Assert
+            assert repository.get_by_name('John Doe').id == member.id
+            assert repository.get_by_name('Jane Doe').id == other.id
+        store.close()
+
+
+class InMemoryRepository(IRepository):
+    """Мінімальний репозиторій лише з абстрактними методами IRepository"""
+
+    def __init__(self):
+        self._entities = {}
+
+    def get_by_id(self, id):
+        return self._entities.get(id)
+
+    def get_all(self):
+        return list(self._entities.values())
+
+    def add(self, entity):
+        self._entities[entity.id] = entity
+
+    def update(self, entity):
+        self._entities[entity.id] = entity
+
+    def delete(self, id):
+        self._entities.pop(id, None)
+
+    def exists(self, id):
+        return id in self._entities
+
+
+class InMemoryTaskRepository(InMemoryRepository, ITaskRepository):
+    """Репозиторій завдань на типових реалізаціях запитів ITaskRepository"""
+
+
+class InMemoryMemberRepository(InMemoryRepository, IMemberRepository):
+    """Репозиторій членів команди на типових реалізаціях IMemberRepository"""
+
+
+class TestRepositoryDefaults:
+    """Тести для типових реалізацій запитів репозиторіїв завдань та членів команди"""
+
+    def test_task_queries_match_indexed_repository(self, task_repository):
+        """Тест збігу типових запитів із запитами репозиторію з індексами"""
+        # Arrange
+        today = date.today()
+        as_of = today + timedelta(days=3)
+        tasks = [Task(title=f'Report {days}', description='Квартальний звіт', assignee_id='member-1',
+                      deadline=today + timedelta(days=days)) for days in (2, 1, 4, 6)]
+        tasks[0].mark_done()
+        tasks.append(Task(title='Meeting', description='', deadline=today + timedelta(days=2)))
+        repository = InMemoryTaskRepository()
+        for task in tasks:
+            repository.add(task)
+            task_repository.add(task)
+
+        def ids(items):
+            return [task.id for task in items]
+
+        # Act & Assert
+        assert ids(repository.get_by_assignee('member-1')) == ids(task_repository.get_by_assignee('member-1'))
+        assert ids(repository.get_tasks_due_between(today, as_of)) == \
+            ids(task_repository.get_tasks_due_between(today, as_of))
+        assert ids(repository.get_overdue_tasks(as_of)) == ids(task_repository.get_overdue_tasks(as_of))
+        assert repository.get_stats(as_of) == task_repository.get_stats(as_of)
+        assert ids(repository.search('звіт', limit=2)) == ids(task_repository.search('звіт', limit=2))
+        assert repository.get_by_title('Meeting').id == tasks[-1].id
+        assert repository.get_by_title('Missing') is None
+
+    def test_get_by_name(self):
+        """Тест пошуку члена команди за ім'ям перебором"""
+        # Arrange
+        repository = InMemoryMemberRepository()
+        member = TeamMember(name='John Doe', role='Розробник')
+        repository.add(member)
+
+        # Act & Assert
+        assert repository.get_by_name('John Doe') is member
+        assert repository.get_by_name('Jane Doe') is None
+
+    def test_queries_belong_to_their_entity(self):
+        """Тест розділення запитів між інтерфейсами завдань та членів команди"""
+        # Assert
+        for name in ('find', 'get_by_assignee', 'get_stats', 'search', 'get_by_title', 'get_by_name'):
+            assert not hasattr(IRepository, name)
+        assert not hasattr(IMemberRepository, 'get_by_assignee')
+        assert not hasattr(ITaskRepository, 'get_by_name')
+        assert issubclass(TaskRepository, ITaskRepository)
+        assert issubclass(SqliteMemberRepository, IMemberRepository)
+
+
+class TestBulkOperations:
+    """Тести для пакетних операцій репозиторіїв"""
+
+    def test_bulk_operations_rewrite_file_once(self, task_repository):
+        """Тест одного запису файлу на кожну пакетну операцію"""
+        # Arrange
+        tasks = [Task(title=f'Task {i}', description='', deadline=date.today() + timedelta(days=1))
+                 for i in range(5)]
+
+        # Act
+        with patch('task_planner.dal.repositories.data_store.os.replace', wraps=os.replace) as mock_replace:
+            task_repository.add_many(tasks)
+            for task in tasks:
+                task.mark_done()
+            task_repository.update_many(tasks[:3])
+            task_repository.delete_many([task.id for task in tasks[3:]])
+
+        # Assert
+        assert mock_replace.call_count == 3
+        stored = task_repository.get_all()
+        assert [task.id for task in stored] == [task.id for task in tasks[:3]]
+        assert all(task.is_completed for task in stored)
+
+    def test_default_bulk_operations(self, sqlite_task_repository, sqlite_member_repository):
+        """Тест пакетних операцій із реалізацією за замовчуванням"""
+        # Arrange
+        members = [TeamMember(name=f'Member {i}', role='Розробник') for i in range(3)]
+
+        # Act
+        sqlite_member_repository.add_many(members)
+        sqlite_member_repository.delete_many([members[0].id, members[1].id])
+
+        # Assert
+        assert [member.id for member in sqlite_member_repository.get_all()] == [members[2].id]
+
+
+class TestStreamingReader:
+    """Тести для потокового читання файлу даних"""
+
+    def test_iter_section_across_chunk_boundaries(self, temp_data_file):
+        """Тест розбору записів, що перетинають межі порцій"""
+        # Arrange
+        tasks = [{'id': f'task-{i}', 'title': f'Завдання {i}', 'priority': i * 1000} for i in range(50)]
+        members = [{'id': 'member-1', 'name': 'John Doe'}]
+        with open(temp_data_file, 'w', encoding='utf-8') as f:
+            json.dump({"version": 12345, "tasks": tasks, "members": members}, f, ensure_ascii=False, indent=2)
+
+        # Act
+        streamed_tasks = list(iter_section(temp_data_file, 'tasks', chunk_size=7))
+        streamed_members = list(iter_section(temp_data_file, 'members', chunk_size=7))
+
+        # Assert
+        assert streamed_tasks == tasks
+        assert streamed_members == members
+        assert list(iter_section(temp_data_file, 'missing', chunk_size=7)) == []
+
+    def test_iter_all_streams_without_filling_store(self, temp_data_file, store, task_repository, sample_task):
+        """Тест потокового читання без завантаження документа в сховище"""
+        # Arrange
+        with open(temp_data_file, 'w', encoding='utf-8') as f:
+            json.dump({"tasks": [sample_task.to_dict()], "members": []}, f)
+        misses = store.misses
+
+        # Act
+        tasks = list(task_repository.iter_all())
+
+        # Assert
+        assert [task.id for task in tasks] == [sample_task.id]
+        assert store.misses == misses
+        assert store.stats()['sections'] == 0
+
+
+@pytest.fixture
+def journal_data_file(tmp_path):
+    return str(tmp_path / 'data.json')
+
+
+class TestJournalStore:
+    """Тести для сховища з журналом змін"""
+
+    def test_state_is_replayed_on_reopen(self, journal_data_file, sample_task):
+        """Тест відновлення стану зі знімка та журналу"""
+        # Arrange
+        store = JournalStore(journal_data_file)
+        tasks = JournalTaskRepository(store)
+        members = JournalMemberRepository(store)
+        member = TeamMember(name='John Doe', role='Розробник')
+        tasks.add(sample_task)
+        members.add(member)
+        sample_task.mark_done()
+        tasks.update(sample_task)
+        members.delete(member.id)
+        store.close()
+
+        # Act
+        reopened = JournalStore(journal_data_file)
+
+        # Assert
+        assert JournalTaskRepository(reopened).get_by_id(sample_task.id).is_completed is True
+        assert JournalMemberRepository(reopened).get_all() == []
+        reopened.close()
+
+    def test_compaction_moves_journal_into_snapshot(self, journal_data_file, sample_task):
+        """Тест ущільнення журналу після перевищення порогу"""
+        # Arrange
+        store = JournalStore(journal_data_file, compaction_threshold=1)
+        tasks = JournalTaskRepository(store)
+
+        # Act
+        tasks.add(sample_task)
+        store.close()
+
+        # Assert
+        with open(journal_data_file, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+        assert [task['id'] for task in snapshot['tasks']] == [sample_task.id]
+        assert os.path.getsize(store.journal_file) == 0
+        assert store.compaction_error is None
+
+    def test_truncated_record_is_ignored(self, journal_data_file, sample_task):
+        """Тест ігнорування обірваного запису журналу"""
+        # Arrange
+        store = JournalStore(journal_data_file)
+        JournalTaskRepository(store).add(sample_task)
+        store.close()
+        with open(store.journal_file, 'a', encoding='utf-8') as f:
+            f.write('{"op": "delete", "sect')
+
+        # Act
+        reopened = JournalStore(journal_data_file)
+        second_task = Task(title='Second Task', description='',
+                           deadline=date.today() + timedelta(days=3))
+        JournalTaskRepository(reopened).add(second_task)
+        reopened.close()
+
+        # Assert
+        tasks = JournalTaskRepository(JournalStore(journal_data_file))
+        assert tasks.exists(sample_task.id) is True
+        assert tasks.exists(second_task.id) is True
+
+
+@pytest.fixture
+def sqlite_database(tmp_path):
+    database = SqliteDatabase(str(tmp_path / 'data.db'))
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def sqlite_task_repository(sqlite_database):
+    return SqliteTaskRepository(sqlite_database)
+
+
+@pytest.fixture
+def sqlite_member_repository(sqlite_database):
+    return SqliteMemberRepository(sqlite_database)
+
+
+class TestSqliteRepositories:
+    """Тести для SQLite-репозиторіїв"""
+
+    def test_task_round_trip(self, sqlite_task_repository, sample_task):
+        """Тест збереження, оновлення та видалення завдання"""
+        # Arrange
+        sqlite_task_repository.add(sample_task)
+
+        # Act
+        sample_task.mark_done()
+        sqlite_task_repository.update(sample_task)
+        stored = sqlite_task_repository.get_by_id(sample_task.id)
+
+        # Assert
+        assert stored.title == sample_task.title
+        assert stored.deadline == sample_task.deadline
+        assert stored.is_completed is True
+        sqlite_task_repository.delete(sample_task.id)
+        assert sqlite_task_repository.exists(sample_task.id) is False
+
+    def test_unique_title_raises_duplicate_error(self, sqlite_task_repository, sample_task):
+        """Тест унікального індексу назви завдання"""
+        # Arrange
+        sqlite_task_repository.add(sample_task)
+        duplicate = Task(title=sample_task.title, description='',
+                         deadline=date.today() + timedelta(days=1))
+
+        # Act & Assert
+        with pytest.raises(DuplicateTaskError):
+            sqlite_task_repository.add(duplicate)
+
+    def test_assignee_lookup_uses_index(self, sqlite_database):
+        """Тест використання індексу за виконавцем"""
+        # Act
+        plan = sqlite_database.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM tasks WHERE assignee_id = ?", ('member-1',)).fetchall()
+
+        # Assert
+        assert any('idx_tasks_assignee_id' in row['detail'] for row in plan)
+
+    def test_stats_counters_follow_changes(self, tmp_path, sample_task):
+        """Тест лічильників завдань, що підтримуються тригерами, та їх підрахунку для старої бази"""
+        # Arrange
+        db_file = str(tmp_path / 'stats.db')
+        database = SqliteDatabase(db_file)
+        repository = SqliteTaskRepository(database)
+        other = Task(title='Other Task', description='', deadline=sample_task.deadline)
+        week_later = date.today() + timedelta(days=8)
+
+        # Act
+        repository.add_many([sample_task, other])
+        repository.add(sample_task)
+        other.mark_done()
+        repository.update(other)
+        database.connection.execute("DROP TABLE task_counters")
+        database.connection.commit()
+        database.close()
+        reopened = SqliteDatabase(db_file)
+
+        # Assert
+        expected = {'total': 2, 'completed': 1, 'pending': 1, 'overdue': 1}
+        assert SqliteTaskRepository(reopened).get_stats(week_later) == expected
+        SqliteTaskRepository(reopened).delete(other.id)
+        assert SqliteTaskRepository(reopened).get_stats(week_later) == {
+            'total': 1, 'completed': 0, 'pending': 1, 'overdue': 1}
+        reopened.close()
+
+    def test_services_work_over_sqlite(self, sqlite_task_repository, sqlite_member_repository, sample_task):
+        """Тест роботи сервісу завдань поверх SQLite"""
+        # Arrange
+        service = TaskService(sqlite_task_repository, sqlite_member_repository)
+        member = TeamMember(name='John Doe', role='Розробник')
+        sqlite_member_repository.add(member)
+
+        # Act
+        task = service.create_task('Test Task', 'Test Description', sample_task.deadline, member.id)
+
+        # Assert
+        assert sqlite_member_repository.get_by_id(member.id).task_ids == [task.id]
+
+    def test_migrate_json_to_sqlite(self, temp_data_file, sqlite_database, sample_task):
+        """Тест одноразового перенесення даних з data.json"""
+        # Arrange
+        member = TeamMember(name='John Doe', role='Розробник', task_ids=[sample_task.id])
+        with open(temp_data_file, 'w', encoding='utf-8') as f:
+            json.dump({"tasks": [sample_task.to_dict()], "members": [member.to_dict()]}, f)
+
+        # Act
+        migrated = migrate_json_to_sqlite(temp_data_file, sqlite_database)
+        migrated_again = migrate_json_to_sqlite(temp_data_file, sqlite_database)
+
+        # Assert
+        assert migrated == 2
+        assert migrated_again == 0
+        assert SqliteTaskRepository(sqlite_database).get_by_id(sample_task.id).title == sample_task.title
+        assert SqliteMemberRepository(sqlite_database).get_by_id(member.id).task_ids == [sample_task.id]
+
+    def test_migration_does_not_restore_deleted_entities(self, temp_data_file, sqlite_database, sample_task):
+        """Тест відсутності повторного перенесення після видалення всіх записів"""
+        # Arrange
+        member = TeamMember(name='John Doe', role='Розробник')
+        with open(temp_data_file, 'w', encoding='utf-8') as f:
+            json.dump({"tasks": [sample_task.to_dict()], "members": [member.to_dict()]}, f)
+        tasks = SqliteTaskRepository(sqlite_database)
+        members = SqliteMemberRepository(sqlite_database)
+        migrate_json_to_sqlite(temp_data_file, sqlite_database)
+        tasks.delete(sample_task.id)
+        members.delete(member.id)
+
+        # Act
+        migrated_again = migrate_json_to_sqlite(temp_data_file, sqlite_database)
+
+        # Assert
+        assert migrated_again == 0
+        assert tasks.get_all() == []
+        assert members.get_all() == []
+
+
+class TestDeltaPersistence:
+    """Тести для запису лише змінених полів"""
+
+    def test_unchanged_entity_is_not_written(self, task_repository, sample_task):
+        """Тест пропуску запису файлу для сутності без змін"""
+        # Arrange
+        task_repository.add(sample_task)
+        loaded = task_repository.get_by_id(sample_task.id)
+
+        # Act
+        with patch('task_planner.dal.repositories.data_store.os.replace', wraps=os.replace) as mock_replace:
+            task_repository.update(loaded)
+            task_repository.update_many([loaded])
+
+        # Assert
+        assert mock_replace.call_count == 0
+
+    def test_journal_appends_patch_record(self, journal_data_file, sample_task):
+        """Тест запису в журнал лише змінених полів"""
+        # Arrange
+        store = JournalStore(journal_data_file)
+        tasks = JournalTaskRepository(store)
+        tasks.add(sample_task)
+        loaded = tasks.get_by_id(sample_task.id)
+
+        # Act
+        loaded.mark_done()
+        tasks.update(loaded)
+        tasks.update(loaded)
+        store.close()
+
+        # Assert
+        with open(store.journal_file, 'r', encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        assert [record['op'] for record in records] == ['put', 'patch']
+        assert set(records[1]['data']) == {'is_completed', 'updated_date'}
+        reopened = JournalTaskRepository(JournalStore(journal_data_file)).get_by_id(sample_task.id)
+        assert reopened.is_completed is True
+        assert reopened.title == sample_task.title
+
+    def test_sqlite_updates_only_changed_columns(self, sqlite_task_repository, sqlite_database, sample_task):
+        """Тест UPDATE лише змінених стовпців"""
+        # Arrange
+        sqlite_task_repository.add(sample_task)
+        loaded = sqlite_task_repository.get_by_id(sample_task.id)
+        # Зміна іншого поля в обхід моделі не перезаписується
+        with sqlite_database.transaction() as connection:
+            connection.execute("UPDATE tasks SET description = 'Changed elsewhere' WHERE id = ?", (sample_task.id,))
+
+        # Act
+        loaded.mark_done()
+        sqlite_task_repository.update(loaded)
+
+        # Assert
+        stored = sqlite_task_repository.get_by_id(sample_task.id)
+        assert stored.is_completed is True
+        assert stored.description == 'Changed elsewhere'
+
+
+class TestConcurrentAccess:
+    """Тести одночасного читання та запису репозиторіїв з різних потоків"""
+
+    def test_reads_during_writes(self, task_repository, journal_data_file):
+        """Тест читання з індексів під час додавання завдань в іншому потоці"""
+        # Arrange
+        store = JournalStore(journal_data_file)
+        deadline = date.today() + timedelta(days=1)
+        errors = []
+
+        for repository in (task_repository, JournalTaskRepository(store)):
+            done = threading.Event()
+
+            def write():
+                try:
+                    for i in range(150):
+                        repository.add(Task(title=f'Task {i}', description='', deadline=deadline,
+                                            assignee_id=f'member-{i % 3}'))
+                finally:
+                    done.set()
+
+            def read():
+                try:
+                    while not done.is_set():
+                        repository.find(TaskQuery(status='pending', sort_by='deadline'))
+                        repository.get_by_assignee('member-1')
+                        repository.get_all()
+                except Exception as e:
+                    errors.append(e)
+
+            readers = [threading.Thread(target=read) for _ in range(3)]
+            writer = threading.Thread(target=write)
+
+            # Act
+            for thread in readers + [writer]:
+                thread.start()
+            for thread in readers + [writer]:
+                thread.join()
+
+            # Assert
+            assert errors == []
+            assert len(repository.get_all()) == 150
+            assert len(repository.get_by_assignee('member-1')) == 50
+        store.close()
+
+
+class TestImports:
+    """Тести імпорту шару доступу до даних"""
+
+    def test_dal_imports_in_fresh_interpreter(self):
+        """Тест імпорту пакета dal та його модулів без попереднього імпорту bll"""
+        # Arrange
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        modules = ('task_planner.dal', 'task_planner.dal.repositories.task_repository',
+                   'task_planner.dal.repositories.journal_repository',
+                   'task_planner.dal.repositories.sqlite_repository')
+
+        for module in modules:
+            # Act
+            result = subprocess.run([sys.executable, '-c', f'import {module}'],
+                                    cwd=root, capture_output=True, text=True)
+
+            # Assert
+            assert result.returncode == 0, result.stderr
@@ -6,12 +6,14 @@ import json
 import os
 from datetime import date, timedelta
 from task_planner.bll.models.task import Task
+from task_planner.bll.models.task_query import TaskQuery
 from task_planner.bll.models.team_member import TeamMember
 from task_planner.dal.repositories.task_repository import TaskRepository
 from task_planner.dal.repositories.member_repository import MemberRepository
 from task_planner.bll.services.task_service import TaskService
 from task_planner.bll.services.member_service import MemberService
 from task_planner.bll.services.project_manager import ProjectManager
+from task_planner.bll.clock import FixedClock
 from task_planner.bll.exceptions import (
     TaskNotFoundError, MemberNotFoundError,
     DuplicateTaskError, DuplicateMemberError
@@ -117,6 +119,21 @@ class TestTaskService:
         # Assert
         assert task.assignee_id == member.id
 
+    def test_duplicate_title_leaves_assignee_unchanged(self, task_service, member_service,
+                                                       sample_task_data, sample_member_data):
+        """Тест скасування всієї операції створення завдання з повторною назвою"""
+        # Arrange
+        member = member_service.create_member(**sample_member_data)
+        task_service.create_task(**sample_task_data)
+
+        # Act
+        with pytest.raises(DuplicateTaskError):
+            task_service.create_task(assignee_id=member.id, **sample_task_data)
+
+        # Assert
+        assert member_service.get_member(member.id).task_ids == []
+        assert len(task_service.get_all_tasks()) == 1
+
     def test_create_task_with_invalid_assignee_raises_error(self, task_service, sample_task_data):
         """Тест створення завдання з неіснуючим виконавцем"""
         # Arrange
@@ -131,6 +148,35 @@ class TestTaskService:
                 assignee_id=invalid_assignee_id
             )
 
+    def test_create_task_with_assignee_writes_file_once(self, task_service, member_service,
+                                                        sample_task_data, sample_member_data):
+        """Тест одного запису файлу при створенні завдання з виконавцем"""
+        # Arrange
+        member = member_service.create_member(**sample_member_data)
+
+        # Act
+        with patch('task_planner.dal.repositories.data_store.os.replace', wraps=os.replace) as mock_replace:
+            task = task_service.create_task(assignee_id=member.id, **sample_task_data)
+
+        # Assert
+        assert mock_replace.call_count == 1
+        assert member_service.get_member(member.id).task_ids == [task.id]
+
+    def test_update_task_assignee_to_missing_member_keeps_state(self, task_service, member_service,
+                                                                sample_task_data, sample_member_data):
+        """Тест відсутності часткових змін при помилці перепризначення"""
+        # Arrange
+        member = member_service.create_member(**sample_member_data)
+        task = task_service.create_task(assignee_id=member.id, **sample_task_data)
+
+        # Act
+        with pytest.raises(MemberNotFoundError):
+            task_service.update_task_assignee(task.id, "non-existent-id")
+
+        # Assert
+        assert member_service.get_member(member.id).task_ids == [task.id]
+        assert task_service.get_task(task.id).assignee_id == member.id
+
     def test_get_task_success(self, task_service, sample_task_data):
         """Тест успішного отримання завдання за ID"""
         # Arrange
@@ -209,26 +255,122 @@ class TestTaskService:
     def test_get_overdue_tasks(self, task_service, sample_task_data):
         """Тест отримання прострочених завдань"""
         # Arrange
-        # Створюємо мок для завдань
-        normal_task = Mock(spec=Task)
-        normal_task.is_overdue.return_value = False
-
         overdue_task = Mock(spec=Task)
-        overdue_task.is_overdue.return_value = True
 
         # Мокаємо репозиторій, щоб повернути наші тестові завдання
-        with patch.object(task_service._task_repository, 'get_all') as mock_get_all:
-            mock_get_all.return_value = [normal_task, overdue_task]
+        with patch.object(task_service._task_repository, 'get_overdue_tasks') as mock_get_overdue:
+            mock_get_overdue.return_value = [overdue_task]
 
             # Act
             overdue_tasks = task_service.get_overdue_tasks()
 
             # Assert
-            assert len(overdue_tasks) == 1
-            assert overdue_tasks[0] == overdue_task
-            # Перевіряємо, що викликався метод is_overdue для кожного завдання
-            normal_task.is_overdue.assert_called_once()
-            overdue_task.is_overdue.assert_called_once()
+            assert overdue_tasks == [overdue_task]
+            # Перевіряємо, що запит виконується за індексом на сьогоднішню дату
+            mock_get_overdue.assert_called_once_with(date.today())
+
+    def test_get_overdue_tasks_as_of(self, task_service, sample_task_data):
+        """Тест отримання прострочених завдань на задану дату"""
+        # Arrange
+        overdue_task = task_service.create_task(**sample_task_data)
+        completed_data = sample_task_data.copy()
+        completed_data['title'] = 'Completed Task'
+        completed_task = task_service.create_task(**completed_data)
+        task_service.mark_task_done(completed_task.id)
+
+        # Act
+        overdue_tasks = task_service.get_overdue_tasks(sample_task_data['deadline'] + timedelta(days=1))
+
+        # Assert
+        assert [task.id for task in overdue_tasks] == [overdue_task.id]
+        assert task_service.get_overdue_tasks() == []
+
+    def test_search(self, task_service, sample_task_data):
+        """Тест пошуку завдань за словами назви та опису"""
+        # Arrange
+        task = task_service.create_task(**sample_task_data)
+        other_data = sample_task_data.copy()
+        other_data['title'] = 'Інше завдання'
+        task_service.create_task(**other_data)
+
+        # Act
+        found = task_service.search(sample_task_data['title'].upper(), limit=10)
+
+        # Assert
+        assert [t.id for t in found] == [task.id]
+
+    def test_find_tasks(self, task_service, sample_task_data):
+        """Тест отримання завдань за специфікацією запиту"""
+        # Arrange
+        task_service.create_task(**sample_task_data)
+        later_data = sample_task_data.copy()
+        later_data['title'] = 'Later Task'
+        later_data['deadline'] = sample_task_data['deadline'] + timedelta(days=1)
+        later_task = task_service.create_task(**later_data)
+
+        # Act
+        found = task_service.find_tasks(TaskQuery(status='pending', sort_by='deadline', descending=True, limit=1))
+
+        # Assert
+        assert [task.id for task in found] == [later_task.id]
+
+    def test_find_tasks_with_assignees_loads_members_once(self, task_service, member_service,
+                                                         member_repository, sample_task_data, sample_member_data):
+        """Тест отримання завдань з іменами виконавців одним пакетним читанням"""
+        # Arrange
+        member = member_service.create_member(**sample_member_data)
+        for i in range(3):
+            task_service.create_task(f"Task {i}", "", sample_task_data['deadline'], member.id)
+        task_service.create_task("Unassigned", "", sample_task_data['deadline'])
+
+        # Act
+        with patch.object(member_repository, 'get_by_id', wraps=member_repository.get_by_id) as mock_get:
+            rows = task_service.find_tasks_with_assignees(TaskQuery())
+
+        # Assert
+        assert [name for _, name in rows] == [member.name] * 3 + [None]
+        assert mock_get.call_count == 0
+
+    def test_find_tasks_rejects_unknown_status(self, task_service):
+        """Тест відхилення невідомого статусу в запиті"""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            task_service.find_tasks(TaskQuery(status='archived'))
+
+    def test_overdue_uses_service_clock(self, task_repository, member_repository, sample_task_data):
+        """Тест визначення прострочених завдань за годинником сервісу"""
+        # Arrange
+        clock = FixedClock(date.today())
+        task_service = TaskService(task_repository, member_repository, clock=clock)
+        task = task_service.create_task(**sample_task_data)
+
+        # Act
+        clock.day = sample_task_data['deadline'] + timedelta(days=1)
+
+        # Assert
+        assert [t.id for t in task_service.get_overdue_tasks()] == [task.id]
+        assert [t.id for t in task_service.iter_overdue_tasks()] == [task.id]
+        assert task_service.get_task_stats()['overdue'] == 1
+        assert task_service.today() == clock.day
+
+    def test_queries_and_table_use_service_clock(self, task_repository, member_repository, sample_task_data):
+        """Тест однакової дати годинника для запитів, таблиці та лічильників"""
+        # Arrange
+        clock = FixedClock(date.today())
+        task_service = TaskService(task_repository, member_repository, clock=clock)
+        task = task_service.create_task(**sample_task_data)
+        clock.day = sample_task_data['deadline'] + timedelta(days=30)
+
+        # Act
+        overdue = task_service.find_tasks(TaskQuery(status='overdue'))
+        rows = task_service.find_tasks_with_assignees(TaskQuery(status='overdue'))
+        table = task_service.get_task_table()
+
+        # Assert
+        assert [t.id for t in overdue] == [task.id]
+        assert [t.id for t, _ in rows] == [task.id]
+        assert table.overdue_count() == task_service.get_task_stats()['overdue'] == 1
+        assert [t.id for t in task_service.get_pending_tasks()] == [task.id]
 
     def test_get_completed_tasks(self, task_service, sample_task_data):
         """Тест отримання виконаних завдань"""
@@ -264,6 +406,24 @@ class TestTaskService:
         assert len(pending_tasks) == 1
         assert pending_tasks[0].id == pending_task.id
 
+    def test_iter_pending_and_completed_tasks(self, task_service, sample_task_data):
+        """Тест потокових фільтрів завдань за статусом"""
+        # Arrange
+        pending_task = task_service.create_task(**sample_task_data)
+        completed_data = sample_task_data.copy()
+        completed_data['title'] = 'Completed Task'
+        completed_task = task_service.create_task(**completed_data)
+        task_service.mark_task_done(completed_task.id)
+
+        # Act
+        pending_ids = [task.id for task in task_service.iter_pending_tasks()]
+        completed_ids = [task.id for task in task_service.iter_completed_tasks()]
+
+        # Assert
+        assert pending_ids == [pending_task.id]
+        assert completed_ids == [completed_task.id]
+        assert list(task_service.iter_overdue_tasks()) == []
+
 
 class TestMemberService:
     """Тести для MemberService"""
@@ -291,6 +451,17 @@ class TestMemberService:
         with pytest.raises(DuplicateMemberError):
             member_service.create_member(**sample_member_data)
 
+    def test_update_member_to_taken_name_raises_error(self, member_service, sample_member_data):
+        """Тест помилки при перейменуванні на ім'я іншого члена команди"""
+        # Arrange
+        member_service.create_member(**sample_member_data)
+        other = member_service.create_member(name='Jane Doe', role='Тестувальник')
+
+        # Act & Assert
+        with pytest.raises(DuplicateMemberError):
+            member_service.update_member(other.id, sample_member_data['name'], 'Тестувальник')
+        assert member_service.find_member_by_name('Jane Doe').id == other.id
+
     def test_get_member_success(self, member_service, sample_member_data):
         """Тест успішного отримання члена команди за ID"""
         # Arrange
@@ -356,6 +527,39 @@ class TestMemberService:
         with pytest.raises(MemberNotFoundError):
             member_service.get_member(member.id)
 
+    def test_delete_member_removes_tasks_in_one_write(self, member_service, task_service,
+                                                      sample_member_data, sample_task_data):
+        """Тест каскадного видалення завдань члена команди одним записом"""
+        # Arrange
+        member = member_service.create_member(**sample_member_data)
+        for i in range(3):
+            task_data = sample_task_data.copy()
+            task_data['title'] = f"Task {i}"
+            task_service.create_task(assignee_id=member.id, **task_data)
+
+        # Act
+        with patch('task_planner.dal.repositories.data_store.os.replace', wraps=os.replace) as mock_replace:
+            member_service.delete_member(member.id)
+
+        # Assert
+        assert mock_replace.call_count == 1
+        assert task_service.get_all_tasks() == []
+
+    def test_get_member_tasks_by_assignee(self, member_service, task_service, sample_member_data, sample_task_data):
+        """Тест отримання завдань члена команди після перепризначення"""
+        # Arrange
+        member = member_service.create_member(**sample_member_data)
+        other = member_service.create_member(name='Jane Doe', role='Тестувальник')
+        task = task_service.create_task(assignee_id=member.id, **sample_task_data)
+
+        # Act
+        task_service.update_task_assignee(task.id, other.id)
+
+        # Assert
+        assert member_service.get_member_tasks(member.id) == []
+        assert [t.id for t in member_service.get_member_tasks(other.id)] == [task.id]
+        assert [t.id for t in task_service.get_tasks_by_assignee(other.id)] == [task.id]
+
     def test_get_member_workload(self, member_service, task_service, sample_member_data, sample_task_data):
         """Тест отримання навантаження члена команди"""
         # Arrange
@@ -401,6 +605,54 @@ class TestProjectManager:
         # Assert
         assert progress == 50.0  # 1 з 2 завдань виконано
 
+    def test_get_project_stats(self, project_manager, sample_task_data):
+        """Тест лічильників проекту після змін завдань"""
+        # Arrange
+        task1 = project_manager.add_task(**sample_task_data)
+        task2_data = sample_task_data.copy()
+        task2_data['title'] = 'Completed Task'
+        task2 = project_manager.add_task(**task2_data)
+
+        # Act
+        project_manager.mark_task_done(task2.id)
+        project_manager.delete_task(task1.id)
+        stats = project_manager.get_project_stats()
+
+        # Assert
+        assert stats == {'total': 1, 'completed': 1, 'pending': 0, 'overdue': 0}
+
+    def test_get_tasks_page(self, project_manager, sample_task_data):
+        """Тест отримання першої сторінки завдань за курсором"""
+        # Arrange
+        created = []
+        for i in range(3):
+            task_data = sample_task_data.copy()
+            task_data['title'] = f"Task {i}"
+            task_data['deadline'] = sample_task_data['deadline'] + timedelta(days=2 - i)
+            created.append(project_manager.add_task(**task_data))
+
+        # Act
+        first = project_manager.get_tasks_page(size=2)
+        rest = project_manager.get_tasks_page(after=first.next_cursor, size=2)
+
+        # Assert
+        assert [task.id for task in first] == [created[2].id, created[1].id]
+        assert [task.id for task in rest] == [created[0].id]
+        assert rest.next_cursor is None
+
+    def test_get_task_table(self, project_manager, sample_task_data):
+        """Тест побудови стовпчикової таблиці з репозиторію"""
+        # Arrange
+        task = project_manager.add_task(**sample_task_data)
+        project_manager.mark_task_done(task.id)
+
+        # Act
+        table = project_manager.get_task_table()
+
+        # Assert
+        assert len(table) == 1
+        assert table.progress() == project_manager.get_project_progress()
+
     def test_find_member_by_name(self, project_manager, sample_member_data):
         """Тест пошуку члена команди за іменем"""
         # Arrange